@@ -1,24 +1,80 @@
+import functools
+import json
+import math
+import os
 import re
 import subprocess
+import sys
+import time
+from graphlib import TopologicalSorter
 from pathlib import Path
 from typing import Any, Iterable, Union
 
 import click
 import yaml
-from kubernetes import config
-from kubernetes.dynamic import DynamicClient
 from jinja2 import Environment, FileSystemLoader
-from kedro.framework.cli.utils import CONTEXT_SETTINGS
+from kedro.framework.cli.utils import CONTEXT_SETTINGS, _split_params
 from kedro.framework.project import settings
 from kedro.framework.session import KedroSession
 from kedro.framework.startup import bootstrap_project
 from kedro.utils import find_kedro_project, is_kedro_project
-from kedro.framework.cli.project import TAG_ARG_HELP
+from kedro.framework.cli.project import PARAMS_ARG_HELP, TAG_ARG_HELP
 from kedro.framework.project import pipelines as kedro_pipelines
 from kedro.pipeline import Pipeline
+from argo_kedro.runners.boundary import BOUNDARY_PATH_ENV_VAR, get_unregistered_boundary_datasets
 from argo_kedro.runners.fuse_runner import FusedRunner
-from argo_kedro.framework.hooks.argo_hook import MachineType, TemplateConfig
+from argo_kedro.runners.read_cache import ReadCache
+from argo_kedro.runners.resources import THREAD_ENV_VARS, get_available_cpus
+from argo_kedro.framework.hooks.argo_hook import ArgoConfig, ConcurrencyConfig, DeadlinesConfig, EscalationConfig, MachineType, PreemptibleConfig, ReadCacheConfig, TemplateConfig
 from argo_kedro.pipeline.node import Node
+from argo_kedro.pipeline.partitioned_node import PartitionedNode, partition_keys
+from argo_kedro.framework.metadata import MetadataConfig, get_dataset_stats, get_metadata_store, get_node_stats
+from argo_kedro.framework.tracing import CatalogTracingHooks, get_tracer
+from argo_kedro.framework.cli.compile import get_cache_key, load_argo_config, load_cached_tasks, save_cached_tasks
+from argo_kedro.framework.cli.conf import (
+    BUILD_STATE_PATH,
+    CONF_ARCHIVE,
+    CONF_MOUNT_PATH,
+    MAX_ARCHIVE_SIZE,
+    get_conf_config_map_name,
+    get_source_hash,
+    is_image_current,
+    package_conf,
+    record_image,
+)
+from argo_kedro.framework.cli.history import (
+    get_median_durations,
+    LADDER_PARAMETER,
+    load_durations,
+    load_escalations,
+    percentile,
+    record_durations,
+    record_escalations,
+)
+from argo_kedro.framework.cli.preflight import get_external_inputs, run_preflight
+from argo_kedro.framework.cli.pool import TaskQueue, Worker, create_queue_server, run_assignment
+from argo_kedro.framework.cli.report import (
+    PHASES,
+    aggregate_timings,
+    get_workflow_runs,
+    get_workflow_timings,
+    list_workflow_pods,
+    write_report,
+)
+from argo_kedro.framework.cli.simulate import LocalSimulator, get_simulated_tasks, load_pipeline_tasks
+from argo_kedro.framework.cli.speculation import SPECULATE_ENV_VAR, run_speculative
+from argo_kedro.framework.cli.workflow import (
+    add_workflow_owner,
+    apply_config_map,
+    get_duration,
+    get_image_digests,
+    get_resume_workflow,
+    get_task_nodes,
+    load_workflow,
+    pin_image,
+    submit_workflow,
+    watch_workflow,
+)
 
 ARGO_TEMPLATES_DIR_PATH = Path(__file__).parent.parent.parent / "templates"
 
@@ -43,15 +99,30 @@ def render_jinja_template(
         A string containing the rendered template with replaced tags.
     """
     src = Path(src)
-    template_loader = FileSystemLoader(searchpath=src.parent.as_posix())
-    template_env = Environment(
-        loader=template_loader,
+    template_env = get_jinja_environment(src.parent.as_posix(), trim_blocks, lstrip_blocks, keep_trailing_newline)
+    template = template_env.get_template(src.name)
+    return template.render(**kwargs)
+
+
+@functools.cache
+def get_jinja_environment(
+    searchpath: str,
+    trim_blocks: bool = False,
+    lstrip_blocks: bool = False,
+    keep_trailing_newline: bool = True,
+) -> Environment:
+    """Function to retrieve the Jinja2 environment of a template directory.
+
+    The environment is created once per process, such that templates are only compiled
+    once, i.e., rendering is not dominated by compiling the template. Templates are
+    recompiled once they changed on disk.
+    """
+    return Environment(
+        loader=FileSystemLoader(searchpath=searchpath),
         trim_blocks=trim_blocks,
         lstrip_blocks=lstrip_blocks,
         keep_trailing_newline=keep_trailing_newline,
     )
-    template = template_env.get_template(src.name)
-    return template.render(**kwargs)
 
 
 def write_jinja_template(
@@ -106,10 +177,10 @@ def cli():
     pass
 
 @cli.command(name="run")
-@click.option("--pipeline", "-p", type=str, default="__default__", help="Name of the pipeline to execute")
+@click.option("--pipeline", "-p", type=str, default="__default__", help="Name of the pipeline to execute, or comma-separated names to run their union")
 @click.option("--env", "-e", type=str, default=None, help="Kedro environment to run the pipeline in")
 @click.option("--config", "-c", type=str, multiple=True, help="Extra config to pass to KedroContext")
-@click.option("--params", type=str, multiple=True, help="Override parameters")
+@click.option("--params", type=click.UNPROCESSED, default="", help=PARAMS_ARG_HELP, callback=_split_params)
 @click.option("--tags", "-t", type=str, multiple=True, help=TAG_ARG_HELP)
 @click.option("--nodes", "-n", type=str, multiple=True, help="Run only nodes with specified names")
 @click.option("--to-nodes", type=str, multiple=True, help="Run a sub-pipeline up to certain nodes")
@@ -118,13 +189,14 @@ def cli():
 @click.option("--to-outputs", type=str, multiple=True, help="Run a sub-pipeline up to nodes that produce these outputs")
 @click.option("--load-version", type=str, multiple=True, help="Specify a particular dataset version")
 @click.option("--namespaces", type=str, multiple=True, help="Namespaces of the pipeline")
+@click.option("--conf-source", type=str, default=None, help="Path of a directory or compressed archive to load configuration from")
 @click.pass_obj
 def _run_command_impl(
     ctx,
     pipeline: str,
     env: str,
     config: tuple,
-    params: tuple,
+    params: dict[str, Any],
     tags: list[str],
     nodes: tuple,
     to_nodes: tuple,
@@ -133,9 +205,15 @@ def _run_command_impl(
     to_outputs: tuple,
     load_version: tuple,
     namespaces: Iterable[str],
+    conf_source: str | None,
 ):    
     """Run the pipeline with the FusedRunner."""
 
+    # NOTE: Idempotent tasks run in a subprocess, and start a backup on another node once they
+    # exceed a percentile of their recorded durations, the first to finish wins.
+    if speculate_after := os.environ.get(SPECULATE_ENV_VAR):
+        raise click.exceptions.Exit(run_speculative([sys.executable, "-m", "kedro", *sys.argv[1:]], float(speculate_after)))
+
     click.echo("Using plugin entrypoint")
     
     load_versions = None
@@ -146,28 +224,66 @@ def _run_command_impl(
                 dataset, version = version_spec.split(":", 1)
                 load_versions[dataset] = version
 
-    conf_source = getattr(ctx, "conf_source", None)
+    conf_source = conf_source or getattr(ctx, "conf_source", None)
     env_value = env or getattr(ctx, "env", None)
+    start_time = time.time_ns()
 
     with KedroSession.create(
         env=env_value,
         conf_source=conf_source,
+        runtime_params=params,
     ) as session:
 
         context = session.load_context()
 
-        session.run(
-            pipeline_name=pipeline,
-            tags=tags,
-            runner=FusedRunner(pipeline_name=pipeline, use_memory_datasets=context.argo.runner.use_memory_datasets),
-            node_names=list(nodes) if nodes else None,
-            from_nodes=list(from_nodes) if from_nodes else None,
-            to_nodes=list(to_nodes) if to_nodes else None,
-            from_inputs=list(from_inputs) if from_inputs else None,
-            to_outputs=list(to_outputs) if to_outputs else None,
-            load_versions=load_versions,
-            namespaces=namespaces,
-        )
+        # NOTE: The tracer is configured by the context, spans preceding its
+        # creation are therefore recorded retroactively.
+        tracer = get_tracer(context.argo.tracing)
+        if tracer is not None:
+            task_span = tracer.start_span(
+                "kedro.task",
+                {"pipeline": pipeline, "nodes": ",".join(nodes), "workflow": os.environ.get("WORKFLOW_ID", "")},
+                start_time=start_time,
+            )
+            tracer.record("kedro.bootstrap", start_time, time.time_ns())
+            session._hook_manager.register(CatalogTracingHooks(tracer))
+
+        status = "ERROR"
+        try:
+            session.run(
+                pipeline_names=pipeline.split(","),
+                tags=tags,
+                runner=FusedRunner(
+                    pipeline_name=pipeline,
+                    use_memory_datasets=context.argo.runner.use_memory_datasets,
+                    read_cache=get_read_cache(context.argo.runner.read_cache),
+                    tracer=tracer,
+                    boundary_path=os.environ.get(BOUNDARY_PATH_ENV_VAR),
+                    stream_buffer_size=context.argo.runner.stream_buffer_size,
+                    metadata_store=get_metadata_store(context.argo.metadata),
+                ),
+                node_names=list(nodes) if nodes else None,
+                from_nodes=list(from_nodes) if from_nodes else None,
+                to_nodes=list(to_nodes) if to_nodes else None,
+                from_inputs=list(from_inputs) if from_inputs else None,
+                to_outputs=list(to_outputs) if to_outputs else None,
+                load_versions=load_versions,
+                namespaces=namespaces,
+            )
+            status = "OK"
+        finally:
+            if tracer is not None:
+                tracer.end_span(task_span, status=status)
+                tracer.flush()
+
+
+def get_read_cache(config: ReadCacheConfig | None) -> ReadCache | None:
+    """Function to create the read cache, if configured and its volume is mounted."""
+    if config is None or not Path(config.path).is_dir():
+        return None
+
+    return ReadCache(config.path, max_size=config.max_size * 2**30)
+
 
 class KedroClickGroup(click.Group):
     def reset_commands(self):
@@ -177,6 +293,14 @@ class KedroClickGroup(click.Group):
         if is_kedro_project(find_kedro_project(Path.cwd())):
             self.add_command(init)
             self.add_command(submit)
+            self.add_command(compile_workflow)
+            self.add_command(partitions)
+            self.add_command(resume)
+            self.add_command(simulate)
+            self.add_command(report)
+            self.add_command(stats)
+            self.add_command(queue)
+            self.add_command(worker)
 
     def list_commands(self, ctx):
         self.reset_commands()
@@ -335,7 +459,14 @@ def init(env: str, force: bool, silent: bool):
                     )
                 )
 
-def publish_image(full_image: str, project_path: Path, platform: str = "linux/amd64", context: str = "./") -> str:
+def publish_image(
+    full_image: str,
+    project_path: Path,
+    platform: str = "linux/amd64",
+    context: str = "./",
+    stage: str | None = None,
+    build_args: dict[str, str] | None = None,
+) -> str:
     """Build and push the Docker image.
     
     Args:
@@ -343,6 +474,8 @@ def publish_image(full_image: str, project_path: Path, platform: str = "linux/am
         project_path: Path to the project root
         platform: Target platform for the image
         context: Docker build context directory (relative to project_path or absolute)
+        stage: Optional Dockerfile stage to build
+        build_args: Optional build arguments, e.g., the base image
         
     Returns:
         The full image name with tag
@@ -356,8 +489,12 @@ def publish_image(full_image: str, project_path: Path, platform: str = "linux/am
         "--platform", platform,
         "-t", full_image,
         "--load",
-        context
     ]
+    if stage is not None:
+        build_cmd.extend(["--target", stage])
+    for key, value in (build_args or {}).items():
+        build_cmd.extend(["--build-arg", f"{key}={value}"])
+    build_cmd.append(context)
     
     click.echo(f"Running: {' '.join(build_cmd)}")
     result = subprocess.run(build_cmd, cwd=project_path)
@@ -375,17 +512,27 @@ def publish_image(full_image: str, project_path: Path, platform: str = "linux/am
     return full_image
 
 @argo_commands.command(name="submit")
-@click.option("--pipeline", "-p", type=str, default="__default__", help="Specify which pipeline to execute")
+@click.option("--pipeline", "-p", "pipelines", type=str, multiple=True, default=["__default__"], help="Specify which pipeline to execute, repeat to merge pipelines into one workflow")
 @click.option("--environment", "-e", type=str, default="cloud", help="Kedro environment to execute in")
 @click.option("--dry_run", "-d", is_flag=True, default=False, help="Dry run submit")
 @click.option("--workflow-name", "-w", type=str, default="workflow", help="Custom Argo workflow name")
+@click.option("--sweep", "-s", type=click.Path(exists=True, dir_okay=False), default=None, help="YAML file with parameter overrides per sweep point")
+@click.option("--wait", is_flag=True, default=False, help="Stream task status until the workflow completes, and exit with its status")
+@click.option("--durations-from", type=str, default=None, help="Previous workflow, by name or JSON file, to prioritise tasks by its durations, recorded in the task history")
+@click.option("--force-build", is_flag=True, default=False, help="Build the image, even if the code did not change since the last build")
+@click.option("--skip-preflight", is_flag=True, default=False, help="Skip the preflight checks of the external inputs")
 @click.pass_obj
 def submit(
     ctx,
-    pipeline: str,
+    pipelines: tuple[str, ...],
     environment: str,
     dry_run: bool,
-    workflow_name: str
+    workflow_name: str,
+    sweep: str | None,
+    wait: bool,
+    durations_from: str | None,
+    force_build: bool,
+    skip_preflight: bool,
 ):
     """Submit the pipeline to Argo."""
     project_path = find_kedro_project(Path.cwd()) or Path.cwd()
@@ -396,36 +543,129 @@ def submit(
         env="base", # NOTE: Currently using the base env to avoid cloud related catalog issues
     ) as session:
         context = session.load_context()
+
+        # NOTE: Pipelines are merged into a single workflow, running shared nodes once. Tasks run
+        # within the union of the pipelines, i.e., comma-separated as accepted by `kedro run`.
+        names = list(dict.fromkeys(pipelines))
+        pipeline = ",".join(names)
+        kedro_pipeline, members = merge_pipelines({name: kedro_pipelines[name] for name in names})
+        pipeline_labels = get_pipeline_labels(names)
+        if pipeline_labels is not None:
+            shared = sum(len(member_of) > 1 for member_of in members.values())
+            click.echo(f"Merged pipelines {pipeline}, running {shared} shared nodes once")
+
+        # NOTE: The root span of the trace, propagated to every pod of the workflow
+        tracer = get_tracer(context.argo.tracing)
+        root_span = tracer.start_span("argo.submit", {"pipeline": pipeline, "environment": environment}) if tracer else None
+
+        # NOTE: Inputs are checked before building the image, as a missing input otherwise
+        # only surfaces once the task consuming it runs.
+        if context.argo.preflight is not None and not skip_preflight:
+            preflight_inputs(project_path, kedro_pipeline, environment, context.argo)
         
-        # Build and push the image
-        image = f"{context.argo.deployment.image}:{context.argo.deployment.tag}"
+        # Build and push the image, or an image per build target
+        deployment = context.argo.deployment
         if not dry_run:
-            publish_image(
-                full_image=image,
-                project_path=project_path,
-                platform=context.argo.deployment.target_platform,
-                context=context.argo.deployment.context,
-            )
+            # NOTE: When configuration is mounted into the pods, it does not contribute to the
+            # image, which is only rebuilt once the code or dependencies changed.
+            source_hash = None
+            if context.argo.conf is not None:
+                source_hash = get_source_hash(
+                    project_path / deployment.context,
+                    exclude=[project_path / settings.CONF_SOURCE, project_path / BUILD_STATE_PATH.parent],
+                )
+
+            for target, build in (deployment.targets or {None: None}).items():
+                full_image = deployment.get_image(target)
+                build_hash = f"{source_hash}:{build.model_dump_json() if build else ''}"
+                if source_hash is not None and not force_build and is_image_current(project_path, full_image, build_hash):
+                    click.echo(f"Code unchanged, skipping build of image: {full_image}")
+                    continue
+
+                publish_image(
+                    full_image=full_image,
+                    project_path=project_path,
+                    platform=deployment.target_platform,
+                    context=deployment.context,
+                    stage=build.stage if build else None,
+                    build_args=build.build_args if build else None,
+                )
+                if source_hash is not None:
+                    record_image(project_path, full_image, build_hash)
+
+        # Package the configuration of the environment, mounted into the pods as `--conf-source`
+        conf_archive, conf_config_map = get_conf_archive(project_path, context.argo, environment)
         
         pipeline_tasks = get_argo_dag(
-            kedro_pipelines[pipeline], 
+            kedro_pipeline, 
             machine_types=context.argo.machine_types,
-            default_machine_type=context.argo.default_machine_type
+            default_machine_type=context.argo.default_machine_type,
+            preemptible=context.argo.preemptible,
         )
 
-        # Render the template
+        removed = reduce_dependencies(pipeline_tasks)
+        click.echo(f"Removed {removed} redundant task dependencies")
+
+        report_boundary_datasets(kedro_pipeline, context.catalog, context.argo)
+
+        if sweep is not None:
+            with open(sweep) as f:
+                sweep_points = yaml.safe_load(f)
+
+            num_tasks = len(pipeline_tasks)
+            pipeline_tasks = get_sweep_dag(pipeline_tasks, sweep_points)
+            click.echo(f"Expanded {len(sweep_points)} sweep points into {len(pipeline_tasks) - num_tasks} additional tasks")
+
+        # Prioritise tasks on the critical path, using historical durations when available
+        durations = None
+        deadlines = context.argo.deadlines
+        if durations_from is not None:
+            previous = load_workflow(
+                durations_from,
+                namespace=context.argo.namespace,
+                from_file=durations_from if os.path.isfile(durations_from) else None,
+            )
+            durations = {name: get_duration(node) for name, node in get_task_nodes(previous).items() if get_duration(node) is not None}
+            record_durations(project_path, pipeline, previous, history=deadlines.history if deadlines else 20)
+            record_escalations(project_path, pipeline, previous)
+
+        history = load_durations(project_path, pipeline)
+        if durations is None:
+            durations = get_median_durations(history)
+
+        concurrency = context.argo.concurrency or ConcurrencyConfig()
+        pipeline_tasks = set_task_priorities(pipeline_tasks, durations=durations)
+        semaphores = get_semaphores(pipeline_tasks, concurrency)
+
+        tasks = [task.to_dict() for task in sorted(pipeline_tasks.values(), key=lambda task: -task.priority)]
+        if deadlines is not None:
+            tasks = set_task_deadlines(tasks, history, deadlines)
+        if context.argo.escalation is not None:
+            tasks = set_task_escalations(
+                tasks,
+                context.argo.machine_types,
+                context.argo.escalation,
+                load_escalations(project_path, pipeline),
+                limits=concurrency.machine_types,
+            )
+        # NOTE: Tasks are labelled with the pipelines they are part of, to monitor pipelines on their own
+        tasks = set_task_pipelines(tasks, members, pipeline_labels)
+
+        # Render the template, NOTE: Argo DAG tasks have no priority field, tasks are
+        # therefore listed by descending priority, such that Argo considers tasks on
+        # the critical path first when the parallelism or semaphores limit execution.
         click.echo("Rendering Argo workflow spec...")
-        rendered_template = render_jinja_template(
-            src=ARGO_TEMPLATES_DIR_PATH / "argo_wf_spec.tmpl",
-            trim_blocks=True,
-            lstrip_blocks=True,
-            pipeline_tasks=[task.to_dict() for task in pipeline_tasks.values()],
-            template=context.argo.template if context.argo.template else TemplateConfig(),
+        report_pooled_tasks(tasks, context.argo)
+        rendered_template = render_workflow_spec(
+            context.argo,
+            pipeline_tasks=tasks,
+            semaphores=semaphores,
             pipeline_name=pipeline,
-            image=image,
-            namespace=context.argo.namespace,
             environment=environment,
-            workflow_name=workflow_name
+            workflow_name=workflow_name,
+            traceparent=root_span.traceparent if root_span else None,
+            conf_config_map=conf_config_map,
+            pipeline_labels=pipeline_labels,
         )
 
         # Load as yaml
@@ -436,27 +676,655 @@ def submit(
         )
 
         if not dry_run:
-            # Use kubeconfig to submit to kubernetes
-            config.load_kube_config()
-            client = DynamicClient(config.new_client_from_config())
+            if semaphores:
+                apply_config_map(
+                    concurrency.config_map,
+                    namespace=context.argo.namespace,
+                    data={key: str(limit) for key, limit in semaphores.items()},
+                )
 
-            resource = client.resources.get(
-                api_version=yaml_data["apiVersion"],
-                kind=yaml_data["kind"],
-            )
+            if conf_config_map is not None:
+                apply_config_map(
+                    conf_config_map,
+                    namespace=context.argo.namespace,
+                    binary_data={CONF_ARCHIVE: conf_archive},
+                )
 
-            response = resource.create(
-                body=yaml_data,
-                namespace=context.argo.namespace
-            )
-            
-            workflow_name = response.metadata.name
+            workflow_name = submit_workflow(yaml_data, namespace=context.argo.namespace)
             click.echo(f"Workflow submitted successfully: {workflow_name}")
             click.echo(f"View workflow at: https://argo.ai-platform.dev.everycure.org/workflows/{context.argo.namespace}/{workflow_name}")
 
+            if conf_config_map is not None:
+                add_workflow_owner(conf_config_map, context.argo.namespace, workflow_name)
+
+        if tracer is not None:
+            root_span.attributes["workflow"] = workflow_name
+            tracer.end_span(root_span)
+            tracer.flush()
+            click.echo(f"Trace: {root_span.trace_id}")
+
+        if not dry_run and wait:
+            phase = wait_for_workflow(workflow_name, context.argo.namespace)
+            completed = load_workflow(workflow_name, namespace=context.argo.namespace)
+            record_durations(project_path, pipeline, completed, history=deadlines.history if deadlines else 20)
+            for task, machine_type in record_escalations(project_path, pipeline, completed).items():
+                click.echo(f"Task {task} ran out of memory, escalated to {machine_type}")
+            if (store := get_metadata_store(context.argo.metadata)) is not None:
+                for run in get_workflow_runs(completed):
+                    store.save(run)
+            exit_with_workflow_status(workflow_name, phase)
+
+
+@argo_commands.command(name="compile")
+@click.option("--pipeline", "-p", "pipelines", type=str, multiple=True, default=["__default__"], help="Specify which pipeline to compile, repeat to merge pipelines into one workflow")
+@click.option("--environment", "-e", type=str, default="cloud", help="Kedro environment to execute in")
+@click.option("--workflow-name", "-w", type=str, default="workflow", help="Custom Argo workflow name")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None, help="Path to write the spec to")
+@click.option("--no-cache", is_flag=True, default=False, help="Load the pipeline, even if its structure is cached")
+def compile_workflow(
+    pipelines: tuple[str, ...],
+    environment: str,
+    workflow_name: str,
+    output: str | None,
+    no_cache: bool,
+):
+    """Compile the Argo workflow spec, without creating a Kedro session."""
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    metadata = bootstrap_project(project_path)
+    argo_config = load_argo_config(project_path)
+
+    # NOTE: Pipelines are merged as by `submit`, such that the spec matches the spec it renders
+    names = list(dict.fromkeys(pipelines))
+    pipeline = ",".join(names)
+    pipeline_labels = get_pipeline_labels(names)
+
+    # NOTE: Loading the pipeline imports every module of the project, the structure
+    # of the tasks is therefore cached until the sources or configuration change.
+    key = get_cache_key(pipeline, argo_config, source_paths=[metadata.source_dir / metadata.package_name])
+    compiled = None if no_cache else load_cached_tasks(project_path, pipeline, key)
+    if compiled is None:
+        kedro_pipeline, members = merge_pipelines({name: kedro_pipelines[name] for name in names})
+        argo_dag = get_argo_dag(
+            kedro_pipeline,
+            machine_types=argo_config.machine_types,
+            default_machine_type=argo_config.default_machine_type,
+            preemptible=argo_config.preemptible,
+        )
+        reduce_dependencies(argo_dag)
+        set_task_priorities(argo_dag)
+        tasks = [task.to_dict() for task in sorted(argo_dag.values(), key=lambda task: -task.priority)]
+        compiled = {
+            "tasks": set_task_pipelines(tasks, members, pipeline_labels),
+            "semaphores": get_semaphores(argo_dag, argo_config.concurrency or ConcurrencyConfig()),
+            "estimates": {task.name: get_task_estimate(task) for task in argo_dag.values()},
+        }
+        save_cached_tasks(project_path, pipeline, key, compiled)
+    else:
+        click.echo(f"Using cached structure of pipeline `{pipeline}`")
+
+    # NOTE: Priorities, deadlines and escalations are applied to the cached structure, as the
+    # history changes with every workflow
+    history = load_durations(project_path, pipeline)
+    tasks = prioritise_tasks(compiled["tasks"], durations={**compiled["estimates"], **get_median_durations(history)})
+    if argo_config.deadlines is not None:
+        tasks = set_task_deadlines(tasks, history, argo_config.deadlines)
+    if argo_config.escalation is not None:
+        tasks = set_task_escalations(
+            tasks,
+            argo_config.machine_types,
+            argo_config.escalation,
+            load_escalations(project_path, pipeline),
+            limits=(argo_config.concurrency or ConcurrencyConfig()).machine_types,
+        )
+
+    _, conf_config_map = get_conf_archive(project_path, argo_config, environment)
+    report_pooled_tasks(tasks, argo_config)
+    rendered_template = render_workflow_spec(
+        argo_config,
+        pipeline_tasks=tasks,
+        semaphores=compiled["semaphores"],
+        pipeline_name=pipeline,
+        environment=environment,
+        workflow_name=workflow_name,
+        conf_config_map=conf_config_map,
+        pipeline_labels=pipeline_labels,
+    )
+
+    file_path = save_argo_template(
+        yaml.dump(yaml.safe_load(rendered_template), sort_keys=False, default_flow_style=False),
+        file_path=output,
+    )
+    click.echo(f"Compiled {len(compiled['tasks'])} tasks to {file_path}")
+
+
+@argo_commands.command(name="resume")
+@click.argument("workflow", type=str, required=False)
+@click.option("--from-file", "-f", type=click.Path(exists=True, dir_okay=False), default=None, help="Read the previous workflow from a JSON file")
+@click.option("--dry_run", "-d", is_flag=True, default=False, help="Dry run resume")
+@click.option("--workflow-name", "-w", type=str, default=None, help="Custom Argo workflow name")
+@click.option("--image", "-i", type=str, default=None, help="Override the image of the resumed workflow")
+@click.option("--wait", is_flag=True, default=False, help="Stream task status until the workflow completes, and exit with its status")
+def resume(
+    workflow: str,
+    from_file: str,
+    dry_run: bool,
+    workflow_name: str,
+    image: str,
+    wait: bool,
+):
+    """Resubmit the failed and unfinished tasks of a previous workflow."""
+    if workflow is None and from_file is None:
+        raise click.UsageError("Either a workflow name or `--from-file` should be provided.")
+
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    bootstrap_project(project_path)
+
+    with KedroSession.create(
+        project_path=project_path,
+        env="base",
+    ) as session:
+        context = session.load_context()
+        namespace = context.argo.namespace
+
+    previous = load_workflow(workflow, namespace=namespace, from_file=from_file)
+
+    # NOTE: Pin each image to the digest used by the previous workflow, such that
+    # the resumed tasks run the exact same code, including tasks with their own image.
+    images = None
+    if image is None and from_file is None:
+        images = {previous_image: pin_image(previous_image, digest) for previous_image, digest in get_image_digests(previous).items()}
+
+    resumed = get_resume_workflow(previous, image=image, workflow_name=workflow_name, images=images)
+    tasks = next(
+        template["dag"]["tasks"] for template in resumed["spec"]["templates"] if template["name"] == resumed["spec"]["entrypoint"]
+    )
+    if not tasks:
+        click.secho(f"All tasks of workflow `{previous['metadata']['name']}` succeeded, nothing to resume.", fg="green")
+        return
+
+    click.echo(f"Resuming {len(tasks)} tasks of workflow `{previous['metadata']['name']}`")
+    save_argo_template(yaml.dump(resumed, sort_keys=False, default_flow_style=False))
+
+    if not dry_run:
+        workflow_name = submit_workflow(resumed, namespace=resumed["metadata"]["namespace"])
+        click.echo(f"Workflow submitted successfully: {workflow_name}")
+        click.echo(f"View workflow at: https://argo.ai-platform.dev.everycure.org/workflows/{resumed['metadata']['namespace']}/{workflow_name}")
+
+        # NOTE: The resumed workflow shares the packaged configuration of the previous workflow
+        conf_config_maps = {
+            volume["configMap"]["name"]
+            for template in resumed["spec"]["templates"]
+            for volume in template.get("volumes", [])
+            if volume["name"] == "conf" and "configMap" in volume
+        }
+        for conf_config_map in conf_config_maps:
+            add_workflow_owner(conf_config_map, resumed["metadata"]["namespace"], workflow_name)
+
+        if wait:
+            exit_with_workflow_status(workflow_name, wait_for_workflow(workflow_name, resumed["metadata"]["namespace"]))
+
+
+@argo_commands.command(name="partitions")
+@click.option("--dataset", type=str, required=True, help="Dataset holding the partitions")
+@click.option("--env", "-e", type=str, default=None, help="Kedro environment to load the dataset from")
+@click.option("--output", "-o", type=str, default="/tmp/partitions.json", help="Path to write the partitions to")
+@click.option("--conf-source", type=str, default=None, help="Path of a directory or compressed archive to load configuration from")
+def partitions(dataset: str, env: str, output: str, conf_source: str | None):
+    """Resolve the partitions of a partitioned node at runtime."""
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    bootstrap_project(project_path)
+
+    with KedroSession.create(project_path=project_path, env=env, conf_source=conf_source) as session:
+        context = session.load_context()
+        keys = partition_keys(context.catalog.load(dataset))
+
+    with open(output, "w") as f:
+        json.dump(keys, f)
+
+    click.echo(f"Resolved {len(keys)} partitions from dataset `{dataset}`")
+
+
+@argo_commands.command(name="simulate")
+@click.option("--pipeline", "-p", "pipelines", type=str, multiple=True, default=["__default__"], help="Specify which pipeline to simulate, repeat to merge pipelines into one workflow")
+@click.option("--env", "-e", type=str, default=None, help="Kedro environment to run the tasks in")
+@click.option("--from-file", "-f", type=click.Path(exists=True, dir_okay=False), default=None, help="Simulate a saved workflow template")
+@click.option("--cpu", type=float, default=None, help="Number of CPUs available for tasks, defaults to the CPUs available to the process")
+@click.option("--mem", type=float, default=None, help="Memory, in Gi, available for tasks, defaults to the host memory")
+@click.option("--gpu", type=int, default=None, help="Number of GPUs available for tasks, GPUs are not budgeted by default")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None, help="Path to write the JSON report to")
+def simulate(
+    pipelines: tuple[str, ...],
+    env: str | None,
+    from_file: str | None,
+    cpu: float | None,
+    mem: float | None,
+    gpu: int | None,
+    output: str | None,
+):
+    """Simulate the Argo workflow locally."""
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    bootstrap_project(project_path)
+
+    names = list(dict.fromkeys(pipelines))
+    pipeline = ",".join(names)
+    if from_file is not None:
+        pipeline_tasks = load_pipeline_tasks(from_file)
+    else:
+        with KedroSession.create(
+            project_path=project_path,
+            env="base",
+        ) as session:
+            context = session.load_context()
+            kedro_pipeline, _ = merge_pipelines({name: kedro_pipelines[name] for name in names})
+            argo_dag = get_argo_dag(
+                kedro_pipeline,
+                machine_types=context.argo.machine_types,
+                default_machine_type=context.argo.default_machine_type,
+            )
+            reduce_dependencies(argo_dag)
+            set_task_priorities(argo_dag, durations=get_median_durations(load_durations(project_path, pipeline)))
+            pipeline_tasks = [task.to_dict() for task in sorted(argo_dag.values(), key=lambda task: -task.priority)]
+
+    if cpu is None:
+        cpu = get_available_cpus()
+    if mem is None:
+        mem = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2**30
+
+    tasks = get_simulated_tasks(pipeline_tasks, pipeline_name=pipeline, environment=env)
+    gpu_budget = f" and {gpu} GPUs" if gpu is not None else ""
+    click.echo(f"Simulating {len(tasks)} tasks with a budget of {cpu:g} CPUs, {mem:.0f}Gi memory{gpu_budget}")
+    report = LocalSimulator(cpu=cpu, mem=mem, cwd=project_path, gpu=gpu).run(tasks)
+
+    click.echo(f"{'task':<40} {'phase':<10} {'cpu':>6} {'mem':>6} {'gpu':>4} {'queued':>8} {'duration':>9}")
+    for task in report.tasks:
+        click.echo(
+            f"{task.name:<40} {task.phase:<10} {task.cpu:>6g} {task.mem:>6g} {task.num_gpu:>4} "
+            f"{task.queued or 0:>7.1f}s {task.duration or 0:>8.1f}s"
+        )
+    click.echo(
+        f"Makespan: {report.makespan:.1f}s, parallelism: {report.parallelism:.2f}, "
+        f"max concurrency: {report.max_concurrency}"
+    )
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+
+    if any(task.phase != "Succeeded" for task in report.tasks):
+        raise click.exceptions.Exit(1)
+
+
+@argo_commands.command(name="report")
+@click.argument("workflow", type=str, required=False)
+@click.option("--from-file", "-f", type=click.Path(exists=True, dir_okay=False), default=None, help="Read the workflow from a JSON file")
+@click.option("--pods-from-file", type=click.Path(exists=True, dir_okay=False), default=None, help="Read the pods of the workflow from a JSON file")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None, help="Path to write the report to, as CSV or JSON based on the extension")
+def report(
+    workflow: str | None,
+    from_file: str | None,
+    pods_from_file: str | None,
+    output: str | None,
+):
+    """Break down the duration of the tasks of a finished workflow."""
+    if workflow is None and from_file is None:
+        raise click.UsageError("Either a workflow name or `--from-file` should be provided.")
+
+    namespace = None
+    if from_file is None:
+        project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+        bootstrap_project(project_path)
+
+        with KedroSession.create(
+            project_path=project_path,
+            env="base",
+        ) as session:
+            namespace = session.load_context().argo.namespace
+
+    argo_workflow = load_workflow(workflow, namespace=namespace, from_file=from_file)
+    pods = list_workflow_pods(argo_workflow, from_file=pods_from_file)
+    timings = get_workflow_timings(argo_workflow, pods)
+    groups = aggregate_timings(timings)
+
+    if not pods:
+        click.secho("No pods found, only the total duration of tasks is reported.", fg="yellow")
+
+    def seconds(value: float | None) -> str:
+        return f"{value:>9.1f}s" if value is not None else f"{'-':>10}"
+
+    header = "".join(f"{phase:>11}" for phase in [*PHASES, "total"])
+    click.echo(f"{'task':<40} {'machine type':<16} {'fused':<6}{header}")
+    for timing in timings:
+        phases = "".join(f" {seconds(getattr(timing, phase))}" for phase in [*PHASES, "total"])
+        click.echo(f"{timing.name:<40} {timing.machine_type:<16} {str(timing.fused if timing.fused is not None else '-'):<6}{phases}")
+
+    click.echo()
+    click.echo(f"{'machine type':<16} {'fused':<6} {'tasks':>6}{header}  (mean per task)")
+    for group in groups:
+        phases = "".join(f" {seconds(group.mean[phase])}" for phase in [*PHASES, "total"])
+        click.echo(f"{group.machine_type:<16} {str(group.fused if group.fused is not None else '-'):<6} {group.tasks:>6}{phases}")
+
+    datasets = [(timing.name, name, dataset) for timing in timings for name, dataset in sorted(timing.datasets.items())]
+    if datasets:
+        click.echo()
+        click.echo(f"{'boundary dataset':<40} {'task':<40} {'format':<8} {'size':>12}")
+        for task, name, dataset in datasets:
+            click.echo(f"{name:<40} {task:<40} {dataset['format']:<8} {dataset['size'] / 2**20:>10.1f}MB")
+
+    if output is not None:
+        write_report(output, timings, groups)
+
+
+@argo_commands.command(name="stats")
+@click.option("--workflow", "-w", type=str, default=None, help="Only include the runs of a workflow")
+@click.option("--pipeline", "-p", type=str, default=None, help="Only include the runs of a pipeline")
+@click.option("--limit", "-n", type=int, default=None, help="Only include the most recent runs")
+@click.option("--ingest", type=str, default=None, help="Record the runs of a finished workflow, by name or JSON file, before reporting")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None, help="Path to write the statistics to, as JSON")
+def stats(
+    workflow: str | None,
+    pipeline: str | None,
+    limit: int | None,
+    ingest: str | None,
+    output: str | None,
+):
+    """Report the recorded resource usage of nodes and datasets."""
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    argo_config = load_argo_config(project_path)
+    # NOTE: Without configuration, runs are reported from the default store, e.g., to ingest workflows ad hoc
+    store = get_metadata_store(argo_config.metadata or MetadataConfig())
+
+    if ingest is not None:
+        ingested = load_workflow(ingest, namespace=argo_config.namespace, from_file=ingest if os.path.isfile(ingest) else None)
+        runs = get_workflow_runs(ingested)
+        for run in runs:
+            store.save(run)
+        click.echo(f"Recorded {len(runs)} runs of workflow {ingested['metadata']['name']}")
+
+    runs = store.runs(workflow=workflow, pipeline=pipeline, limit=limit)
+    node_stats, dataset_stats = get_node_stats(runs), get_dataset_stats(runs)
+
+    def megabytes(value: int | None) -> str:
+        return f"{value / 2**20:>10.1f}MB" if value is not None else f"{'-':>12}"
+
+    def seconds(value: float | None) -> str:
+        return f"{value:>9.1f}s" if value is not None else f"{'-':>10}"
+
+    click.echo(f"{len(runs)} runs")
+    click.echo(f"{'node':<40} {'runs':>6} {'wall':>10} {'wall p95':>10} {'cpu':>10} {'peak rss':>12}")
+    for node in node_stats:
+        click.echo(
+            f"{node.node:<40} {node.runs:>6} {seconds(node.wall_time)} {seconds(node.wall_time_p95)} "
+            f"{seconds(node.cpu_time)} {megabytes(node.peak_rss)}"
+        )
+
+    if dataset_stats:
+        click.echo()
+        click.echo(f"{'dataset':<40} {'loads':>6} {'saves':>6} {'size':>12} {'load':>10} {'save':>10}")
+        for dataset in dataset_stats:
+            click.echo(
+                f"{dataset.dataset:<40} {dataset.loads:>6} {dataset.saves:>6} {megabytes(dataset.size)} "
+                f"{seconds(dataset.load_time)} {seconds(dataset.save_time)}"
+            )
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(
+                {"nodes": [node.model_dump() for node in node_stats], "datasets": [dataset.model_dump() for dataset in dataset_stats]},
+                f,
+                indent=2,
+            )
+
+
+@argo_commands.command(name="queue")
+@click.option("--port", type=int, default=8000, help="Port to serve the task queue on")
+@click.option("--lease", type=float, default=60.0, help="Number of seconds a task is leased to a worker without heartbeat")
+@click.option("--max-requeues", type=int, default=3, help="Number of times a task is requeued once its lease expired")
+def queue(port: int, lease: float, max_requeues: int):
+    """Serve the task queue of the worker pool."""
+    server = create_queue_server(port, queue=TaskQueue(lease=lease, max_requeues=max_requeues))
+    click.echo(f"Serving task queue on port {port}")
+    server.serve_forever()
+
+
+@argo_commands.command(name="worker")
+@click.option("--queue", "queue_url", type=str, required=True, help="URL of the task queue")
+@click.option("--machine-type", type=str, required=True, help="Machine type to pull tasks for")
+@click.option("--env", "-e", type=str, default=None, help="Kedro environment to run the tasks in")
+@click.option("--conf-source", type=str, default=None, help="Path of a directory or compressed archive to load configuration from")
+@click.option("--heartbeat-interval", type=float, default=10.0, help="Interval, in seconds, to renew the lease of the running task")
+def worker(queue_url: str, machine_type: str, env: str | None, conf_source: str | None, heartbeat_interval: float):
+    """Run a long-lived worker, executing tasks pulled from the task queue."""
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    bootstrap_project(project_path)
+
+    def run(assignment):
+        return run_assignment(assignment, project_path=project_path, env=env, run=functools.partial(run_nodes, conf_source=conf_source))
+
+    click.echo(f"Pulling `{machine_type}` tasks from {queue_url}")
+    Worker(queue_url, machine_type=machine_type, run=run, heartbeat_interval=heartbeat_interval).serve()
+
+
+def run_nodes(project_path: Path, pipeline: str, nodes: str, env: str | None, params: str, conf_source: str | None = None) -> None:
+    """Function to run nodes of a pipeline with the FusedRunner, as `kedro run` would."""
+    with KedroSession.create(
+        project_path=project_path,
+        env=env,
+        conf_source=conf_source,
+        runtime_params=_split_params(None, None, params) if params else None,
+    ) as session:
+        context = session.load_context()
+        tracer = get_tracer(context.argo.tracing)
+        try:
+            session.run(
+                pipeline_names=pipeline.split(","),
+                node_names=nodes.split(","),
+                runner=FusedRunner(
+                    pipeline_name=pipeline,
+                    use_memory_datasets=context.argo.runner.use_memory_datasets,
+                    read_cache=get_read_cache(context.argo.runner.read_cache),
+                    tracer=tracer,
+                    boundary_path=os.environ.get(BOUNDARY_PATH_ENV_VAR),
+                    stream_buffer_size=context.argo.runner.stream_buffer_size,
+                    metadata_store=get_metadata_store(context.argo.metadata),
+                ),
+            )
+        finally:
+            if tracer is not None:
+                tracer.flush()
+
+
+def wait_for_workflow(name: str, namespace: str, api_client=None) -> str | None:
+    """Function to stream the task phase transitions of a workflow until it completes.
+
+    Args:
+        name: Name of the workflow
+        namespace: Namespace of the workflow
+        api_client: Optional Kubernetes API client
+    Returns:
+        Phase of the completed workflow.
+    """
+    phases = {}
+    phase = None
+    for workflow in watch_workflow(name, namespace, api_client=api_client):
+        for task, node in get_task_nodes(workflow).items():
+            if phases.get(task) == node["phase"]:
+                continue
+
+            phases[task] = node["phase"]
+            duration = get_duration(node)
+            click.echo(f"{task}: {node['phase']}" + (f" ({duration:.0f}s)" if duration is not None else ""))
+
+        phase = workflow.get("status", {}).get("phase")
+
+    return phase
+
+
+def exit_with_workflow_status(name: str, phase: str | None) -> None:
+    """Function to exit the CLI with the status of the workflow."""
+    if phase == "Succeeded":
+        click.secho(f"Workflow {name} succeeded", fg="green")
+        return
+
+    click.secho(f"Workflow {name} finished with phase: {phase}", fg="red")
+    raise click.exceptions.Exit(1)
+
+
+def get_conf_archive(project_path: Path, argo: ArgoConfig, environment: str) -> tuple[bytes | None, str | None]:
+    """Function to package the configuration of the environment, if configuration is mounted into the pods.
+
+    Returns:
+        Archive of the configuration, and the name of the ConfigMap to store it in.
+    """
+    if argo.conf is None:
+        return None, None
+
+    conf_archive = package_conf(project_path / settings.CONF_SOURCE, sorted({"base", environment}))
+    if len(conf_archive) > MAX_ARCHIVE_SIZE:
+        raise click.ClickException(
+            f"Configuration archive of {len(conf_archive)} bytes exceeds the ConfigMap limit of {MAX_ARCHIVE_SIZE} bytes"
+        )
+
+    conf_config_map = get_conf_config_map_name(argo.conf.config_map, conf_archive)
+    click.echo(f"Packaged configuration of environment `{environment}` as ConfigMap: {conf_config_map}")
+    return conf_archive, conf_config_map
+
+
+def preflight_inputs(project_path: Path, pipeline: Pipeline, environment: str, argo: ArgoConfig) -> None:
+    """Function to check the external inputs of the pipeline in the catalog of the environment, aborting on failure."""
+    with KedroSession.create(project_path=project_path, env=environment) as session:
+        catalog = session.load_context().catalog
+
+    inputs = get_external_inputs(pipeline)
+    click.echo(f"Checking {len(inputs)} external inputs in environment `{environment}`...")
+    results = run_preflight(
+        project_path,
+        {name: catalog.get(name) if name in catalog else None for name in inputs},
+        argo.preflight,
+    )
+
+    failed = [result for result in results if not result.ok]
+    for result in failed:
+        click.secho(f"  {result.dataset}: {result.error}", fg="red")
+
+    if failed:
+        raise click.ClickException(f"Preflight failed for {len(failed)} of {len(results)} external inputs")
+
+    cached = sum(result.cached for result in results)
+    click.secho(f"All {len(results)} external inputs passed preflight ({cached} cached)", fg="green")
 
-def save_argo_template(argo_template: str) -> str:
-    file_path = Path("templates") / "argo-workflow-template.yml"
+
+def report_boundary_datasets(pipeline: Pipeline, catalog: Any, argo: ArgoConfig) -> None:
+    """Function to report the datasets crossing a task boundary without a catalog entry.
+
+    When `runner.boundary_datasets` is configured, such datasets are stored under a path
+    scoped to the workflow, otherwise they are lost once the producing task finishes.
+    """
+    datasets = get_unregistered_boundary_datasets(pipeline, catalog)
+    if not datasets:
+        return
+
+    config = argo.runner.boundary_datasets
+    if config is None:
+        click.secho(
+            f"Found {len(datasets)} datasets crossing a task boundary without a catalog entry, "
+            "register them in the catalog or configure `runner.boundary_datasets`:",
+            fg="yellow",
+        )
+    else:
+        click.echo(f"Registering {len(datasets)} boundary datasets under {config.path.rstrip('/')}/<workflow>:")
+
+    for name, dataset in sorted(datasets.items()):
+        click.echo(
+            f"  {name}: {dataset['producer']} -> {', '.join(dataset['consumers'])} "
+            f"(format: {dataset['format'] or 'selected at runtime'})"
+        )
+
+
+# Task settings that do not apply to tasks executed by the worker pool
+POOL_UNSUPPORTED_SETTINGS = {
+    "retries": "preemptible retries",
+    "deadline": "deadlines",
+    "ladder": "escalation ladders",
+    "pipelines": "pipeline labels",
+}
+
+
+def report_pooled_tasks(tasks: list[dict[str, Any]], argo: ArgoConfig) -> None:
+    """Function to report the settings of pooled tasks that are not applied by the worker pool.
+
+    Pooled tasks are submitted to the task queue rather than run in a pod of their own, such that
+    retries on preemption, deadlines, escalation ladders and pod labels do not apply.
+    """
+    if argo.pool is None:
+        return
+
+    for task in tasks:
+        if task.get("machine_type") not in argo.pool.workers:
+            continue
+
+        if settings := [label for key, label in POOL_UNSUPPORTED_SETTINGS.items() if task.get(key)]:
+            click.secho(f"Pooled task `{task['name']}` ignores its {', '.join(settings)}", fg="yellow")
+
+
+def render_workflow_spec(
+    argo: ArgoConfig,
+    pipeline_tasks: list[dict[str, Any]],
+    semaphores: dict[str, int],
+    pipeline_name: str,
+    environment: str,
+    workflow_name: str,
+    traceparent: str | None = None,
+    conf_config_map: str | None = None,
+    pipeline_labels: dict[str, str] | None = None,
+) -> str:
+    """Function to render the Argo workflow spec.
+
+    Args:
+        argo: Argo configuration of the project
+        pipeline_tasks: Tasks of the workflow, in order of priority
+        semaphores: Concurrency limit per machine type
+        pipeline_name: Name of the pipeline
+        environment: Kedro environment to execute in
+        workflow_name: Name of the workflow
+        traceparent: Optional trace context to propagate to the pods
+        conf_config_map: Optional ConfigMap holding the configuration to mount into the pods
+        pipeline_labels: Optional labels marking the tasks of each pipeline, when merging pipelines
+    Returns:
+        Rendered workflow spec.
+    """
+    deployment = argo.deployment
+    concurrency = argo.concurrency or ConcurrencyConfig()
+
+    return render_jinja_template(
+        src=ARGO_TEMPLATES_DIR_PATH / "argo_wf_spec.tmpl",
+        trim_blocks=True,
+        lstrip_blocks=True,
+        pipeline_tasks=pipeline_tasks,
+        template=argo.template if argo.template else TemplateConfig(),
+        pipeline_name=pipeline_name,
+        image=deployment.get_task_image(num_gpu=0),
+        namespace=argo.namespace,
+        environment=environment,
+        workflow_name=workflow_name,
+        parallelism=concurrency.parallelism,
+        semaphores=semaphores,
+        semaphore_config_map=concurrency.config_map,
+        read_cache=argo.runner.read_cache,
+        pool=argo.pool,
+        machine_types=argo.machine_types,
+        images={name: deployment.get_task_image(machine_type.num_gpu) for name, machine_type in argo.machine_types.items()},
+        traceparent=traceparent,
+        conf={"config_map": conf_config_map, "path": CONF_MOUNT_PATH, "archive": CONF_ARCHIVE} if conf_config_map else None,
+        boundary_datasets=argo.runner.boundary_datasets,
+        deadlines=argo.deadlines,
+        pipeline_labels=pipeline_labels,
+        thread_env_vars=THREAD_ENV_VARS,
+        runtime_envs={name: machine_type.get_env_patch() for name, machine_type in argo.machine_types.items() if machine_type.get_env_patch()},
+    )
+
+
+def save_argo_template(argo_template: str, file_path: str | Path | None = None) -> str:
+    file_path = Path(file_path or Path("templates") / "argo-workflow-template.yml")
     file_path.parent.mkdir(parents=True, exist_ok=True)
     with open(file_path, "w") as f:
         f.write(argo_template)
@@ -469,33 +1337,230 @@ class ArgoTask:
     Argo's operating model slightly differs from Kedro's, i.e., while Kedro uses dataset
     dependencies to model relationships, Argo uses task dependencies."""
 
-    def __init__(self, node: Node, machine_type: MachineType):
+    def __init__(
+        self,
+        node: Node,
+        machine_type: MachineType,
+        name: str | None = None,
+        params: dict[str, Any] | None = None,
+        machine_type_name: str | None = None,
+        preemptible: PreemptibleConfig | None = None,
+    ):
         self._node = node
+        self._name = name or clean_name(node.name)
         self._parents = []
         self._machine_type = machine_type
+        self._machine_type_name = machine_type_name
+        self._preemptible = preemptible
+        self._params = params or {}
+        self._priority = None
 
     @property
     def node(self):
         return self._node
 
-    def add_parents(self, nodes: list[Node]):
-        self._parents.extend(nodes)
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def parents(self) -> list["ArgoTask"]:
+        return self._parents
+
+    @property
+    def machine_type(self) -> MachineType:
+        return self._machine_type
+
+    @property
+    def machine_type_name(self) -> str | None:
+        return self._machine_type_name
+
+    @property
+    def preemptible(self) -> PreemptibleConfig | None:
+        """Spot scheduling configuration, set if the task runs on preemptible machines."""
+        return self._preemptible
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return self._params
+
+    @property
+    def priority(self) -> int | None:
+        """Priority of the task, i.e., the length of the critical path starting at the task."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: int):
+        self._priority = priority
+
+    def add_parents(self, tasks: list["ArgoTask"]):
+        self._parents.extend(tasks)
+
+    def remove_parents(self, tasks: list["ArgoTask"]):
+        self._parents = [parent for parent in self._parents if parent not in tasks]
+
+    def ancestors(self) -> list["ArgoTask"]:
+        """Function to retrieve all upstream tasks, i.e., the parents and their ancestors."""
+        ancestors = {}
+        stack = list(self._parents)
+        while stack:
+            task = stack.pop()
+            if task.name not in ancestors:
+                ancestors[task.name] = task
+                stack.extend(task.parents)
+
+        return list(ancestors.values())
 
     def to_dict(self):
-        return {
-            "name": clean_name(self._node.name),
+        task = {
+            "name": self._name,
             "nodes": self._node.name,
-            "deps": [clean_name(parent.name) for parent in sorted(self._parents)],
+            "deps": sorted(parent.name for parent in self._parents),
             "mem": self._machine_type.mem,
             "cpu": self._machine_type.cpu,
             "num_gpu": self._machine_type.num_gpu,
         }
 
+        if self._machine_type_name is not None:
+            task["machine_type"] = self._machine_type_name
+
+        if self._priority is not None:
+            task["priority"] = self._priority
+
+        if getattr(self._node, "idempotent", False):
+            task["idempotent"] = True
+
+        # NOTE: Scheduling constraints of the machine type, extended with the
+        # spot scheduling constraints and retries for preemptible tasks.
+        node_selector = dict(self._machine_type.node_selector)
+        tolerations = list(self._machine_type.tolerations)
+        if self._preemptible is not None:
+            node_selector.update(self._preemptible.node_selector)
+            tolerations.extend(self._preemptible.tolerations)
+            task["retries"] = self._preemptible.retries
+
+        if node_selector:
+            task["node_selector"] = node_selector
+        if self._machine_type.affinity:
+            task["affinity"] = self._machine_type.affinity
+        if tolerations:
+            task["tolerations"] = tolerations
+
+        # NOTE: Thread pools are sized to the CPU allocation by the template, machine types
+        # overriding the thread count or environment patch the environment of the container.
+        if env := self._machine_type.get_env_patch():
+            task["env"] = env
+
+        # NOTE: Runtime parameters are passed to `kedro run` in its `--params` format
+        if self._params:
+            task["params"] = ",".join(f"{key}={value}" for key, value in self._params.items())
+
+        # NOTE: Partitioned nodes fan out over their partitions, where partitions
+        # are either resolved at submit time, or by a discovery task at runtime.
+        if isinstance(self._node, PartitionedNode):
+            if self._node.partitions_from is not None:
+                task["partitions_from"] = self._node.partitions_from
+                task["partitions_deps"] = sorted(
+                    ancestor.name
+                    for ancestor in self.ancestors()
+                    if self._node.partitions_from in clean_dependencies(ancestor.node.outputs)
+                )
+                task["deps"] = sorted(task["deps"] + [f"{task['name']}-partitions"])
+            else:
+                task["partitions"] = self._node.partitions
+
+        return task
+
+
+def merge_pipelines(pipelines: dict[str, Pipeline]) -> tuple[Pipeline, dict[str, list[str]]]:
+    """Function to merge pipelines into a single pipeline, running nodes shared by pipelines once.
+
+    Nodes are shared when their name and outputs match, nodes sharing a name or outputs
+    otherwise are conflicting, e.g., a fused and unfused variant of the same nodes.
+
+    Args:
+        pipelines: Dictionary mapping the name of a pipeline to the pipeline
+    Returns:
+        Merged pipeline, and dictionary mapping the name of each node to the pipelines it is part of.
+    """
+    nodes, members, producers = {}, {}, {}
+    for name, pipeline in pipelines.items():
+        for node in pipeline.nodes:
+            if node.name in nodes:
+                shared = nodes[node.name]
+                if set(node.outputs) != set(shared.outputs) or set(node.inputs) != set(shared.inputs):
+                    raise ValueError(
+                        f"Node `{node.name}` of pipeline `{name}` conflicts with the node of pipeline "
+                        f"`{members[node.name][0]}`, shared nodes should have the same inputs and outputs"
+                    )
+            else:
+                for output in node.outputs:
+                    if output in producers:
+                        raise ValueError(
+                            f"Dataset `{output}` is produced by node `{node.name}` of pipeline `{name}` and node "
+                            f"`{producers[output]}` of pipeline `{members[producers[output]][0]}`"
+                        )
+                    producers[output] = node.name
+                nodes[node.name] = node
+
+            members.setdefault(node.name, []).append(name)
+
+    return Pipeline(list(nodes.values())), members
+
+
+def get_pipeline_label(pipeline_name: str) -> str:
+    """Function to derive the name of the label marking the tasks of a pipeline, e.g., `pipeline-data_science`.
+
+    The name is used as pod label and task parameter, and is therefore restricted to
+    alphanumerics, dashes and underscores.
+    """
+    return ("pipeline-" + re.sub(r"[^A-Za-z0-9_-]", "-", pipeline_name).strip("-_"))[:63].rstrip("-_")
+
+
+def get_pipeline_labels(pipeline_names: list[str]) -> dict[str, str] | None:
+    """Function to derive the labels marking the tasks of each pipeline, when merging pipelines.
+
+    Args:
+        pipeline_names: Names of the pipelines merged into the workflow
+    Returns:
+        Dictionary mapping the name of each pipeline to its label, or None for a single pipeline.
+    """
+    if len(pipeline_names) < 2:
+        return None
+
+    labels = {name: get_pipeline_label(name) for name in pipeline_names}
+    if len(set(labels.values())) < len(labels):
+        raise click.ClickException(f"Pipelines {','.join(pipeline_names)} cannot be told apart by their labels {sorted(labels.values())}")
+
+    return labels
+
+
+def set_task_pipelines(
+    tasks: list[dict[str, Any]],
+    members: dict[str, list[str]],
+    pipeline_labels: dict[str, str] | None,
+) -> list[dict[str, Any]]:
+    """Function to label the Argo tasks with the pipelines they are part of, when merging pipelines.
+
+    Args:
+        tasks: Argo tasks, as produced by `ArgoTask.to_dict`
+        members: Dictionary mapping the name of each node to the pipelines it is part of, see `merge_pipelines`
+        pipeline_labels: Dictionary mapping the name of each pipeline to its label, see `get_pipeline_labels`
+    Returns:
+        Argo tasks, with their pipeline labels set.
+    """
+    if pipeline_labels is not None:
+        for task in tasks:
+            task["pipelines"] = [pipeline_labels[name] for name in members[task["nodes"]]]
+
+    return tasks
+
 
 def get_argo_dag(
     pipeline: Pipeline, 
     machine_types: dict[str, MachineType],
     default_machine_type: str,
+    preemptible: PreemptibleConfig | None = None,
 ) -> dict[str, ArgoTask]:
     """Function to convert the Kedro pipeline into Argo Tasks. The function
     iterates the nodes of the pipeline and generates Argo tasks with dependencies.
@@ -505,6 +1570,8 @@ def get_argo_dag(
     NOTE: This function is now agnostic to the fact that nodes might be fused. The nodes
     returned as part of the pipeline may optionally contain FusedNodes, which have correct
     inputs and outputs for the perspective of the Argo Task.
+
+    Nodes flagged as preemptible are scheduled on spot machines, as configured by `preemptible`.
     """
     tasks = {}
 
@@ -513,15 +1580,21 @@ def get_argo_dag(
     # allowing us to easily translate the Kedro DAG to an Argo WF.
     for group in pipeline.grouped_nodes:
         for target_node in group:
+            machine_type = target_node.machine_type if isinstance(target_node, Node) and target_node.machine_type is not None else default_machine_type
             try:
-                task = ArgoTask(target_node, machine_types[target_node.machine_type] if isinstance(target_node, Node) and target_node.machine_type is not None else machine_types[default_machine_type])
+                task = ArgoTask(
+                    target_node,
+                    machine_types[machine_type],
+                    machine_type_name=machine_type,
+                    preemptible=(preemptible or PreemptibleConfig()) if getattr(target_node, "preemptible", False) else None,
+                )
             except KeyError as e:
                 click.echo(f"Machine type not found for node `{target_node.name}`", err=True)
                 raise KeyError(f"Machine type `{target_node.machine_type}` not found for node `{target_node.name}`")
             
             task.add_parents(
                 [
-                    parent.node
+                    parent
                     for parent in tasks.values()
                     if set(clean_dependencies(target_node.inputs)) & set(clean_dependencies(parent.node.outputs))
                 ]
@@ -532,6 +1605,316 @@ def get_argo_dag(
     return tasks
 
 
+def get_sweep_dag(
+    tasks: dict[str, ArgoTask],
+    sweep: dict[str, dict[str, Any]],
+) -> dict[str, ArgoTask]:
+    """Function to expand the Argo tasks for a parameter sweep.
+
+    Tasks that consume any of the swept parameters, and all of their downstream tasks,
+    are duplicated per sweep point, while the remaining upstream tasks are shared, i.e.,
+    executed only once. The duplicated tasks receive the parameter overrides of the sweep
+    point, alongside a `sweep_point` parameter that can be used to resolve point specific
+    catalog paths, e.g., `${runtime_params:sweep_point}`.
+
+    Args:
+        tasks: Argo tasks in topological order, as produced by `get_argo_dag`
+        sweep: Dictionary mapping the name of a sweep point to its parameter overrides
+    Returns:
+        Argo tasks in topological order.
+    """
+    sweep = {point: flatten_params(params or {}) for point, params in sweep.items()}
+
+    # NOTE: Overrides are passed as `--params`, which Kedro splits on commas, values that
+    # do not survive the round trip would otherwise silently run with the wrong value.
+    for point, params in sweep.items():
+        for key, value in {**params, "sweep_point": point}.items():
+            if isinstance(value, (list, tuple, dict)) or "," in str(value):
+                raise ValueError(
+                    f"Parameter `{key}` of sweep point `{point}` is not a scalar without commas, "
+                    f"which cannot be passed as `--params`: {value!r}"
+                )
+    swept = {key for params in sweep.values() for key in params}
+
+    dependent = set()
+    for name, task in tasks.items():
+        if uses_params(task.node, swept) or any(parent.node.name in dependent for parent in task.parents):
+            dependent.add(name)
+
+    sweep_tasks = {name: task for name, task in tasks.items() if name not in dependent}
+    for point, params in sweep.items():
+        copies = {}
+        for name, task in tasks.items():
+            if name not in dependent:
+                continue
+
+            copies[name] = ArgoTask(
+                task.node,
+                task.machine_type,
+                name=f"{task.name}-{clean_name(point)}",
+                params={**task.params, **params, "sweep_point": point},
+                machine_type_name=task.machine_type_name,
+                preemptible=task.preemptible,
+            )
+            copies[name].add_parents([copies.get(parent.node.name, parent) for parent in task.parents])
+            sweep_tasks[f"{name}-{point}"] = copies[name]
+
+    return sweep_tasks
+
+
+def reduce_dependencies(tasks: dict[str, ArgoTask]) -> int:
+    """Function to compute the transitive reduction of the task dependencies.
+
+    A dependency on a parent is redundant if the parent is also an ancestor of any of the
+    other parents, as the dependency is implied by that path. Removing these dependencies
+    does not alter the execution order, but reduces the size of the workflow spec.
+
+    Args:
+        tasks: Argo tasks in topological order, as produced by `get_argo_dag`
+    Returns:
+        Number of dependencies removed.
+    """
+    # NOTE: Ancestors are tracked as bitsets, indexed by the position of the task
+    index = {task.name: idx for idx, task in enumerate(tasks.values())}
+    ancestors = {}
+    removed = 0
+
+    for task in tasks.values():
+        reachable = 0
+        for parent in task.parents:
+            reachable |= ancestors[parent.name]
+
+        redundant = [parent for parent in task.parents if reachable >> index[parent.name] & 1]
+        task.remove_parents(redundant)
+        removed += len(redundant)
+
+        ancestors[task.name] = reachable
+        for parent in task.parents:
+            ancestors[task.name] |= 1 << index[parent.name]
+
+    return removed
+
+
+def set_task_priorities(
+    tasks: dict[str, ArgoTask],
+    durations: dict[str, float] | None = None,
+) -> dict[str, ArgoTask]:
+    """Function to prioritise the Argo tasks by their critical path.
+
+    The priority of a task is the length of the longest path from the task to any
+    leaf of the DAG, i.e., the remaining time of the workflow once the task starts.
+    Tasks on the critical path therefore receive the highest priority. Durations of
+    tasks default to an estimate, i.e., the number of Kedro nodes the task runs.
+
+    Args:
+        tasks: Argo tasks in topological order, as produced by `get_argo_dag`
+        durations: Optional dictionary mapping task names to historical durations in seconds
+    Returns:
+        Argo tasks in topological order, with their priority set.
+    """
+    durations = durations or {}
+    critical_path = get_critical_path(
+        {task.name: [parent.name for parent in task.parents] for task in tasks.values()},
+        {task.name: durations.get(task.name, get_task_estimate(task)) for task in tasks.values()},
+    )
+    for task in tasks.values():
+        task.priority = math.ceil(critical_path[task.name])
+
+    return tasks
+
+
+def get_task_estimate(task: ArgoTask) -> int:
+    """Function to estimate the duration of a task without history, i.e., the number of Kedro nodes it runs."""
+    return len(getattr(task.node, "_nodes", [task.node]))
+
+
+def get_critical_path(deps: dict[str, list[str]], durations: dict[str, float]) -> dict[str, float]:
+    """Function to compute the length of the longest path from each task to any leaf of the DAG.
+
+    Args:
+        deps: Dictionary mapping task names to the names of their dependencies
+        durations: Dictionary mapping task names to their durations
+    Returns:
+        Dictionary mapping task names to the length of their critical path.
+    """
+    children = {name: [] for name in deps}
+    for name, parents in deps.items():
+        for parent in parents:
+            children[parent].append(name)
+
+    critical_path = {}
+    for name in reversed(list(TopologicalSorter(deps).static_order())):
+        critical_path[name] = durations[name] + max((critical_path[child] for child in children[name]), default=0)
+
+    return critical_path
+
+
+def prioritise_tasks(tasks: list[dict[str, Any]], durations: dict[str, float]) -> list[dict[str, Any]]:
+    """Function to prioritise rendered Argo tasks by their critical path, see `set_task_priorities`.
+
+    Args:
+        tasks: Argo tasks, as produced by `ArgoTask.to_dict`
+        durations: Dictionary mapping task names to their durations, or estimates thereof
+    Returns:
+        Argo tasks with their priority set, by descending priority.
+    """
+    critical_path = get_critical_path({task["name"]: task["deps"] for task in tasks}, durations)
+    tasks = [{**task, "priority": math.ceil(critical_path[task["name"]])} for task in tasks]
+    return sorted(tasks, key=lambda task: -task["priority"])
+
+
+def set_task_deadlines(
+    tasks: list[dict[str, Any]],
+    history: dict[str, list[float]],
+    config: DeadlinesConfig,
+) -> list[dict[str, Any]]:
+    """Function to bound the Argo tasks by deadlines, derived from their recorded durations.
+
+    The deadline of a task is a multiple of a percentile of its durations, tasks exceeding
+    their deadline are retried on another node. Idempotent tasks exceeding a percentile of
+    their durations start a backup, if speculation is enabled. Tasks without sufficient
+    history are not bounded.
+
+    Args:
+        tasks: Argo tasks, as produced by `ArgoTask.to_dict`
+        history: Dictionary mapping task names to their recorded durations in seconds
+        config: Deadlines configuration
+    Returns:
+        Argo tasks, with their deadline and retries set.
+    """
+    for task in tasks:
+        durations = history.get(task["name"], [])[-config.history:]
+        if len(durations) < config.min_history:
+            continue
+
+        task["deadline"] = max(config.min_deadline, math.ceil(config.factor * percentile(durations, config.percentile)))
+        task["retries"] = max(task.get("retries", 0), config.retries)
+        if config.speculate is not None and task.get("idempotent"):
+            task["speculate_after"] = math.ceil(percentile(durations, config.speculate))
+
+    return tasks
+
+
+def set_task_escalations(
+    tasks: list[dict[str, Any]],
+    machine_types: dict[str, MachineType],
+    config: EscalationConfig,
+    escalations: dict[str, str] | None = None,
+    limits: dict[str, int] | None = None,
+) -> list[dict[str, Any]]:
+    """Function to let the Argo tasks escalate through a ladder of machine types when running out of memory.
+
+    The ladder of a task is the ladder of its node, or the global ladder. Tasks of a machine
+    type on the ladder escalate through the subsequent machine types, other tasks through the
+    machine types of the ladder with more memory, that are scheduled like the machine type of
+    the task, as retries keep its scheduling constraints, image and semaphore. Every retry runs
+    on the next machine type of the ladder, with its memory and CPU, the last machine type is
+    used for remaining retries. Tasks start on the machine type they escalated to in previous
+    workflows.
+
+    Args:
+        tasks: Argo tasks, as produced by `ArgoTask.to_dict`
+        machine_types: Machine types by name
+        config: Escalation configuration
+        escalations: Dictionary mapping task names to the machine type they escalated to
+        limits: Dictionary mapping machine types to their concurrency limit
+    Returns:
+        Argo tasks, with their ladder and retries set.
+    """
+    escalations, limits = escalations or {}, limits or {}
+    for task in tasks:
+        ladder = config.nodes.get(task["nodes"], config.ladder)
+        for name in ladder:
+            if name not in machine_types:
+                raise ValueError(f"Machine type `{name}` of the escalation ladder is not configured")
+
+        if task.get("machine_type") in ladder:
+            rungs = ladder[ladder.index(task["machine_type"]) :]
+        else:
+            machine_type = machine_types[task["machine_type"]]
+            rungs = [task["machine_type"]] + [
+                name
+                for name in ladder
+                if machine_types[name].mem > task["mem"]
+                and machine_types[name].is_scheduled_like(machine_type)
+                and limits.get(name) == limits.get(task["machine_type"])
+            ]
+
+        if escalations.get(task["name"]) in rungs:
+            rungs = rungs[rungs.index(escalations[task["name"]]) :]
+
+        # NOTE: The first rung of tasks outside of the ladder is the machine type of the task itself
+        mems = [machine_types[name].mem if name in ladder else task["mem"] for name in rungs]
+        cpus = [machine_types[name].cpu if name in ladder else task["cpu"] for name in rungs]
+        task["mem"], task["cpu"] = mems[0], cpus[0]
+        if len(rungs) > 1:
+            task["retries"] = max(task.get("retries", 0), len(rungs) - 1)
+            task[LADDER_PARAMETER] = ",".join(str(name) for name in rungs)
+
+        # NOTE: Resources are selected by the index of the attempt, i.e., every attempt requires a rung
+        padding = task.get("retries", 0) + 1 - len(rungs)
+        task["mem_ladder"] = ",".join(str(mem) for mem in mems + mems[-1:] * padding)
+        task["cpu_ladder"] = ",".join(str(cpu) for cpu in cpus + cpus[-1:] * padding)
+
+    return tasks
+
+
+def get_semaphores(
+    tasks: dict[str, ArgoTask],
+    concurrency: ConcurrencyConfig,
+) -> dict[str, int]:
+    """Function to compute the semaphore limits of the machine types used by the tasks.
+
+    Machine types without a concurrency limit are bounded by the number of tasks, i.e., unlimited.
+
+    Args:
+        tasks: Argo tasks
+        concurrency: Concurrency configuration
+    Returns:
+        Dictionary mapping the machine type to its concurrency limit, empty when no limits are configured.
+    """
+    if not concurrency.machine_types:
+        return {}
+
+    return {
+        task.machine_type_name: concurrency.machine_types.get(task.machine_type_name, len(tasks))
+        for task in tasks.values()
+    }
+
+
+def flatten_params(params: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Function to flatten nested parameters into dot separated keys."""
+    flattened = {}
+    for key, value in params.items():
+        if isinstance(value, dict):
+            flattened.update(flatten_params(value, prefix=f"{prefix}{key}."))
+        else:
+            flattened[f"{prefix}{key}"] = value
+
+    return flattened
+
+
+def uses_params(node: Node, keys: Iterable[str]) -> bool:
+    """Function to check whether the node consumes any of the given parameters.
+
+    Args:
+        node: node to check
+        keys: dot separated parameter keys
+    Returns:
+        True if the node consumes a parameter that is, contains or is contained by any of the keys.
+    """
+    for el in node.inputs:
+        if el == "parameters":
+            return True
+
+        if el.startswith("params:"):
+            param = el[len("params:"):]
+            if any(key == param or key.startswith(f"{param}.") or param.startswith(f"{key}.") for key in keys):
+                return True
+
+    return False
+
+
 def clean_name(name: str) -> str:
     """Function to clean the node name.
 
@@ -0,0 +1,86 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from kedro.config import MissingConfigException
+from kedro.framework.project import settings
+
+from argo_kedro.framework.hooks.argo_hook import ARGO_CONFIG_PATTERNS, ArgoConfig
+
+# Directory holding the cached pipeline structure per pipeline, relative to the project
+COMPILE_CACHE_PATH = Path(".argo-kedro") / "compile"
+
+# Sources of the plugin, as the structure of the tasks is derived by the plugin
+PLUGIN_PATH = Path(__file__).parent.parent.parent
+
+
+def load_argo_config(project_path: Path, env: str = "base") -> ArgoConfig:
+    """Function to load the argo configuration of a project, without creating a Kedro session.
+
+    The configuration is loaded with the config loader of the project, such that custom
+    resolvers and merge strategies apply, but the catalog and hooks are not instantiated.
+
+    Args:
+        project_path: Path to the Kedro project
+        env: Kedro environment to load the configuration from
+    Returns:
+        Argo configuration of the project.
+    """
+    config_loader = settings.CONFIG_LOADER_CLASS(
+        conf_source=str(project_path / settings.CONF_SOURCE),
+        env=env,
+        **settings.CONFIG_LOADER_ARGS,
+    )
+    config_loader.config_patterns.update({"argo": ARGO_CONFIG_PATTERNS})
+
+    try:
+        return ArgoConfig.model_validate(config_loader["argo"])
+    except MissingConfigException:
+        return ArgoConfig.model_validate({})
+
+
+def get_source_fingerprint(paths: list[Path]) -> str:
+    """Function to fingerprint the Python sources under the given paths, by their modification time and size."""
+    digest = hashlib.sha256()
+    for path in paths:
+        for file in sorted(path.rglob("*.py")):
+            stat = file.stat()
+            digest.update(f"{file}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+
+    return digest.hexdigest()
+
+
+def get_cache_key(pipeline: str, argo_config: ArgoConfig, source_paths: list[Path]) -> str:
+    """Function to compute the key of the cached pipeline structure.
+
+    The structure of the tasks depends on the pipeline, the machine types and scheduling
+    configuration, and the sources of the project and plugin.
+    """
+    key = {
+        "pipeline": pipeline,
+        "argo": argo_config.model_dump(mode="json"),
+        "sources": get_source_fingerprint([*source_paths, PLUGIN_PATH]),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def load_cached_tasks(project_path: Path, pipeline: str, key: str) -> dict[str, Any] | None:
+    """Function to load the cached pipeline structure, if cached under the same key.
+
+    Returns:
+        Dictionary with the rendered `tasks` and their `semaphores`, or None on a cache miss.
+    """
+    cache_path = project_path / COMPILE_CACHE_PATH / f"{pipeline}.json"
+    if not cache_path.exists():
+        return None
+
+    cached = json.loads(cache_path.read_text())
+    return cached["value"] if cached.get("key") == key else None
+
+
+def save_cached_tasks(project_path: Path, pipeline: str, key: str, value: dict[str, Any]) -> None:
+    """Function to cache the pipeline structure, replacing the previous entry of the pipeline."""
+    cache_path = project_path / COMPILE_CACHE_PATH / f"{pipeline}.json"
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps({"key": key, "value": value}))
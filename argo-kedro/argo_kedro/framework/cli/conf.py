@@ -0,0 +1,205 @@
+import fnmatch
+import glob
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import tarfile
+from functools import cache
+from pathlib import Path
+
+# Path the configuration archive is mounted at in each pod, passed to Kedro as `--conf-source`
+CONF_MOUNT_PATH = "/argo-kedro-conf"
+CONF_ARCHIVE = "conf.tar.gz"
+
+# ConfigMaps are limited to 1MiB, binary data is stored base64 encoded
+MAX_ARCHIVE_SIZE = 768 * 1024
+
+# Credentials are never packaged, as the ConfigMap is readable by anyone with access to the
+# namespace, matching the `conf/**/*credentials*` pattern of the Kedro `.dockerignore`
+CONF_EXCLUDE_PATTERNS = ["*credentials*"]
+
+# File recording the source hash of the last published images, relative to the project
+BUILD_STATE_PATH = Path(".argo-kedro") / "images.json"
+
+
+def package_conf(conf_path: Path, environments: list[str]) -> bytes:
+    """Function to package the configuration of the given environments as a compressed archive.
+
+    The archive is laid out as expected by Kedro for a compressed `--conf-source`, i.e., with
+    the environments in a single top-level directory. The archive is reproducible, such that
+    unchanged configuration results in the same archive. Credentials files are excluded, these
+    should be provided to the pods through a Secret.
+
+    Args:
+        conf_path: Path to the configuration directory of the project
+        environments: Environments to package, e.g., `base` and the environment to run in
+    Returns:
+        Archive as `tar.gz` bytes.
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as compressed:
+        with tarfile.open(fileobj=compressed, mode="w") as archive:
+            for environment in environments:
+                for path in sorted((conf_path / environment).rglob("*")):
+                    if not path.is_file() or any(fnmatch.fnmatch(path.name, pattern) for pattern in CONF_EXCLUDE_PATTERNS):
+                        continue
+
+                    info = tarfile.TarInfo(f"{conf_path.name}/{path.relative_to(conf_path).as_posix()}")
+                    info.size = path.stat().st_size
+                    with open(path, "rb") as f:
+                        archive.addfile(info, f)
+
+    return buffer.getvalue()
+
+
+def get_conf_config_map_name(prefix: str, archive: bytes) -> str:
+    """Function to derive the name of the ConfigMap holding the archive, from its contents.
+
+    ConfigMaps are addressed by content, such that running workflows are not affected by
+    the configuration of subsequent submissions.
+    """
+    return f"{prefix}-{hashlib.sha256(archive).hexdigest()[:12]}"
+
+
+def _read_ignore_patterns(context: Path) -> list[tuple[str, bool]]:
+    dockerignore = context / ".dockerignore"
+    if not dockerignore.exists():
+        return []
+
+    patterns = []
+    for line in dockerignore.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        patterns.append((os.path.normpath(line.removeprefix("!").strip()).lstrip("/"), negated))
+
+    return patterns
+
+
+@cache
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Function to compile a `.dockerignore` pattern, following the Go `filepath.Match` syntax
+    extended with `**`, which matches any number of directories."""
+    regex, i = "", 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            regex, i = regex + "(.*/)?", i + 3
+            continue
+        if pattern.startswith("**", i):
+            regex, i = regex + ".*", i + 2
+            continue
+
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        elif char == "[" and (end := pattern.find("]", i + 1)) != -1:
+            group = pattern[i + 1 : end]
+            regex += f"[^{group[1:]}]" if group.startswith("^") else f"[{group}]"
+            i = end
+        else:
+            regex += re.escape(char)
+        i += 1
+
+    return re.compile(f"{regex}$")
+
+
+def _is_ignored(path: str, patterns: list[tuple[str, bool]]) -> bool:
+    """Function to check whether a path is ignored, the last pattern matching the path or
+    one of its parent directories decides, where `!` exceptions include the path again."""
+    parts = path.split("/")
+    candidates = ["/".join(parts[: i + 1]) for i in range(len(parts))]
+
+    ignored = False
+    for pattern, negated in patterns:
+        if any(_compile_pattern(pattern).match(candidate) for candidate in candidates):
+            ignored = not negated
+
+    return ignored
+
+
+def _may_include(directory: str, patterns: list[tuple[str, bool]]) -> bool:
+    """Function to check whether an exception may include a file within an ignored directory."""
+    parts = directory.split("/")
+    for pattern, negated in patterns:
+        pattern_parts = pattern.split("/")
+        if negated and (
+            "**" in pattern
+            or len(pattern_parts) > len(parts)
+            and all(_compile_pattern(part).match(name) for part, name in zip(pattern_parts, parts))
+        ):
+            return True
+
+    return False
+
+
+def get_source_hash(context: Path, exclude: list[Path]) -> str:
+    """Function to compute the hash of the Docker build context.
+
+    Files excluded by the `.dockerignore` of the context, following its semantics including
+    `!` exceptions, and the excluded paths, e.g., the configuration directory, do not
+    contribute to the hash.
+
+    Args:
+        context: Docker build context directory
+        exclude: Paths to exclude from the hash
+    Returns:
+        Hash of the build context.
+    """
+    # NOTE: Excluded paths are appended, such that these take precedence over `!` exceptions
+    excluded = [
+        (glob.escape(path.resolve().relative_to(context.resolve()).as_posix()), False)
+        for path in exclude
+        if path.resolve().is_relative_to(context.resolve())
+    ]
+    patterns = _read_ignore_patterns(context) + excluded
+    digest = hashlib.sha256()
+
+    for root, dirs, files in os.walk(context):
+        relative_root = Path(root).relative_to(context)
+        # NOTE: Ignored directories are only skipped when no exception may include one of their files
+        dirs[:] = sorted(
+            name
+            for name in dirs
+            if not _is_ignored(directory := (relative_root / name).as_posix(), excluded)
+            and (not _is_ignored(directory, patterns) or _may_include(directory, patterns))
+        )
+
+        for name in sorted(files):
+            relative_path = (relative_root / name).as_posix()
+            if _is_ignored(relative_path, patterns):
+                continue
+
+            digest.update(relative_path.encode())
+            with open(Path(root) / name, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+
+    return digest.hexdigest()
+
+
+def is_image_current(project_path: Path, image: str, source_hash: str) -> bool:
+    """Function to check whether the image was last published from the same sources."""
+    state_path = project_path / BUILD_STATE_PATH
+    if not state_path.exists():
+        return False
+
+    return json.loads(state_path.read_text()).get(image) == source_hash
+
+
+def record_image(project_path: Path, image: str, source_hash: str) -> None:
+    """Function to record the source hash of a published image."""
+    state_path = project_path / BUILD_STATE_PATH
+    state = json.loads(state_path.read_text()) if state_path.exists() else {}
+    state[image] = source_hash
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2))
@@ -0,0 +1,141 @@
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+from argo_kedro.framework.cli.workflow import get_duration, get_task_nodes
+
+# File recording the durations of the tasks of previous workflows, relative to the project
+DURATIONS_PATH = Path(".argo-kedro") / "durations.json"
+
+# File recording the machine types tasks escalated to after running out of memory, relative to the project
+ESCALATIONS_PATH = Path(".argo-kedro") / "escalations.json"
+
+# Name of the task parameter holding the machine types a task escalates through
+LADDER_PARAMETER = "ladder"
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Function to compute the `q`-th percentile of the values, interpolating linearly between ranks."""
+    values = sorted(values)
+    rank = (len(values) - 1) * q / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def get_median_durations(history: dict[str, list[float]]) -> dict[str, float]:
+    """Function to estimate the duration of each task as the median of its recorded durations."""
+    return {name: percentile(values, 50) for name, values in history.items() if values}
+
+
+def load_durations(project_path: Path, pipeline_name: str) -> dict[str, list[float]]:
+    """Function to load the recorded durations of the tasks of a pipeline.
+
+    Returns:
+        Dictionary mapping task names to their durations in seconds, oldest first.
+    """
+    path = project_path / DURATIONS_PATH
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text()).get(pipeline_name, {}).get("tasks", {})
+
+
+def record_durations(
+    project_path: Path,
+    pipeline_name: str,
+    workflow: dict[str, Any],
+    history: int = 20,
+) -> int:
+    """Function to record the durations of the succeeded tasks of a workflow.
+
+    Workflows are recorded once, i.e., recording the same workflow again has no effect.
+
+    Args:
+        project_path: Path to the Kedro project, holding the durations
+        pipeline_name: Name of the pipeline the workflow runs
+        workflow: Workflow object, including its status
+        history: Number of durations to keep per task
+    Returns:
+        Number of recorded task durations.
+    """
+    path = project_path / DURATIONS_PATH
+    records = json.loads(path.read_text()) if path.exists() else {}
+    record = records.setdefault(pipeline_name, {"workflows": [], "tasks": {}})
+
+    name = workflow["metadata"]["name"]
+    if name in record["workflows"]:
+        return 0
+
+    # NOTE: Failed tasks are excluded, as their duration is bounded by their failure rather than their work
+    durations = {
+        task: get_duration(node)
+        for task, node in get_task_nodes(workflow).items()
+        if node["phase"] == "Succeeded" and get_duration(node) is not None
+    }
+    for task, duration in durations.items():
+        record["tasks"][task] = (record["tasks"].get(task, []) + [duration])[-history:]
+
+    record["workflows"] = (record["workflows"] + [name])[-history:]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(records, indent=2))
+    return len(durations)
+
+
+def is_out_of_memory(node: dict[str, Any]) -> bool:
+    """Function to determine whether the pod of a workflow status node was killed for exceeding its memory."""
+    return "OOMKilled" in node.get("message", "") or node.get("outputs", {}).get("exitCode") == "137"
+
+
+def load_escalations(project_path: Path, pipeline_name: str) -> dict[str, str]:
+    """Function to load the recorded escalations of the tasks of a pipeline.
+
+    Returns:
+        Dictionary mapping task names to the machine type they escalated to.
+    """
+    path = project_path / ESCALATIONS_PATH
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text()).get(pipeline_name, {})
+
+
+def record_escalations(project_path: Path, pipeline_name: str, workflow: dict[str, Any]) -> dict[str, str]:
+    """Function to record the machine types that tasks of a workflow escalated to after running out of memory.
+
+    Tasks escalate to the next machine type of their ladder on every retry, the machine type of
+    the last attempt is recorded for tasks of which an attempt ran out of memory.
+
+    Args:
+        project_path: Path to the Kedro project, holding the escalations
+        pipeline_name: Name of the pipeline the workflow runs
+        workflow: Workflow object, including its spec and status
+    Returns:
+        Dictionary mapping task names to the machine type they escalated to.
+    """
+    ladders = {
+        task["name"]: parameter["value"].split(",")
+        for template in workflow.get("spec", {}).get("templates", [])
+        for task in template.get("dag", {}).get("tasks", [])
+        for parameter in task.get("arguments", {}).get("parameters", [])
+        if parameter["name"] == LADDER_PARAMETER
+    }
+    nodes = workflow.get("status", {}).get("nodes", {})
+
+    escalations = {}
+    for task, node in get_task_nodes(workflow).items():
+        if task not in ladders or node["type"] != "Retry":
+            continue
+
+        attempts = [nodes[child] for child in node.get("children", []) if child in nodes]
+        if any(is_out_of_memory(attempt) for attempt in attempts):
+            escalations[task] = ladders[task][min(len(attempts), len(ladders[task])) - 1]
+
+    if escalations:
+        path = project_path / ESCALATIONS_PATH
+        records = json.loads(path.read_text()) if path.exists() else {}
+        records.setdefault(pipeline_name, {}).update(escalations)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(records, indent=2))
+
+    return escalations
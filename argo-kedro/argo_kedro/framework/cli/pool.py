@@ -0,0 +1,322 @@
+import json
+import os
+import threading
+import time
+import traceback
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import getLogger
+from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, urlparse
+
+from pydantic import BaseModel, Field
+
+from argo_kedro.pipeline.partitioned_node import PARTITION_ENV_VAR
+
+LOGGER = getLogger(__name__)
+
+
+class Assignment(BaseModel):
+    """Task assigned to a worker, i.e., the arguments of a single `kedro run` invocation."""
+
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    pipeline: str
+    nodes: str
+    machine_type: str
+    params: str = ""
+    partition: str = ""
+
+
+class TaskQueue:
+    """In-memory queue of assignments, with a queue per machine type.
+
+    Submitters block until their assignment completes, while workers pull assignments
+    for their machine type in submission order. Pulled assignments are leased to the
+    worker, which renews the lease through heartbeats. Assignments whose lease expires,
+    e.g., as the worker was preempted or ran out of memory, are requeued up to
+    `max_requeues` times, after which they fail.
+    """
+
+    def __init__(self, lease: float = 60.0, max_requeues: int = 3):
+        """Instantiates the queue.
+
+        Args:
+            lease: Number of seconds a pulled assignment is leased to a worker, without heartbeat
+            max_requeues: Number of times an assignment is requeued once its lease expired
+        """
+        self._condition = threading.Condition()
+        self._lease = lease
+        self._max_requeues = max_requeues
+        self._pending: dict[str, deque[Assignment]] = defaultdict(deque)
+        self._results: dict[str, int | None] = {}
+        self._leases: dict[str, tuple[Assignment, float]] = {}
+        self._requeues: dict[str, int] = defaultdict(int)
+
+    def submit(self, assignment: Assignment) -> None:
+        with self._condition:
+            self._results[assignment.id] = None
+            self._pending[assignment.machine_type].append(assignment)
+            self._condition.notify_all()
+
+    def _requeue_expired(self) -> None:
+        now = time.monotonic()
+        for assignment_id, (assignment, expires_at) in list(self._leases.items()):
+            if expires_at > now:
+                continue
+
+            del self._leases[assignment_id]
+            if self._requeues[assignment_id] >= self._max_requeues:
+                LOGGER.error(f"Lease of nodes `{assignment.nodes}` expired {self._max_requeues + 1} times, failing the assignment")
+                self._results[assignment_id] = 1
+            else:
+                LOGGER.warning(f"Lease of nodes `{assignment.nodes}` expired, requeueing the assignment")
+                self._requeues[assignment_id] += 1
+                self._pending[assignment.machine_type].appendleft(assignment)
+            self._condition.notify_all()
+
+    def next(self, machine_type: str, timeout: float | None = None) -> Assignment | None:
+        """Function to pull the next assignment for a machine type, and lease it to the worker.
+
+        Returns:
+            The next assignment, or None if no assignment was submitted within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                self._requeue_expired()
+                if self._pending[machine_type]:
+                    assignment = self._pending[machine_type].popleft()
+                    self._leases[assignment.id] = (assignment, time.monotonic() + self._lease)
+                    return assignment
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+
+                # NOTE: Waiting is bounded by the lease, such that expired leases are requeued
+                self._condition.wait(timeout=self._lease if remaining is None else min(remaining, self._lease))
+
+    def heartbeat(self, assignment_id: str) -> bool:
+        """Function to renew the lease of an assignment.
+
+        Returns:
+            Whether the assignment is still leased, i.e., its lease did not expire.
+        """
+        with self._condition:
+            self._requeue_expired()
+            if assignment_id not in self._leases:
+                return False
+
+            assignment, _ = self._leases[assignment_id]
+            self._leases[assignment_id] = (assignment, time.monotonic() + self._lease)
+            return True
+
+    def complete(self, assignment_id: str, returncode: int) -> None:
+        with self._condition:
+            # NOTE: Results of assignments that were failed after their lease expired are ignored
+            if assignment_id not in self._results or self._results[assignment_id] is not None:
+                return
+
+            self._leases.pop(assignment_id, None)
+            self._requeues.pop(assignment_id, None)
+            for pending in self._pending.values():
+                for assignment in [assignment for assignment in pending if assignment.id == assignment_id]:
+                    pending.remove(assignment)
+
+            self._results[assignment_id] = returncode
+            self._condition.notify_all()
+
+    def wait(self, assignment_id: str, timeout: float | None = None) -> int | None:
+        """Function to wait for an assignment to complete.
+
+        Returns:
+            Return code of the assignment, or None if it did not complete within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._results[assignment_id] is None:
+                self._requeue_expired()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if self._results[assignment_id] is not None or (remaining is not None and remaining <= 0):
+                    break
+
+                self._condition.wait(timeout=self._lease if remaining is None else min(remaining, self._lease))
+
+            return self._results.pop(assignment_id) if self._results[assignment_id] is not None else None
+
+
+class QueueRequestHandler(BaseHTTPRequestHandler):
+    """HTTP interface to the task queue.
+
+    - `POST /tasks` submits an assignment, and responds once it completed
+    - `GET /tasks/next?machine_type=<name>` pulls the next assignment, or responds with 204
+    - `POST /tasks/<id>/heartbeat` renews the lease of an assignment, or responds with 410 once expired
+    - `POST /tasks/<id>/result` reports the return code of an assignment
+    """
+
+    queue: TaskQueue
+    poll_timeout: float = 30.0
+
+    def log_message(self, format, *args):
+        LOGGER.debug(format, *args)
+
+    def _respond(self, status: int, body: dict | None = None):
+        content = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _read_body(self) -> dict:
+        return json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            return self._respond(200, {})
+
+        if url.path == "/tasks/next":
+            machine_type = parse_qs(url.query)["machine_type"][0]
+            assignment = self.queue.next(machine_type, timeout=self.poll_timeout)
+            return self._respond(200, assignment.model_dump()) if assignment else self._respond(204)
+
+        self._respond(404)
+
+    def do_POST(self):
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if parts == ["tasks"]:
+            assignment = Assignment.model_validate(self._read_body())
+            self.queue.submit(assignment)
+            returncode = self.queue.wait(assignment.id)
+            return self._respond(200 if returncode == 0 else 500, {"id": assignment.id, "returncode": returncode})
+
+        if len(parts) == 3 and parts[0] == "tasks" and parts[2] == "heartbeat":
+            return self._respond(200, {}) if self.queue.heartbeat(parts[1]) else self._respond(410, {})
+
+        if len(parts) == 3 and parts[0] == "tasks" and parts[2] == "result":
+            self.queue.complete(parts[1], self._read_body()["returncode"])
+            return self._respond(200, {})
+
+        self._respond(404)
+
+
+def create_queue_server(port: int, queue: TaskQueue | None = None, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Function to create the HTTP server exposing the task queue."""
+    handler = type("Handler", (QueueRequestHandler,), {"queue": queue or TaskQueue()})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+class Worker:
+    """Long-lived worker, executing assignments pulled from the task queue.
+
+    The worker runs the assignments sequentially in its own process, such that the cost of
+    starting the container, importing the project and bootstrapping Kedro is paid once.
+    """
+
+    def __init__(self, url: str, machine_type: str, run: Callable[[Assignment], int], heartbeat_interval: float = 10.0):
+        """Instantiates the worker.
+
+        Args:
+            url: URL of the task queue, e.g., `http://10.0.0.1:8000`
+            machine_type: Machine type of the worker, to pull assignments for
+            run: Function executing an assignment, returning its return code
+            heartbeat_interval: Interval, in seconds, to renew the lease of the running assignment
+        """
+        self._url = url.rstrip("/")
+        self._machine_type = machine_type
+        self._run = run
+        self._heartbeat_interval = heartbeat_interval
+
+    def _request(self, method: str, path: str, body: dict | None = None) -> tuple[int, dict | None]:
+        request = urllib.request.Request(
+            f"{self._url}{path}",
+            method=method,
+            data=json.dumps(body).encode() if body is not None else None,
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request) as response:
+            content = response.read()
+            return response.status, json.loads(content) if content else None
+
+    def _heartbeat(self, assignment: Assignment, done: threading.Event) -> None:
+        while not done.wait(self._heartbeat_interval):
+            try:
+                self._request("POST", f"/tasks/{assignment.id}/heartbeat")
+            except urllib.error.HTTPError as e:
+                if e.code == 410:
+                    LOGGER.warning(f"Lease of nodes `{assignment.nodes}` expired, the assignment was requeued")
+                    return
+            except urllib.error.URLError:
+                continue
+
+    def serve(self, max_tasks: int | None = None, retry_interval: float = 1.0) -> int:
+        """Function to pull and execute assignments, until `max_tasks` were executed.
+
+        Returns:
+            Number of executed assignments.
+        """
+        executed = 0
+        while max_tasks is None or executed < max_tasks:
+            try:
+                status, body = self._request("GET", f"/tasks/next?machine_type={self._machine_type}")
+            except urllib.error.URLError:
+                # NOTE: The queue may not be ready yet
+                time.sleep(retry_interval)
+                continue
+
+            if status == 204:
+                continue
+
+            assignment = Assignment.model_validate(body)
+            LOGGER.info(f"Running nodes `{assignment.nodes}` of pipeline `{assignment.pipeline}`")
+            done = threading.Event()
+            heartbeat = threading.Thread(target=self._heartbeat, args=(assignment, done), daemon=True)
+            heartbeat.start()
+            try:
+                returncode = self._run(assignment)
+            finally:
+                done.set()
+            self._request("POST", f"/tasks/{assignment.id}/result", {"returncode": returncode})
+            executed += 1
+
+        return executed
+
+
+def run_assignment(
+    assignment: Assignment,
+    project_path: Path,
+    env: str | None,
+    run: Callable[..., None],
+) -> int:
+    """Function to execute an assignment in the worker process.
+
+    Args:
+        assignment: Assignment to execute
+        project_path: Path to the Kedro project
+        env: Kedro environment to run in
+        run: Function running the nodes, with the arguments of `kedro run`
+    Returns:
+        Return code of the assignment, i.e., 0 on success.
+    """
+    if assignment.partition:
+        os.environ[PARTITION_ENV_VAR] = assignment.partition
+    else:
+        os.environ.pop(PARTITION_ENV_VAR, None)
+
+    try:
+        run(
+            project_path=project_path,
+            pipeline=assignment.pipeline,
+            nodes=assignment.nodes,
+            env=env,
+            params=assignment.params,
+        )
+        return 0
+    except Exception:
+        LOGGER.error(traceback.format_exc())
+        return 1
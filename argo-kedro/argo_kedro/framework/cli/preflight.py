@@ -0,0 +1,147 @@
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str
+from kedro.pipeline import Pipeline
+from pydantic import BaseModel
+
+from argo_kedro.framework.hooks.argo_hook import DatasetCheck, PreflightConfig
+
+# File recording the dataset versions that passed the preflight checks, relative to the project
+PREFLIGHT_CACHE_PATH = Path(".argo-kedro") / "preflight.json"
+
+
+class PreflightResult(BaseModel):
+    """Result of the preflight checks of an external input."""
+
+    dataset: str
+    ok: bool
+    version: str | None = None
+    error: str | None = None
+    cached: bool = False
+    duration: float = 0.0
+
+
+def get_external_inputs(pipeline: Pipeline) -> list[str]:
+    """Function to collect the inputs of the pipeline that are not produced by any of its nodes, nor parameters."""
+    return sorted(
+        dataset for dataset in pipeline.inputs() if not dataset.startswith("params:") and dataset != "parameters"
+    )
+
+
+def get_dataset_version(dataset: AbstractDataset) -> str | None:
+    """Function to determine the version of the data of a dataset.
+
+    For datasets on a fsspec filesystem, the version is the resolved load path and the
+    checksum of the object, i.e., its ETag or generation, as used by the read cache.
+
+    Returns:
+        Version of the data, or None if the dataset is not file based.
+    """
+    if not hasattr(dataset, "_fs") or not hasattr(dataset, "_get_load_path"):
+        return None
+
+    path = get_filepath_str(dataset._get_load_path(), getattr(dataset, "_protocol", "file"))
+    return f"{path}:{dataset._fs.checksum(path)}"
+
+
+def check_dataset(name: str, dataset: AbstractDataset | None, check: DatasetCheck | None = None) -> PreflightResult:
+    """Function to check that an external input exists, and optionally satisfies its schema and row count.
+
+    Args:
+        name: Name of the dataset
+        dataset: Dataset from the catalog, or None if not registered
+        check: Optional columns and minimum number of rows the data should satisfy, which loads the dataset
+    Returns:
+        Result of the checks.
+    """
+    if dataset is None:
+        return PreflightResult(dataset=name, ok=False, error="no catalog entry")
+
+    try:
+        if not dataset.exists():
+            return PreflightResult(dataset=name, ok=False, error="does not exist")
+
+        version = get_dataset_version(dataset)
+        if check is None or (not check.columns and check.min_rows is None):
+            return PreflightResult(dataset=name, ok=True, version=version)
+
+        data = dataset.load()
+        missing = sorted(set(check.columns) - set(getattr(data, "columns", [])))
+        if missing:
+            return PreflightResult(dataset=name, ok=False, version=version, error=f"missing columns {missing}")
+
+        if check.min_rows is not None and len(data) < check.min_rows:
+            return PreflightResult(
+                dataset=name, ok=False, version=version, error=f"{len(data)} rows, expected at least {check.min_rows}"
+            )
+
+        return PreflightResult(dataset=name, ok=True, version=version)
+    except Exception as e:
+        return PreflightResult(dataset=name, ok=False, error=f"{type(e).__name__}: {e}")
+
+
+def _get_cache_key(name: str, version: str, check: DatasetCheck | None) -> str:
+    key = f"{name}:{version}:{check.model_dump_json() if check else ''}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _check_cached(
+    name: str, dataset: AbstractDataset | None, check: DatasetCheck | None, cache: dict[str, Any]
+) -> PreflightResult:
+    # NOTE: Loading is only required for schema and row count checks, which are cached per version
+    if check is not None and dataset is not None:
+        try:
+            version = get_dataset_version(dataset)
+        except Exception:
+            version = None
+
+        if version is not None and _get_cache_key(name, version, check) in cache:
+            return PreflightResult(dataset=name, ok=True, version=version, cached=True)
+
+    return check_dataset(name, dataset, check)
+
+
+def run_preflight(
+    project_path: Path,
+    datasets: dict[str, AbstractDataset | None],
+    config: PreflightConfig,
+) -> list[PreflightResult]:
+    """Function to check the external inputs of a pipeline concurrently.
+
+    Datasets of which the version passed the same checks before are not loaded again, the
+    version is determined for every run, such that a new version of the data is checked.
+
+    Args:
+        project_path: Path to the Kedro project, holding the cache
+        datasets: Datasets to check by name, None for datasets without a catalog entry
+        config: Preflight configuration
+    Returns:
+        Results of the checks, in order of the datasets.
+    """
+    cache_path = project_path / PREFLIGHT_CACHE_PATH
+    cache = json.loads(cache_path.read_text()) if config.cache and cache_path.exists() else {}
+
+    def check(name: str) -> PreflightResult:
+        start = time.perf_counter()
+        result = _check_cached(name, datasets[name], config.datasets.get(name), cache)
+        result.duration = time.perf_counter() - start
+        return result
+
+    with ThreadPoolExecutor(max_workers=config.workers) as pool:
+        results = list(pool.map(check, datasets))
+
+    if config.cache:
+        for result in results:
+            if result.ok and not result.cached and result.version is not None and result.dataset in config.datasets:
+                cache[_get_cache_key(result.dataset, result.version, config.datasets[result.dataset])] = time.time()
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2))
+
+    return results
@@ -0,0 +1,231 @@
+import csv
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from kubernetes import client as k8s_client
+from pydantic import BaseModel, Field
+
+from argo_kedro.framework.cli.workflow import WORKFLOW_LABEL, get_api_client, parse_timestamp
+from argo_kedro.framework.metadata import RunRecord
+
+# Annotation linking an Argo pod to its node in the workflow status
+NODE_NAME_ANNOTATION = "workflows.argoproj.io/node-name"
+
+# Phases of a task, in order, from the creation of its pod until Argo marked it finished
+PHASES = ["pending", "image_pull", "startup", "run", "teardown"]
+
+
+class TaskTimings(BaseModel):
+    """Breakdown of the wall time of a single task pod, in seconds.
+
+    - `pending`: pod created until scheduled on a node
+    - `image_pull`: scheduled until the main container started, i.e., the init container, image pull and container creation
+    - `startup`: main container started until the first node started, i.e., interpreter start-up, Kedro bootstrap and catalog creation
+    - `run`: first node started until the last node finished
+    - `teardown`: last node finished until Argo marked the task finished, i.e., process exit and output collection
+
+    Phases that can not be determined are left empty, e.g., if the pod was garbage collected, or the
+    task did not report its run timings, in which case `run` spans the lifetime of the main container.
+
+    Boundary datasets stored by the task, i.e., without a catalog entry, are reported with their `format` and `size`.
+    """
+
+    name: str
+    machine_type: str
+    fused: bool | None = None
+    phase: str
+    pending: float | None = None
+    image_pull: float | None = None
+    startup: float | None = None
+    run: float | None = None
+    teardown: float | None = None
+    total: float | None = None
+    datasets: dict[str, dict[str, Any]] = Field(default={})
+
+
+class GroupTimings(BaseModel):
+    """Timings of the tasks of a machine type, aggregated for fused or unfused tasks."""
+
+    machine_type: str
+    fused: bool | None = None
+    tasks: int
+    total: dict[str, float | None]
+    mean: dict[str, float | None]
+
+
+def list_workflow_pods(
+    workflow: dict[str, Any],
+    from_file: str | Path | None = None,
+    api_client: k8s_client.ApiClient | None = None,
+) -> list[dict[str, Any]]:
+    """Function to list the pods of a workflow.
+
+    Args:
+        workflow: Workflow object
+        from_file: Optional path to a JSON file holding the pods, used as a local stand-in
+            for the Kubernetes API, e.g., `kubectl get pods -l workflows.argoproj.io/workflow=<name> -o json`.
+        api_client: Optional Kubernetes API client, defaults to the kubeconfig client
+    Returns:
+        Pod objects as dictionaries, in the Kubernetes API format.
+    """
+    if from_file is not None:
+        with open(from_file) as f:
+            return json.load(f)["items"]
+
+    api_client = api_client or get_api_client()
+    pods = k8s_client.CoreV1Api(api_client).list_namespaced_pod(
+        namespace=workflow["metadata"]["namespace"],
+        label_selector=f"{WORKFLOW_LABEL}={workflow['metadata']['name']}",
+    )
+    return [api_client.sanitize_for_serialization(pod) for pod in pods.items]
+
+
+def _elapsed(start: float | None, end: float | None) -> float | None:
+    if start is None or end is None:
+        return None
+
+    # NOTE: Kubernetes timestamps have a resolution of a second
+    return max(end - start, 0.0)
+
+
+def _timestamp(timestamp: str | None) -> float | None:
+    return parse_timestamp(timestamp).timestamp() if timestamp else None
+
+
+def get_task_timings(node: dict[str, Any], pod: dict[str, Any] | None) -> TaskTimings:
+    """Function to compute the timings of a task, from its workflow status node and pod.
+
+    Args:
+        node: Workflow status node of the task pod
+        pod: Pod of the task, if not garbage collected
+    Returns:
+        Timings of the task.
+    """
+    parameters = {parameter["name"]: parameter.get("value") for parameter in node.get("inputs", {}).get("parameters", [])}
+    outputs = {parameter["name"]: parameter.get("value") for parameter in node.get("outputs", {}).get("parameters", [])}
+    run_timings = json.loads(outputs.get("timings") or "{}")
+
+    created, scheduled, main_started, main_finished = None, None, None, None
+    if pod is not None:
+        created = _timestamp(pod["metadata"].get("creationTimestamp"))
+        for condition in pod.get("status", {}).get("conditions") or []:
+            if condition["type"] == "PodScheduled" and condition["status"] == "True":
+                scheduled = _timestamp(condition.get("lastTransitionTime"))
+
+        for status in pod.get("status", {}).get("containerStatuses") or []:
+            if status["name"] == "main":
+                state = status.get("state", {}).get("terminated") or status.get("state", {}).get("running") or {}
+                main_started = _timestamp(state.get("startedAt"))
+                main_finished = _timestamp(state.get("finishedAt"))
+
+    run_started = run_timings.get("started_at", main_started)
+    run_finished = run_timings.get("finished_at", main_finished)
+
+    return TaskTimings(
+        name=node["displayName"],
+        machine_type=parameters.get("machine_type")
+        or f"{parameters.get('cpu')}cpu-{parameters.get('mem')}Gi-{parameters.get('num_gpu')}gpu",
+        fused=run_timings["nodes"] > 1 if "nodes" in run_timings else None,
+        phase=node.get("phase", "Unknown"),
+        pending=_elapsed(created, scheduled),
+        image_pull=_elapsed(scheduled, main_started),
+        startup=_elapsed(main_started, run_timings.get("started_at")),
+        run=_elapsed(run_started, run_finished),
+        teardown=_elapsed(run_finished, _timestamp(node.get("finishedAt"))),
+        total=_elapsed(created or _timestamp(node.get("startedAt")), _timestamp(node.get("finishedAt"))),
+        datasets=run_timings.get("datasets", {}),
+    )
+
+
+def get_workflow_timings(workflow: dict[str, Any], pods: list[dict[str, Any]]) -> list[TaskTimings]:
+    """Function to compute the timings of every task pod of a workflow.
+
+    Pods of looped and retried tasks are reported individually.
+
+    Args:
+        workflow: Workflow object, including its status
+        pods: Pods of the workflow
+    Returns:
+        Timings per task pod, in order of start.
+    """
+    pods_by_node = {}
+    for pod in pods:
+        annotations = pod["metadata"].get("annotations") or {}
+        pods_by_node[annotations.get(NODE_NAME_ANNOTATION, pod["metadata"]["name"])] = pod
+
+    nodes = sorted(
+        (
+            node
+            for node in workflow.get("status", {}).get("nodes", {}).values()
+            if node.get("type") == "Pod" and node.get("templateName", "kedro") == "kedro"
+        ),
+        key=lambda node: node.get("startedAt") or "",
+    )
+
+    return [get_task_timings(node, pods_by_node.get(node.get("name"), pods_by_node.get(node.get("id")))) for node in nodes]
+
+
+def get_workflow_runs(workflow: dict[str, Any]) -> list[RunRecord]:
+    """Function to collect the runs recorded by the task pods of a workflow.
+
+    Tasks report their run through the `timings` output, if a metadata store is configured.
+
+    Args:
+        workflow: Workflow object, including its status
+    Returns:
+        Runs of the task pods.
+    """
+    runs = []
+    for node in workflow.get("status", {}).get("nodes", {}).values():
+        if node.get("type") != "Pod":
+            continue
+
+        outputs = {parameter["name"]: parameter.get("value") for parameter in node.get("outputs", {}).get("parameters", [])}
+        if (metadata := json.loads(outputs.get("timings") or "{}").get("metadata")) is not None:
+            runs.append(RunRecord(**metadata))
+
+    return runs
+
+
+def aggregate_timings(timings: list[TaskTimings]) -> list[GroupTimings]:
+    """Function to aggregate task timings per machine type, for fused and unfused tasks.
+
+    Phases that could not be determined for a task are excluded from its group.
+    """
+    groups = defaultdict(list)
+    for timing in timings:
+        groups[(timing.machine_type, timing.fused)].append(timing)
+
+    aggregated = []
+    for (machine_type, fused), group in sorted(groups.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+        total, mean = {}, {}
+        for phase in [*PHASES, "total"]:
+            values = [getattr(timing, phase) for timing in group if getattr(timing, phase) is not None]
+            total[phase] = sum(values) if values else None
+            mean[phase] = sum(values) / len(values) if values else None
+
+        aggregated.append(GroupTimings(machine_type=machine_type, fused=fused, tasks=len(group), total=total, mean=mean))
+
+    return aggregated
+
+
+def write_report(path: str | Path, timings: list[TaskTimings], groups: list[GroupTimings]) -> None:
+    """Function to export the report, as CSV with a row per task or as JSON, based on the file extension."""
+    if Path(path).suffix == ".csv":
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=[field for field in TaskTimings.model_fields if field != "datasets"])
+            writer.writeheader()
+            writer.writerows(timing.model_dump(exclude={"datasets"}) for timing in timings)
+        return
+
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "tasks": [timing.model_dump() for timing in timings],
+                "groups": [group.model_dump() for group in groups],
+            },
+            f,
+            indent=2,
+        )
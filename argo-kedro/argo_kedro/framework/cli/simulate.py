@@ -0,0 +1,296 @@
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+from pydantic import BaseModel, Field
+
+from argo_kedro.pipeline.partitioned_node import PARTITION_ENV_VAR
+
+# Templates of the workflow that run nodes, i.e., directly or on a warm worker of the pool
+SIMULATED_TEMPLATES = {"kedro", "kedro-pool"}
+
+
+class SimulatedTask(BaseModel):
+    """Task executed by the local simulator, i.e., a single `kedro run` invocation."""
+
+    name: str
+    command: list[str]
+    deps: list[str] = Field(default=[])
+    cpu: float
+    mem: float
+    num_gpu: int = 0
+    env: dict[str, str] = Field(default={})
+
+
+class TaskResult(BaseModel):
+    name: str
+    cpu: float
+    mem: float
+    num_gpu: int = 0
+    ready_at: float | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    returncode: int | None = None
+
+    @property
+    def phase(self) -> str:
+        if self.returncode is None:
+            return "Skipped"
+
+        return "Succeeded" if self.returncode == 0 else "Failed"
+
+    @property
+    def queued(self) -> float | None:
+        """Time between the task becoming ready, and the task starting."""
+        if self.started_at is None:
+            return None
+
+        return self.started_at - self.ready_at
+
+    @property
+    def duration(self) -> float | None:
+        if self.finished_at is None:
+            return None
+
+        return self.finished_at - self.started_at
+
+
+class SimulationReport(BaseModel):
+    tasks: list[TaskResult]
+    makespan: float
+    max_concurrency: int
+
+    @property
+    def parallelism(self) -> float:
+        """Achieved parallelism, i.e., the average number of tasks running."""
+        if not self.makespan:
+            return 0.0
+
+        return sum(task.duration or 0.0 for task in self.tasks) / self.makespan
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "makespan": self.makespan,
+            "max_concurrency": self.max_concurrency,
+            "parallelism": self.parallelism,
+            "tasks": [
+                {
+                    "name": task.name,
+                    "phase": task.phase,
+                    "cpu": task.cpu,
+                    "mem": task.mem,
+                    "num_gpu": task.num_gpu,
+                    "queued": task.queued,
+                    "duration": task.duration,
+                }
+                for task in self.tasks
+            ],
+        }
+
+
+class LocalSimulator:
+    """Local simulator for Argo workflows.
+
+    The simulator executes each task as a local subprocess, while respecting task dependencies
+    and a CPU, memory and optional GPU budget. Each running task reserves the resources of its
+    machine type, tasks that do not fit the remaining budget are queued until resources are
+    released, mimicking the scheduling behaviour of a cluster with limited capacity. Ready tasks
+    start in the order they are given, i.e., by descending priority for rendered workflows.
+    """
+
+    def __init__(
+        self,
+        cpu: float,
+        mem: float,
+        poll_interval: float = 0.05,
+        cwd: str | Path | None = None,
+        gpu: int | None = None,
+    ):
+        """Instantiates the simulator.
+
+        Args:
+            cpu: Number of CPUs available for tasks
+            mem: Memory, in Gi, available for tasks
+            poll_interval: Interval, in seconds, to poll running tasks
+            cwd: Working directory to run the tasks in
+            gpu: Optional number of GPUs available for tasks, GPUs are not budgeted if omitted
+        """
+        self._cpu = cpu
+        self._mem = mem
+        self._gpu = gpu
+        self._poll_interval = poll_interval
+        self._cwd = cwd
+
+    def run(self, tasks: list[SimulatedTask]) -> SimulationReport:
+        """Run the tasks, and report on their execution.
+
+        Args:
+            tasks: Tasks to execute, in topological order, ready tasks start in this order
+        Returns:
+            Report of the simulation.
+        """
+        # NOTE: Tasks exceeding the budget are capped, such that they run exclusively
+        results = {
+            task.name: TaskResult(
+                name=task.name,
+                cpu=min(task.cpu, self._cpu),
+                mem=min(task.mem, self._mem),
+                num_gpu=task.num_gpu if self._gpu is None else min(task.num_gpu, self._gpu),
+            )
+            for task in tasks
+        }
+        pending = {task.name: task for task in tasks}
+        running: dict[str, subprocess.Popen] = {}
+        failed: set[str] = set()
+        start = time.monotonic()
+        max_concurrency = 0
+
+        while pending or running:
+            now = time.monotonic() - start
+
+            # Collect finished tasks, and release their resources
+            for name, process in list(running.items()):
+                if process.poll() is not None:
+                    results[name].finished_at = now
+                    results[name].returncode = process.returncode
+                    if process.returncode != 0:
+                        failed.add(name)
+                    del running[name]
+
+            # Skip tasks downstream of failed tasks, as Argo would
+            for name, task in list(pending.items()):
+                if any(dep in failed for dep in task.deps):
+                    failed.add(name)
+                    del pending[name]
+
+            # Start ready tasks, in the order given, as long as they fit the budget
+            used_cpu = sum(results[name].cpu for name in running)
+            used_mem = sum(results[name].mem for name in running)
+            used_gpu = sum(results[name].num_gpu for name in running)
+            for name, task in list(pending.items()):
+                if any(results[dep].returncode != 0 for dep in task.deps):
+                    continue
+
+                if results[name].ready_at is None:
+                    results[name].ready_at = now
+
+                if used_cpu + results[name].cpu > self._cpu or used_mem + results[name].mem > self._mem:
+                    continue
+                if self._gpu is not None and used_gpu + results[name].num_gpu > self._gpu:
+                    continue
+
+                used_cpu += results[name].cpu
+                used_mem += results[name].mem
+                used_gpu += results[name].num_gpu
+                results[name].started_at = now
+                running[name] = subprocess.Popen(task.command, cwd=self._cwd, env={**os.environ, **task.env})
+                del pending[name]
+
+            max_concurrency = max(max_concurrency, len(running))
+            time.sleep(self._poll_interval)
+
+        return SimulationReport(
+            tasks=list(results.values()),
+            makespan=time.monotonic() - start,
+            max_concurrency=max_concurrency,
+        )
+
+
+def get_simulated_tasks(
+    pipeline_tasks: list[dict[str, Any]],
+    pipeline_name: str,
+    environment: str | None = None,
+) -> list[SimulatedTask]:
+    """Function to translate Argo tasks into tasks for the local simulator.
+
+    Partitioned tasks with static partitions are expanded into a task per partition, tasks
+    with partitions resolved at runtime process all partitions in a single task.
+
+    Args:
+        pipeline_tasks: Argo tasks, as produced by `ArgoTask.to_dict`
+        pipeline_name: Name of the pipeline to run
+        environment: Kedro environment to run the tasks in
+    Returns:
+        Tasks for the local simulator, in topological order.
+    """
+    tasks = []
+    expanded = {}
+    for task in pipeline_tasks:
+        command = ["kedro", "run", "--pipeline", task.get("pipeline", pipeline_name), "--nodes", task["nodes"]]
+        if environment is not None:
+            command.extend(["--env", environment])
+        if task.get("params"):
+            command.extend(["--params", task["params"]])
+
+        deps = [
+            dep
+            for parent in task["deps"]
+            if not parent.endswith("-partitions") or parent in expanded
+            for dep in expanded.get(parent, [parent])
+        ]
+        partitions = task.get("partitions") or [None]
+        expanded[task["name"]] = [
+            f"{task['name']}({idx}:{partition})" if partition is not None else task["name"]
+            for idx, partition in enumerate(partitions)
+        ]
+
+        for name, partition in zip(expanded[task["name"]], partitions):
+            tasks.append(
+                SimulatedTask(
+                    name=name,
+                    command=command,
+                    deps=deps,
+                    cpu=task["cpu"],
+                    mem=task["mem"],
+                    num_gpu=task.get("num_gpu", 0),
+                    env={PARTITION_ENV_VAR: partition} if partition is not None else {},
+                )
+            )
+
+    return tasks
+
+
+def load_pipeline_tasks(path: str | Path) -> list[dict[str, Any]]:
+    """Function to load the Argo tasks from a saved workflow template.
+
+    Args:
+        path: Path to the workflow template, e.g., `templates/argo-workflow-template.yml`
+    Returns:
+        Argo tasks, in the format produced by `ArgoTask.to_dict`.
+    """
+    with open(path) as f:
+        workflow = yaml.safe_load(f)
+
+    templates = {template["name"]: template for template in workflow["spec"]["templates"]}
+
+    # NOTE: Pooled tasks are simulated as regular tasks, the queue, workers and partition discovery
+    # tasks have no local equivalent, and are removed from the dependencies of their dependents.
+    dag_tasks = [
+        task
+        for task in templates[workflow["spec"]["entrypoint"]]["dag"]["tasks"]
+        if task.get("template", "kedro") in SIMULATED_TEMPLATES
+    ]
+    names = {task["name"] for task in dag_tasks}
+
+    pipeline_tasks = []
+    for task in dag_tasks:
+
+        parameters = {param["name"]: param.get("value") for param in task["arguments"]["parameters"]}
+        pipeline_tasks.append(
+            {
+                "name": task["name"],
+                "pipeline": parameters["pipeline"],
+                "nodes": parameters["kedro_nodes"],
+                "deps": [dep for dep in task.get("dependencies", []) if dep in names],
+                "mem": float(parameters["mem"]),
+                "cpu": float(parameters["cpu"]),
+                "num_gpu": int(parameters["num_gpu"]),
+                "params": parameters.get("params"),
+                "partitions": task.get("withItems"),
+            }
+        )
+
+    return pipeline_tasks
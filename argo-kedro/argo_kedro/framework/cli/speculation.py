@@ -0,0 +1,186 @@
+import copy
+import os
+import subprocess
+import time
+from datetime import datetime, timezone
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from kubernetes import client as k8s_client
+
+from argo_kedro.framework.cli.workflow import get_api_client, parse_timestamp
+
+LOGGER = getLogger(__name__)
+
+# Environment variable holding the number of seconds after which a task starts a backup
+SPECULATE_ENV_VAR = "ARGO_KEDRO_SPECULATE_AFTER"
+
+# Label of backup pods, referencing the pod of the task they back up
+BACKUP_LABEL = "argo-kedro/backup-of"
+
+NAMESPACE_PATH = Path("/var/run/secrets/kubernetes.io/serviceaccount/namespace")
+
+# Volumes injected by Argo, e.g., holding its executor, and by Kubernetes for the service account token
+_INJECTED_VOLUME_PREFIXES = ("var-run-argo", "kube-api-access")
+
+
+def get_backup_pod(pod: dict[str, Any], now: datetime | None = None) -> dict[str, Any]:
+    """Function to derive a backup pod from the pod of a task.
+
+    The backup runs the command of the main container on another node, without the Argo
+    executor, i.e., it is not tracked by Argo. The backup is owned by the pod of the task,
+    and bounded by the remaining deadline of the task.
+
+    Args:
+        pod: Pod of the task, as a dictionary
+        now: Current time, used to compute the remaining deadline
+    Returns:
+        Pod object for creation.
+    """
+    metadata, spec = pod["metadata"], pod["spec"]
+    main = next(container for container in spec["containers"] if container["name"] == "main")
+
+    # NOTE: Argo wraps the command of the main container in its emissary executor
+    command = [*main.get("command", []), *main.get("args", [])]
+    if "--" in command:
+        command = command[command.index("--") + 1 :]
+
+    # NOTE: Fields of the pod labels are resolved, as the backup does not carry the Argo labels
+    env = []
+    for variable in main.get("env", []):
+        if variable["name"] == SPECULATE_ENV_VAR:
+            continue
+
+        field_path = variable.get("valueFrom", {}).get("fieldRef", {}).get("fieldPath", "")
+        if field_path.startswith("metadata.labels['"):
+            label = field_path.removeprefix("metadata.labels['").removesuffix("']")
+            variable = {"name": variable["name"], "value": metadata.get("labels", {}).get(label, "")}
+        env.append(variable)
+
+    volume_mounts = [
+        mount for mount in main.get("volumeMounts", []) if not mount["name"].startswith(_INJECTED_VOLUME_PREFIXES)
+    ]
+    mounted = {mount["name"] for mount in volume_mounts}
+
+    # NOTE: The backup avoids the node of the task, which is likely the cause of the slowdown
+    affinity = copy.deepcopy(spec.get("affinity") or {})
+    required = affinity.setdefault("nodeAffinity", {}).setdefault("requiredDuringSchedulingIgnoredDuringExecution", {})
+    terms = required.setdefault("nodeSelectorTerms", [])
+    if not terms:
+        terms.append({})
+    for term in terms:
+        term.setdefault("matchExpressions", []).append(
+            {"key": "kubernetes.io/hostname", "operator": "NotIn", "values": [spec["nodeName"]]}
+        )
+
+    backup_spec = {
+        "restartPolicy": "Never",
+        "containers": [
+            {
+                "name": "main",
+                "image": main["image"],
+                "imagePullPolicy": main.get("imagePullPolicy", "IfNotPresent"),
+                "command": command,
+                "env": env,
+                "resources": main.get("resources", {}),
+                "volumeMounts": volume_mounts,
+            }
+        ],
+        "volumes": [volume for volume in spec.get("volumes", []) if volume["name"] in mounted],
+        "affinity": affinity,
+    }
+    for key in ("serviceAccountName", "nodeSelector", "tolerations", "imagePullSecrets", "securityContext"):
+        if spec.get(key):
+            backup_spec[key] = spec[key]
+
+    if spec.get("activeDeadlineSeconds") and pod.get("status", {}).get("startTime"):
+        elapsed = ((now or datetime.now(timezone.utc)) - parse_timestamp(pod["status"]["startTime"])).total_seconds()
+        backup_spec["activeDeadlineSeconds"] = max(int(spec["activeDeadlineSeconds"] - elapsed), 1)
+
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"{metadata['name']}-backup",
+            "namespace": metadata["namespace"],
+            "labels": {"app": "argo-kedro", BACKUP_LABEL: metadata["name"]},
+            "ownerReferences": [{"apiVersion": "v1", "kind": "Pod", "name": metadata["name"], "uid": metadata["uid"]}],
+        },
+        "spec": backup_spec,
+    }
+
+
+def run_speculative(
+    command: list[str],
+    speculate_after: float,
+    pod_name: str | None = None,
+    namespace: str | None = None,
+    api: k8s_client.CoreV1Api | None = None,
+    poll_interval: float = 10,
+) -> int:
+    """Function to run a task, and start a backup once it exceeds the given duration.
+
+    The task runs in a subprocess, once it exceeds `speculate_after` seconds a backup pod
+    is started on another node. The first to succeed wins, after which the other is
+    stopped. If the backup cannot be started, e.g., lacking permissions to create pods,
+    the task continues without a backup.
+
+    The other is stopped regardless of whether it is saving outputs, a partial write of the
+    loser may therefore replace an output saved by the winner. Speculation is hence limited
+    to nodes flagged `idempotent`, which should save their outputs atomically, e.g., to object
+    storage where an interrupted upload is discarded, rather than to a shared filesystem.
+
+    Args:
+        command: Command of the task
+        speculate_after: Number of seconds after which the backup is started
+        pod_name: Name of the pod of the task, defaults to the hostname
+        namespace: Namespace of the pod, defaults to the namespace of the service account
+        api: Optional Kubernetes core API, defaults to the in-cluster client
+        poll_interval: Interval in seconds at which the task and backup are polled
+    Returns:
+        Exit code of the task.
+    """
+    process = subprocess.Popen(command, env={key: value for key, value in os.environ.items() if key != SPECULATE_ENV_VAR})
+    try:
+        return process.wait(timeout=speculate_after)
+    except subprocess.TimeoutExpired:
+        pass
+
+    try:
+        api = api or k8s_client.CoreV1Api(get_api_client())
+        pod_name = pod_name or os.environ["HOSTNAME"]
+        namespace = namespace or NAMESPACE_PATH.read_text().strip()
+        pod = api.api_client.sanitize_for_serialization(api.read_namespaced_pod(pod_name, namespace))
+        backup = api.create_namespaced_pod(namespace, get_backup_pod(pod)).metadata.name
+    except Exception as e:
+        LOGGER.warning(f"Task exceeded {speculate_after:.0f}s, but no backup could be started: {e}")
+        return process.wait()
+
+    LOGGER.info(f"Task exceeded {speculate_after:.0f}s, started backup {backup}")
+    try:
+        while True:
+            returncode = process.poll()
+            phase = api.read_namespaced_pod(backup, namespace).status.phase
+            if returncode == 0:
+                return 0
+
+            if phase == "Succeeded":
+                LOGGER.info(f"Backup {backup} finished first")
+                return 0
+
+            # NOTE: Once the backup failed, the task is awaited, a failed task awaits the backup
+            if phase == "Failed":
+                return process.wait()
+
+            time.sleep(poll_interval)
+    finally:
+        if process.poll() is None:
+            process.terminate()
+            process.wait()
+
+        try:
+            api.delete_namespaced_pod(backup, namespace)
+        except k8s_client.ApiException as e:
+            if e.status != 404:
+                LOGGER.warning(f"Could not delete backup {backup}: {e}")
@@ -0,0 +1,385 @@
+import base64
+import copy
+import json
+import re
+from datetime import datetime
+from functools import cache
+from pathlib import Path
+from typing import Any, Iterator
+
+from kubernetes import client as k8s_client
+from kubernetes import config, watch
+
+from argo_kedro.runners.boundary import BOUNDARY_PATH_ENV_VAR
+
+ARGO_GROUP = "argoproj.io"
+ARGO_VERSION = "v1alpha1"
+WORKFLOW_PLURAL = "workflows"
+WORKFLOW_LABEL = "workflows.argoproj.io/workflow"
+COMPLETED_PHASES = {"Succeeded", "Failed", "Error"}
+
+# Number of seconds after which the API server closes a watch, which is then restarted
+WATCH_TIMEOUT_SECONDS = 300
+
+# Argo node types that correspond to a task of the DAG, looped tasks are
+# represented by a TaskGroup with a child node per item, and retried tasks
+# by a Retry node with a child node per attempt.
+TASK_NODE_TYPES = {"Pod", "Retry", "TaskGroup", "Skipped"}
+LOOP_ITEM_PATTERN = re.compile(r".+\(\d+(:.*)?\)$")
+
+
+@cache
+def get_api_client() -> k8s_client.ApiClient:
+    """Function to retrieve the Kubernetes API client.
+
+    The client is created once per process from the kubeconfig, or from the service
+    account within a pod. The Argo CRD is addressed directly by its group, version and
+    plural, avoiding API discovery.
+    """
+    try:
+        config.load_kube_config()
+    except config.ConfigException:
+        config.load_incluster_config()
+    return k8s_client.ApiClient()
+
+
+def load_workflow(
+    name: str | None,
+    namespace: str | None,
+    from_file: str | Path | None = None,
+    api_client: k8s_client.ApiClient | None = None,
+) -> dict[str, Any]:
+    """Function to load an Argo workflow object.
+
+    Args:
+        name: Name of the workflow
+        namespace: Namespace of the workflow
+        from_file: Optional path to a JSON file holding the workflow, used as a local
+            stand-in for the Kubernetes API, e.g., `argo get <name> -o json`.
+        api_client: Optional Kubernetes API client, defaults to the kubeconfig client
+    Returns:
+        Workflow object as a dictionary.
+    """
+    if from_file is not None:
+        with open(from_file) as f:
+            return json.load(f)
+
+    return k8s_client.CustomObjectsApi(api_client or get_api_client()).get_namespaced_custom_object(
+        ARGO_GROUP, ARGO_VERSION, namespace, WORKFLOW_PLURAL, name
+    )
+
+
+def submit_workflow(
+    workflow: dict[str, Any],
+    namespace: str,
+    api_client: k8s_client.ApiClient | None = None,
+) -> str:
+    """Function to submit an Argo workflow to the cluster.
+
+    Args:
+        workflow: Workflow object to submit
+        namespace: Namespace to submit the workflow in
+        api_client: Optional Kubernetes API client, defaults to the kubeconfig client
+    Returns:
+        Name of the created workflow.
+    """
+    response = k8s_client.CustomObjectsApi(api_client or get_api_client()).create_namespaced_custom_object(
+        ARGO_GROUP, ARGO_VERSION, namespace, WORKFLOW_PLURAL, workflow
+    )
+    return response["metadata"]["name"]
+
+
+def apply_config_map(
+    name: str,
+    namespace: str,
+    data: dict[str, str] | None = None,
+    api_client: k8s_client.ApiClient | None = None,
+    binary_data: dict[str, bytes] | None = None,
+) -> None:
+    """Function to create or replace a ConfigMap, e.g., holding the semaphore limits of a workflow.
+
+    Args:
+        name: Name of the ConfigMap
+        namespace: Namespace of the ConfigMap
+        data: Data of the ConfigMap
+        api_client: Optional Kubernetes API client, defaults to the kubeconfig client
+        binary_data: Binary data of the ConfigMap, e.g., a compressed archive
+    """
+    api = k8s_client.CoreV1Api(api_client or get_api_client())
+    body = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": name, "namespace": namespace}, "data": data or {}}
+    if binary_data:
+        body["binaryData"] = {key: base64.b64encode(value).decode() for key, value in binary_data.items()}
+
+    try:
+        api.replace_namespaced_config_map(name, namespace, body)
+    except k8s_client.ApiException as e:
+        if e.status != 404:
+            raise
+
+        api.create_namespaced_config_map(namespace, body)
+
+
+def add_workflow_owner(
+    name: str,
+    namespace: str,
+    workflow_name: str,
+    api_client: k8s_client.ApiClient | None = None,
+) -> None:
+    """Function to add a workflow as owner of a ConfigMap.
+
+    The ConfigMap is garbage collected by Kubernetes once all of its owners are deleted,
+    i.e., ConfigMaps shared by multiple workflows are kept until the last one is deleted.
+
+    Args:
+        name: Name of the ConfigMap
+        namespace: Namespace of the ConfigMap and workflow
+        workflow_name: Name of the workflow owning the ConfigMap
+        api_client: Optional Kubernetes API client, defaults to the kubeconfig client
+    """
+    api_client = api_client or get_api_client()
+    workflow = load_workflow(workflow_name, namespace, api_client=api_client)
+    owner = {
+        "apiVersion": f"{ARGO_GROUP}/{ARGO_VERSION}",
+        "kind": "Workflow",
+        "name": workflow_name,
+        "uid": workflow["metadata"]["uid"],
+    }
+
+    # NOTE: Owner references are merged by uid, i.e., the owner is appended to the existing owners
+    k8s_client.CoreV1Api(api_client).patch_namespaced_config_map(name, namespace, {"metadata": {"ownerReferences": [owner]}})
+
+
+def watch_workflow(
+    name: str,
+    namespace: str,
+    api_client: k8s_client.ApiClient | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Function to watch an Argo workflow until it completes.
+
+    The API server closes watches after a timeout, the watch is therefore restarted from
+    the last seen resource version until the workflow completes. Once the resource version
+    expired, i.e., 410 Gone, the workflow is fetched to continue from its current state.
+
+    Args:
+        name: Name of the workflow
+        namespace: Namespace of the workflow
+        api_client: Optional Kubernetes API client, defaults to the kubeconfig client
+    Returns:
+        Iterator of the workflow object, yielded on every change of the workflow.
+    """
+    api = k8s_client.CustomObjectsApi(api_client or get_api_client())
+    resource_version = None
+
+    while True:
+        try:
+            # NOTE: The timeout disables the retries of the client, such that watches are restarted here
+            for event in watch.Watch().stream(
+                api.list_namespaced_custom_object,
+                ARGO_GROUP,
+                ARGO_VERSION,
+                namespace,
+                WORKFLOW_PLURAL,
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                **({"resource_version": resource_version} if resource_version else {}),
+            ):
+                workflow = event["object"]
+                resource_version = workflow.get("metadata", {}).get("resourceVersion", resource_version)
+                yield workflow
+
+                if workflow.get("status", {}).get("phase") in COMPLETED_PHASES:
+                    return
+        except k8s_client.ApiException as e:
+            if e.status != 410:
+                raise
+
+            workflow = api.get_namespaced_custom_object(ARGO_GROUP, ARGO_VERSION, namespace, WORKFLOW_PLURAL, name)
+            resource_version = workflow.get("metadata", {}).get("resourceVersion")
+            yield workflow
+
+            if workflow.get("status", {}).get("phase") in COMPLETED_PHASES:
+                return
+
+
+def get_image_digests(
+    workflow: dict[str, Any],
+    api_client: k8s_client.ApiClient | None = None,
+) -> dict[str, str]:
+    """Function to retrieve the digests of the images used by a workflow.
+
+    The images are resolved from the workflow pods, where the pod spec holds the image
+    as referenced by the workflow and the container status the digest that was pulled.
+
+    Args:
+        workflow: Workflow object
+        api_client: Optional Kubernetes API client, defaults to the kubeconfig client
+    Returns:
+        Dictionary mapping each image to its digest, e.g., `sha256:...`, images
+        without a pod are omitted.
+    """
+    pods = k8s_client.CoreV1Api(api_client or get_api_client()).list_namespaced_pod(
+        namespace=workflow["metadata"]["namespace"],
+        label_selector=f"{WORKFLOW_LABEL}={workflow['metadata']['name']}",
+    )
+
+    digests = {}
+    for pod in pods.items:
+        images = {container.name: container.image for container in pod.spec.containers}
+        for status in pod.status.container_statuses or []:
+            if status.name == "main" and "@" in (status.image_id or ""):
+                digests.setdefault(images.get("main", status.image), status.image_id.split("@", 1)[1])
+
+    return digests
+
+
+def pin_image(image: str, digest: str) -> str:
+    """Function to pin an image to a digest, e.g., `registry/image:tag` to `registry/image@sha256:...`."""
+    repository = image.split("@", 1)[0]
+    if ":" in repository.rsplit("/", 1)[-1]:
+        repository = repository.rsplit(":", 1)[0]
+
+    return f"{repository}@{digest}"
+
+
+def get_task_nodes(workflow: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Function to retrieve the status node of each DAG task of a workflow.
+
+    Args:
+        workflow: Workflow object
+    Returns:
+        Dictionary mapping the task name to its status node, tasks that
+        did not start yet are omitted.
+    """
+    return {
+        node["displayName"]: node
+        for node in workflow.get("status", {}).get("nodes", {}).values()
+        if node.get("type") in TASK_NODE_TYPES and "phase" in node and not LOOP_ITEM_PATTERN.match(node["displayName"])
+    }
+
+
+def get_task_phases(workflow: dict[str, Any]) -> dict[str, str]:
+    """Function to retrieve the phase of each DAG task of a workflow.
+
+    Args:
+        workflow: Workflow object
+    Returns:
+        Dictionary mapping the task name to its phase, tasks that
+        did not start yet are omitted.
+    """
+    return {name: node["phase"] for name, node in get_task_nodes(workflow).items()}
+
+
+def get_duration(node: dict[str, Any]) -> float | None:
+    """Function to compute the duration of a workflow status node in seconds.
+
+    Returns:
+        Duration in seconds, or None if the node did not finish yet.
+    """
+    if not node.get("startedAt") or not node.get("finishedAt"):
+        return None
+
+    return (parse_timestamp(node["finishedAt"]) - parse_timestamp(node["startedAt"])).total_seconds()
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """Function to parse a Kubernetes timestamp, e.g., `2024-01-01T00:00:00Z`."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def _get_task_outputs(workflow: dict[str, Any]) -> dict[str, dict[str, str]]:
+    return {
+        node["displayName"]: {
+            parameter["name"]: parameter.get("value")
+            for parameter in node.get("outputs", {}).get("parameters", [])
+        }
+        for node in workflow.get("status", {}).get("nodes", {}).values()
+        if node.get("type") in TASK_NODE_TYPES
+    }
+
+
+def get_resume_workflow(
+    workflow: dict[str, Any],
+    image: str | None = None,
+    workflow_name: str | None = None,
+    images: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Function to create a workflow that resumes a previous workflow.
+
+    The resulting workflow reuses the spec of the previous workflow, but only contains
+    the tasks that did not succeed, i.e., failed tasks and tasks that did not run yet.
+    Dependencies on succeeded tasks are dropped, as their outputs are already persisted.
+
+    Args:
+        workflow: Previous workflow object, including its status
+        image: Optional image to pin the workflow templates to
+        workflow_name: Optional name for the resumed workflow
+        images: Optional mapping of the images of the previous workflow to their replacement,
+            applied to the templates and the image argument of each task
+    Returns:
+        Workflow object for submission.
+    """
+    spec = copy.deepcopy(workflow["spec"])
+    succeeded = {name for name, phase in get_task_phases(workflow).items() if phase == "Succeeded"}
+    outputs = _get_task_outputs(workflow)
+
+    for template in spec["templates"]:
+        if images and "container" in template:
+            template["container"]["image"] = images.get(template["container"]["image"], template["container"]["image"])
+            for parameter in template.get("inputs", {}).get("parameters", []):
+                if parameter["name"] == "image" and "value" in parameter:
+                    parameter["value"] = images.get(parameter["value"], parameter["value"])
+
+        if image is not None and "container" in template:
+            # NOTE: Templates with an image per task are pinned through the default of their image input
+            if template["container"]["image"] == "{{inputs.parameters.image}}":
+                for parameter in template.get("inputs", {}).get("parameters", []):
+                    if parameter["name"] == "image":
+                        parameter["value"] = image
+            else:
+                template["container"]["image"] = image
+
+        # NOTE: Boundary datasets are scoped to the workflow, the resumed tasks therefore
+        # read and write the boundary datasets of the previous workflow.
+        for env in template.get("container", {}).get("env", []):
+            if env["name"] == BOUNDARY_PATH_ENV_VAR:
+                env["value"] = env["value"].replace("{{workflow.name}}", workflow["metadata"]["name"])
+
+        if template["name"] != spec["entrypoint"] or "dag" not in template:
+            continue
+
+        tasks = []
+        for task in template["dag"]["tasks"]:
+            if task["name"] in succeeded:
+                continue
+
+            if images:
+                for parameter in task.get("arguments", {}).get("parameters", []):
+                    if parameter["name"] == "image":
+                        parameter["value"] = images.get(parameter["value"], parameter["value"])
+
+            task["dependencies"] = [dep for dep in task.get("dependencies", []) if dep not in succeeded]
+            if not task["dependencies"]:
+                task.pop("dependencies")
+
+            # NOTE: Looped tasks may consume the output parameters of a succeeded
+            # task, which are inlined as the task no longer runs.
+            if match := re.fullmatch(r"{{tasks\.([\w-]+)\.outputs\.parameters\.([\w-]+)}}", task.get("withParam", "")):
+                if match.group(1) in succeeded:
+                    task.pop("withParam")
+                    task["withItems"] = json.loads(outputs[match.group(1)][match.group(2)])
+
+            tasks.append(task)
+
+        template["dag"]["tasks"] = tasks
+
+    previous_name = workflow["metadata"]["name"]
+    return {
+        "apiVersion": workflow["apiVersion"],
+        "kind": workflow["kind"],
+        "metadata": {
+            "generateName": f"{workflow_name or previous_name}-",
+            "namespace": workflow["metadata"]["namespace"],
+            "labels": {"resumed-from": previous_name},
+        },
+        "spec": spec,
+    }
@@ -16,22 +16,95 @@ from kedro.pipeline.node import Node
 from omegaconf import OmegaConf
 
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from argo_kedro.framework.metadata import MetadataConfig
+from argo_kedro.framework.tracing import TracingConfig
+from argo_kedro.runners.resources import get_runtime_env
+
+
+class ReadCacheConfig(BaseModel):
+    path: str = "/cache"
+    host_path: str = "/mnt/argo-kedro-cache"
+    max_size: int = 50
+
+class BoundaryDatasetsConfig(BaseModel):
+    path: str
 
 class RunnerConfig(BaseModel):
     use_memory_datasets: bool = False
+    read_cache: Optional[ReadCacheConfig] = None
+    boundary_datasets: Optional[BoundaryDatasetsConfig] = None
+    stream_buffer_size: int = 2
 
 class MachineType(BaseModel):
     mem: int
     cpu: int
     num_gpu: int
+    node_selector: dict[str, str] = Field(default={})
+    affinity: dict[str, Any] = Field(default={})
+    tolerations: List[dict[str, Any]] = Field(default=[])
+    threads: Optional[int] = None
+    env: dict[str, str] = Field(default={})
+
+    def get_runtime_env(self) -> dict[str, str]:
+        """Environment sizing thread pools to the CPU allocation, or `threads`, with the `env` overrides applied."""
+        return get_runtime_env(self.threads or self.cpu, self.env)
+
+    def get_env_patch(self) -> list[dict[str, str]]:
+        """Environment patched into the container, as the template derives the environment from the CPU allocation, if not overridden."""
+        if self.threads is None and not self.env:
+            return []
+
+        return [{"name": name, "value": value} for name, value in self.get_runtime_env().items()]
+
+    def is_scheduled_like(self, other: "MachineType") -> bool:
+        """Checks whether the machine types run on the same nodes, with the same image, i.e., whether tasks may escalate between them."""
+        return (self.num_gpu, self.node_selector, self.affinity, self.tolerations) == (
+            other.num_gpu,
+            other.node_selector,
+            other.affinity,
+            other.tolerations,
+        )
+
+class PreemptibleConfig(BaseModel):
+    node_selector: dict[str, str] = Field(default={"cloud.google.com/gke-spot": "true"})
+    tolerations: List[dict[str, Any]] = Field(
+        default=[{"key": "cloud.google.com/gke-spot", "operator": "Equal", "value": "true", "effect": "NoSchedule"}]
+    )
+    retries: int = 3
+
+class BuildTarget(BaseModel):
+    gpu: bool = False
+    stage: Optional[str] = None
+    build_args: dict[str, str] = Field(default={})
 
 class DeploymentConfig(BaseModel):
     image: str
     tag: str = "latest"
     target_platform: str = "linux/amd64"
     context: str = "./"
+    targets: dict[str, BuildTarget] = Field(default={})
+
+    def get_image(self, target: str | None = None) -> str:
+        """Full image of a build target, i.e., the tag is suffixed with the name of the target."""
+        return f"{self.image}:{self.tag}-{target}" if target else f"{self.image}:{self.tag}"
+
+    def get_task_image(self, num_gpu: int) -> str:
+        """Full image to run a task with, i.e., the first build target matching the GPU requirement of the task.
+
+        Raises:
+            ValueError: If build targets are configured, but none matches the GPU requirement, as only
+                the images of the targets are built.
+        """
+        if not self.targets:
+            return self.get_image()
+
+        for name, target in self.targets.items():
+            if target.gpu == (num_gpu > 0):
+                return self.get_image(name)
+
+        raise ValueError(f"No build target with `gpu: {str(num_gpu > 0).lower()}` is configured, which tasks with {num_gpu} GPUs require")
 
 class SecretRef(BaseModel):
     name: str
@@ -46,6 +119,44 @@ class TemplateConfig(BaseModel):
 
     environment: List[EnvironmentRef] = Field(default=[])
 
+class ConfConfig(BaseModel):
+    config_map: str = "argo-kedro-conf"
+
+class DatasetCheck(BaseModel):
+    columns: List[str] = Field(default=[])
+    min_rows: Optional[int] = None
+
+class PreflightConfig(BaseModel):
+    workers: int = 16
+    cache: bool = True
+    datasets: dict[str, DatasetCheck] = Field(default={})
+
+class DeadlinesConfig(BaseModel):
+    percentile: float = 95
+    factor: float = 3.0
+    min_deadline: int = 600
+    min_history: int = 3
+    history: int = 20
+    retries: int = 2
+    speculate: Optional[float] = None
+
+class EscalationConfig(BaseModel):
+    ladder: List[str] = Field(default=[])
+    nodes: dict[str, List[str]] = Field(default={})
+
+class ConcurrencyConfig(BaseModel):
+    parallelism: Optional[int] = None
+    machine_types: dict[str, int] = Field(default={})
+    config_map: str = "argo-kedro-semaphores"
+
+class PoolConfig(BaseModel):
+    workers: dict[str, int]
+    port: int = 8000
+    timeout: int = 86400
+    lease: int = 60
+    max_requeues: int = 3
+    retries: int = 2
+
 class ArgoConfig(BaseModel):
     namespace: str
     deployment: DeploymentConfig
@@ -53,6 +164,53 @@ class ArgoConfig(BaseModel):
     default_machine_type: str
     runner: RunnerConfig
     template: Optional[TemplateConfig] = Field(default=TemplateConfig())
+    concurrency: Optional[ConcurrencyConfig] = Field(default=ConcurrencyConfig())
+    preemptible: Optional[PreemptibleConfig] = Field(default=PreemptibleConfig())
+    pool: Optional[PoolConfig] = None
+    tracing: Optional[TracingConfig] = None
+    metadata: Optional[MetadataConfig] = None
+    conf: Optional[ConfConfig] = None
+    preflight: Optional[PreflightConfig] = None
+    deadlines: Optional[DeadlinesConfig] = None
+    escalation: Optional[EscalationConfig] = None
+
+    @model_validator(mode="after")
+    def check_build_targets(self) -> "ArgoConfig":
+        """Validates that every machine type runs a built image, as only the build targets are built
+        when configured. The templates without a machine type run the image of a CPU target."""
+        for num_gpu in {0} | {machine_type.num_gpu for machine_type in self.machine_types.values()}:
+            self.deployment.get_task_image(num_gpu)
+
+        return self
+
+    @model_validator(mode="after")
+    def check_escalation_ladders(self) -> "ArgoConfig":
+        """Validates that the machine types of every escalation ladder are scheduled alike, as retries
+        only escalate the memory and CPU, while the node selector, affinity, tolerations, image and
+        concurrency limit remain those of the machine type the task starts on."""
+        if self.escalation is None:
+            return self
+
+        limits = self.concurrency.machine_types if self.concurrency is not None else {}
+        for ladder in [self.escalation.ladder, *self.escalation.nodes.values()]:
+            rungs = [name for name in ladder if name in self.machine_types]
+            for name in rungs[1:]:
+                if not self.machine_types[name].is_scheduled_like(self.machine_types[rungs[0]]):
+                    raise ValueError(
+                        f"Machine type `{name}` of the escalation ladder differs from `{rungs[0]}` in its GPUs, "
+                        "node selector, affinity or tolerations, which retries do not escalate"
+                    )
+                if limits.get(name) != limits.get(rungs[0]):
+                    raise ValueError(
+                        f"Machine type `{name}` of the escalation ladder differs from `{rungs[0]}` in its "
+                        "concurrency limit, which retries do not escalate"
+                    )
+
+        return self
+
+
+# Patterns of the argo configuration files, registered with the config loader
+ARGO_CONFIG_PATTERNS = ["argo*", "argo*/**", "**/argo*"]
 
 
 class ArgoHook:
@@ -74,7 +232,7 @@ class ArgoHook:
         try:
             if "argo" not in context.config_loader.config_patterns.keys():
                 context.config_loader.config_patterns.update(
-                    {"argo": ["argo*", "argo*/**", "**/argo*"]}
+                    {"argo": ARGO_CONFIG_PATTERNS}
                 )
             conf_argo_yml = context.config_loader["argo"]
         except MissingConfigException:
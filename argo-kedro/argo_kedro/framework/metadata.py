@@ -0,0 +1,407 @@
+import abc
+import importlib
+import os
+import sqlite3
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from kedro.framework.hooks import hook_impl
+from kedro.io.core import get_filepath_str
+from kedro.pipeline.node import Node
+from pydantic import BaseModel, Field
+
+# Process of the run, which reports its peak resident set size under `/proc` on Linux
+PROC_PATH = Path("/proc/self")
+
+
+class DatasetRecord(BaseModel):
+    """Load or save of a dataset by a node, `size` in bytes."""
+
+    dataset: str
+    node: str
+    operation: str
+    duration: float
+    size: int | None = None
+
+
+class NodeRecord(BaseModel):
+    """Run of a node, `peak_rss` in bytes."""
+
+    node: str
+    started_at: float
+    wall_time: float
+    cpu_time: float
+    peak_rss: int | None = None
+    status: str = "OK"
+
+
+class RunRecord(BaseModel):
+    """Run of a task, i.e., the nodes run by a single `kedro run`, as part of a workflow if run by Argo."""
+
+    run_id: str
+    workflow: str | None = None
+    task: str
+    pipeline: str | None = None
+    started_at: float
+    wall_time: float
+    cpu_time: float
+    peak_rss: int | None = None
+    status: str = "OK"
+    nodes: list[NodeRecord] = Field(default=[])
+    datasets: list[DatasetRecord] = Field(default=[])
+
+
+class MetadataStore(abc.ABC):
+    """Base class for metadata stores, persisting the records of runs."""
+
+    @abc.abstractmethod
+    def save(self, run: RunRecord) -> None:
+        """Function to persist a run, runs that were persisted before are ignored."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def runs(
+        self,
+        workflow: str | None = None,
+        pipeline: str | None = None,
+        task: str | None = None,
+        limit: int | None = None,
+    ) -> list[RunRecord]:
+        """Function to query runs, most recent first, including their nodes and datasets."""
+        raise NotImplementedError
+
+
+class SQLiteMetadataStore(MetadataStore):
+    """Metadata store persisting runs in a SQLite database."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY, workflow TEXT, task TEXT, pipeline TEXT,
+        started_at REAL, wall_time REAL, cpu_time REAL, peak_rss INTEGER, status TEXT
+    );
+    CREATE TABLE IF NOT EXISTS nodes (
+        run_id TEXT, node TEXT, started_at REAL, wall_time REAL, cpu_time REAL, peak_rss INTEGER, status TEXT
+    );
+    CREATE TABLE IF NOT EXISTS datasets (
+        run_id TEXT, dataset TEXT, node TEXT, operation TEXT, duration REAL, size INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS nodes_run_id ON nodes (run_id);
+    CREATE INDEX IF NOT EXISTS datasets_run_id ON datasets (run_id);
+    """
+
+    RUN_FIELDS = [field for field in RunRecord.model_fields if field not in ("nodes", "datasets")]
+
+    def __init__(self, path: str = ".argo-kedro/metadata.db"):
+        self._path = Path(path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path)
+        try:
+            connection.executescript(self.SCHEMA)
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def save(self, run: RunRecord) -> None:
+        with self._connect() as connection:
+            inserted = connection.execute(
+                f"INSERT OR IGNORE INTO runs VALUES ({', '.join('?' * len(self.RUN_FIELDS))})",
+                [getattr(run, field) for field in self.RUN_FIELDS],
+            ).rowcount
+            if not inserted:
+                return
+
+            connection.executemany(
+                "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run.run_id, *node.model_dump().values()) for node in run.nodes],
+            )
+            connection.executemany(
+                "INSERT INTO datasets VALUES (?, ?, ?, ?, ?, ?)",
+                [(run.run_id, *dataset.model_dump().values()) for dataset in run.datasets],
+            )
+
+    def runs(
+        self,
+        workflow: str | None = None,
+        pipeline: str | None = None,
+        task: str | None = None,
+        limit: int | None = None,
+    ) -> list[RunRecord]:
+        filters = {"workflow": workflow, "pipeline": pipeline, "task": task}
+        where = " AND ".join(f"{key} = ?" for key, value in filters.items() if value is not None)
+        query = f"SELECT * FROM runs {f'WHERE {where}' if where else ''} ORDER BY started_at DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            parameters = [value for value in filters.values() if value is not None]
+            runs = {row["run_id"]: dict(row) for row in connection.execute(query, parameters)}
+            for run in runs.values():
+                run["nodes"], run["datasets"] = [], []
+
+            placeholders = ", ".join("?" * len(runs))
+            for table in ("nodes", "datasets"):
+                for row in connection.execute(f"SELECT * FROM {table} WHERE run_id IN ({placeholders})", list(runs)):
+                    row = dict(row)
+                    runs[row.pop("run_id")][table].append(row)
+
+        return [RunRecord(**run) for run in runs.values()]
+
+
+STORES = {"sqlite": SQLiteMetadataStore}
+
+
+class MetadataConfig(BaseModel):
+    store: str = "sqlite"
+    options: dict[str, Any] = Field(default={})
+
+
+def get_store(name: str, options: dict[str, Any] | None = None) -> MetadataStore:
+    """Function to instantiate a metadata store.
+
+    Args:
+        name: Name of a built-in store, i.e., `sqlite`, or the import path of a
+            `MetadataStore` subclass, e.g., `my_project.metadata.MyStore`
+        options: Keyword arguments for the store
+    Returns:
+        Metadata store.
+    """
+    if name in STORES:
+        return STORES[name](**(options or {}))
+
+    module, _, cls = name.rpartition(".")
+    store = getattr(importlib.import_module(module), cls)
+    if not (isinstance(store, type) and issubclass(store, MetadataStore)):
+        raise TypeError(f"Store `{name}` is not a subclass of `MetadataStore`")
+
+    return store(**(options or {}))
+
+
+def get_metadata_store(config: MetadataConfig | None) -> MetadataStore | None:
+    """Function to create the metadata store, if configured."""
+    if config is None:
+        return None
+
+    return get_store(config.store, config.options)
+
+
+def get_dataset_size(dataset: Any, data: Any) -> int | None:
+    """Function to determine the size of a dataset in bytes.
+
+    The size of file based datasets is the size of the stored object, otherwise the
+    in-memory size of arrays and DataFrames is used.
+    """
+    if getattr(dataset, "size", None) is not None:
+        return dataset.size
+
+    if hasattr(dataset, "_fs") and hasattr(dataset, "_get_load_path"):
+        try:
+            return int(dataset._fs.size(get_filepath_str(dataset._get_load_path(), getattr(dataset, "_protocol", "file"))))
+        except Exception:
+            pass
+
+    if hasattr(data, "nbytes"):
+        return int(data.nbytes)
+    if hasattr(data, "memory_usage"):
+        return int(data.memory_usage(index=True).sum())
+
+    return None
+
+
+def reset_peak_rss(proc_path: Path = PROC_PATH) -> bool:
+    """Function to reset the peak resident set size of the process, supported by Linux only.
+
+    Returns:
+        True if the peak was reset, i.e., `get_peak_rss` subsequently reports the peak since the reset.
+    """
+    try:
+        (proc_path / "clear_refs").write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss(proc_path: Path = PROC_PATH) -> int | None:
+    """Function to read the peak resident set size of the process in bytes.
+
+    The peak is read from `/proc`, as reset by `reset_peak_rss`, and otherwise
+    falls back to the peak over the lifetime of the process.
+    """
+    try:
+        for line in (proc_path / "status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # NOTE: Linux reports the peak in kilobytes, macOS in bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class MetadataHooks:
+    """Kedro hooks recording the wall time, CPU time and peak memory of each node, and the
+    duration and size of each dataset load and save."""
+
+    def __init__(self, catalog: Any):
+        self._catalog = catalog
+        self._started: dict[tuple[str, str], tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+        self.nodes: list[NodeRecord] = []
+        self.datasets: list[DatasetRecord] = []
+
+    def _start(self, kind: str, name: str) -> None:
+        with self._lock:
+            self._started[(kind, name)] = (time.time(), time.perf_counter(), time.process_time())
+
+    def _stop(self, kind: str, name: str) -> tuple[float, float, float] | None:
+        with self._lock:
+            started = self._started.pop((kind, name), None)
+
+        if started is None:
+            return None
+
+        started_at, wall, cpu = started
+        return started_at, time.perf_counter() - wall, time.process_time() - cpu
+
+    def _record_dataset(self, operation: str, dataset_name: str, data: Any, node: Node) -> None:
+        if (timing := self._stop(operation, dataset_name)) is None:
+            return
+
+        try:
+            size = get_dataset_size(self._catalog.get(dataset_name), data)
+        except Exception:
+            size = None
+
+        self.datasets.append(DatasetRecord(dataset=dataset_name, node=node.name, operation=operation, duration=timing[1], size=size))
+
+    def _record_node(self, node: Node, status: str) -> None:
+        if (timing := self._stop("node", node.name)) is None:
+            return
+
+        started_at, wall_time, cpu_time = timing
+        self.nodes.append(
+            NodeRecord(node=node.name, started_at=started_at, wall_time=wall_time, cpu_time=cpu_time, peak_rss=get_peak_rss(), status=status)
+        )
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name: str, node: Node) -> None:
+        self._start("load", dataset_name)
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node: Node) -> None:
+        self._record_dataset("load", dataset_name, data, node)
+
+    @hook_impl
+    def before_node_run(self, node: Node) -> None:
+        # NOTE: The peak memory of the process is reset, such that it reflects the node, including its inputs
+        reset_peak_rss()
+        self._start("node", node.name)
+
+    @hook_impl
+    def after_node_run(self, node: Node) -> None:
+        self._record_node(node, "OK")
+
+    @hook_impl
+    def on_node_error(self, error: Exception, node: Node) -> None:
+        self._record_node(node, "ERROR")
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name: str, data: Any, node: Node) -> None:
+        self._start("save", dataset_name)
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any, node: Node) -> None:
+        self._record_dataset("save", dataset_name, data, node)
+
+
+class NodeStats(BaseModel):
+    """Statistics of a node over runs, times in seconds and `peak_rss` in bytes."""
+
+    node: str
+    runs: int
+    wall_time: float
+    wall_time_p95: float
+    cpu_time: float
+    peak_rss: int | None = None
+
+
+class DatasetStats(BaseModel):
+    """Statistics of a dataset over runs, times in seconds and `size` in bytes."""
+
+    dataset: str
+    loads: int
+    saves: int
+    size: int | None = None
+    load_time: float | None = None
+    save_time: float | None = None
+
+
+def _mean(values: list[float]) -> float | None:
+    return sum(values) / len(values) if values else None
+
+
+def get_node_stats(runs: list[RunRecord]) -> list[NodeStats]:
+    """Function to aggregate the succeeded runs of each node, i.e., the mean and 95th percentile
+    of the wall time, the mean CPU time, and the maximum peak memory."""
+    nodes: dict[str, list[NodeRecord]] = {}
+    for run in runs:
+        for node in run.nodes:
+            if node.status == "OK":
+                nodes.setdefault(node.node, []).append(node)
+
+    stats = []
+    for name, records in sorted(nodes.items()):
+        wall_times = [record.wall_time for record in records]
+        peaks = [record.peak_rss for record in records if record.peak_rss is not None]
+        stats.append(
+            NodeStats(
+                node=name,
+                runs=len(records),
+                wall_time=_mean(wall_times),
+                wall_time_p95=statistics.quantiles(wall_times, n=20, method="inclusive")[-1] if len(wall_times) > 1 else wall_times[0],
+                cpu_time=_mean([record.cpu_time for record in records]),
+                peak_rss=max(peaks) if peaks else None,
+            )
+        )
+
+    return stats
+
+
+def get_dataset_stats(runs: list[RunRecord]) -> list[DatasetStats]:
+    """Function to aggregate the loads and saves of each dataset, i.e., the mean duration and the maximum size."""
+    datasets: dict[str, list[DatasetRecord]] = {}
+    for run in runs:
+        for dataset in run.datasets:
+            datasets.setdefault(dataset.dataset, []).append(dataset)
+
+    stats = []
+    for name, records in sorted(datasets.items()):
+        loads = [record.duration for record in records if record.operation == "load"]
+        saves = [record.duration for record in records if record.operation == "save"]
+        sizes = [record.size for record in records if record.size is not None]
+        stats.append(
+            DatasetStats(
+                dataset=name,
+                loads=len(loads),
+                saves=len(saves),
+                size=max(sizes) if sizes else None,
+                load_time=_mean(loads),
+                save_time=_mean(saves),
+            )
+        )
+
+    return stats
@@ -0,0 +1,265 @@
+import abc
+import importlib
+import json
+import os
+import secrets
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from kedro.framework.hooks import hook_impl
+from kedro.pipeline.node import Node
+from pydantic import BaseModel, Field
+
+# Trace context is propagated through the W3C `traceparent` format, using the
+# environment variable adopted by OpenTelemetry for process propagation.
+TRACEPARENT_ENV_VAR = "TRACEPARENT"
+
+
+class Span(BaseModel):
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_time: int
+    end_time: int | None = None
+    status: str = "OK"
+    attributes: dict[str, Any] = Field(default={})
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+class SpanExporter(abc.ABC):
+    """Base class for span exporters, receiving the finished spans of a tracer."""
+
+    @abc.abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        raise NotImplementedError()
+
+
+class FileSpanExporter(SpanExporter):
+    """Exporter appending spans to a local file, as JSON lines."""
+
+    def __init__(self, path: str = "traces.jsonl"):
+        self._path = Path(path)
+
+    def export(self, spans: list[Span]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a") as f:
+            for span in spans:
+                f.write(span.model_dump_json() + "\n")
+
+
+class OTLPSpanExporter(SpanExporter):
+    """Exporter sending spans to an OpenTelemetry collector, using OTLP over HTTP with JSON encoding."""
+
+    def __init__(self, endpoint: str, service_name: str = "argo-kedro", timeout: float = 10.0):
+        self._endpoint = endpoint.rstrip("/")
+        self._service_name = service_name
+        self._timeout = timeout
+
+    def export(self, spans: list[Span]) -> None:
+        body = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_attribute("service.name", self._service_name)]},
+                    "scopeSpans": [{"scope": {"name": "argo_kedro"}, "spans": [_otlp_span(span) for span in spans]}],
+                }
+            ]
+        }
+        request = urllib.request.Request(
+            f"{self._endpoint}/v1/traces",
+            method="POST",
+            data=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        urllib.request.urlopen(request, timeout=self._timeout).close()
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    return {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        **({"parentSpanId": span.parent_id} if span.parent_id else {}),
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time),
+        "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 1 if span.status == "OK" else 2},
+    }
+
+
+EXPORTERS = {"file": FileSpanExporter, "otlp": OTLPSpanExporter}
+
+
+class TracingConfig(BaseModel):
+    exporter: str = "file"
+    options: dict[str, Any] = Field(default={})
+
+
+def get_exporter(name: str, options: dict[str, Any] | None = None) -> SpanExporter:
+    """Function to instantiate a span exporter.
+
+    Args:
+        name: Name of a built-in exporter, i.e., `file` or `otlp`, or the import
+            path of a `SpanExporter` subclass, e.g., `my_project.tracing.MyExporter`
+        options: Keyword arguments for the exporter
+    Returns:
+        Span exporter.
+    """
+    if name in EXPORTERS:
+        return EXPORTERS[name](**(options or {}))
+
+    module, _, cls = name.rpartition(".")
+    exporter = getattr(importlib.import_module(module), cls)
+    if not (isinstance(exporter, type) and issubclass(exporter, SpanExporter)):
+        raise TypeError(f"Exporter `{name}` is not a subclass of `SpanExporter`")
+
+    return exporter(**(options or {}))
+
+
+def get_tracer(config: TracingConfig | None) -> "Tracer | None":
+    """Function to create the tracer, if tracing is configured."""
+    if config is None:
+        return None
+
+    return Tracer(get_exporter(config.exporter, config.options))
+
+
+class Tracer:
+    """Minimal tracer, producing spans compatible with OpenTelemetry.
+
+    Spans are nested within the active span, and the first span is parented by the trace
+    context of the process, i.e., the `TRACEPARENT` environment variable, such that the
+    spans of every pod of a workflow are part of the trace started by `submit`. Finished
+    spans are buffered, and exported when the tracer is flushed.
+    """
+
+    def __init__(self, exporter: SpanExporter, traceparent: str | None = None):
+        self._exporter = exporter
+        self._stack: list[Span] = []
+        self._finished: list[Span] = []
+        self._trace_id, self._parent_id = None, None
+
+        traceparent = traceparent if traceparent is not None else os.environ.get(TRACEPARENT_ENV_VAR)
+        if traceparent:
+            _, self._trace_id, self._parent_id, _ = traceparent.split("-")
+
+    @property
+    def trace_id(self) -> str:
+        if self._trace_id is None:
+            self._trace_id = secrets.token_hex(16)
+
+        return self._trace_id
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None, start_time: int | None = None) -> Span:
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=self._stack[-1].span_id if self._stack else self._parent_id,
+            start_time=start_time or time.time_ns(),
+            attributes=attributes or {},
+        )
+        self._stack.append(span)
+        return span
+
+    def end_span(self, span: Span, status: str = "OK", end_time: int | None = None) -> None:
+        span.end_time = end_time or time.time_ns()
+        span.status = status
+        self._stack.remove(span)
+        self._finished.append(span)
+
+    @contextmanager
+    def span(self, name: str, attributes: dict[str, Any] | None = None) -> Iterator[Span]:
+        span = self.start_span(name, attributes)
+        try:
+            yield span
+        except BaseException:
+            self.end_span(span, status="ERROR")
+            raise
+        else:
+            self.end_span(span)
+
+    def record(self, name: str, start_time: int, end_time: int, attributes: dict[str, Any] | None = None) -> Span:
+        """Function to record a span that already finished, e.g., work measured before the tracer existed."""
+        span = self.start_span(name, attributes, start_time=start_time)
+        self.end_span(span, end_time=end_time)
+        return span
+
+    def flush(self) -> None:
+        if self._finished:
+            self._exporter.export(self._finished)
+            self._finished = []
+
+
+class CatalogTracingHooks:
+    """Kedro hooks emitting a span for the construction of the catalog, i.e., from the
+    instantiation of the hooks until the catalog was created."""
+
+    def __init__(self, tracer: Tracer):
+        self._tracer = tracer
+        self._start_time = time.time_ns()
+
+    @hook_impl
+    def after_catalog_created(self) -> None:
+        self._tracer.record("kedro.catalog", self._start_time, time.time_ns())
+
+
+class TracingHooks:
+    """Kedro hooks emitting a span per node run, and per dataset load and save."""
+
+    def __init__(self, tracer: Tracer):
+        self._tracer = tracer
+        self._spans: dict[tuple[str, str], Span] = {}
+
+    def _start(self, kind: str, name: str, **attributes):
+        self._spans[(kind, name)] = self._tracer.start_span(f"{kind} {name}", attributes)
+
+    def _end(self, kind: str, name: str, status: str = "OK"):
+        if (span := self._spans.pop((kind, name), None)) is not None:
+            self._tracer.end_span(span, status=status)
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name: str, node: Node) -> None:
+        self._start("load", dataset_name, dataset=dataset_name, node=node.name)
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node: Node) -> None:
+        self._end("load", dataset_name)
+
+    @hook_impl
+    def before_node_run(self, node: Node) -> None:
+        self._start("node", node.name, node=node.name)
+
+    @hook_impl
+    def after_node_run(self, node: Node) -> None:
+        self._end("node", node.name)
+
+    @hook_impl
+    def on_node_error(self, error: Exception, node: Node) -> None:
+        self._end("node", node.name, status="ERROR")
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name: str, data: Any, node: Node) -> None:
+        self._start("save", dataset_name, dataset=dataset_name, node=node.name)
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any, node: Node) -> None:
+        self._end("save", dataset_name)
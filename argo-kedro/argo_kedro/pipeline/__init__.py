@@ -1,4 +1,5 @@
 from .fused_pipeline import FusedPipeline
 from .node import Node
+from .partitioned_node import PartitionedNode
 
-__all__ = ["FusedPipeline", "Node"]
\ No newline at end of file
+__all__ = ["FusedPipeline", "Node", "PartitionedNode"]
\ No newline at end of file
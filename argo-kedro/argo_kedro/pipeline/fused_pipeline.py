@@ -10,7 +10,14 @@ class FusedNode(Node):
     allowing it to act as a single unit for execution.
     """
 
-    def __init__(self, nodes: List[KedroNode], name: str, machine_type: str | None = None):
+    def __init__(
+        self,
+        nodes: List[KedroNode],
+        name: str,
+        machine_type: str | None = None,
+        preemptible: bool = False,
+        idempotent: bool = False,
+    ):
         self._nodes = nodes
         self._name = name
         self._namespace = None
@@ -20,6 +27,8 @@ class FusedNode(Node):
         self._func = lambda: None
         self._tags = []
         self._machine_type = machine_type
+        self._preemptible = preemptible
+        self._idempotent = idempotent
 
         for node in nodes:
             self._inputs.extend(node.inputs)
@@ -57,14 +66,27 @@ class FusedPipeline(Pipeline):
         *,
         tags: str | Iterable[str] | None = None,
         machine_type: str | None = None,
+        preemptible: bool = False,
+        idempotent: bool = False,
     ):
         self._name = name
         self._machine_type = machine_type
+        self._preemptible = preemptible
+        self._idempotent = idempotent
         super().__init__(nodes, tags=tags)
 
+    def _fused_node(self) -> FusedNode:
+        return FusedNode(
+            self._nodes,
+            name=self._name,
+            machine_type=self._machine_type,
+            preemptible=self._preemptible,
+            idempotent=self._idempotent,
+        )
+
     @property
     def nodes(self) -> list[KedroNode]:
-        return [FusedNode(self._nodes, name=self._name, machine_type=self._machine_type)]
+        return [self._fused_node()]
 
     @cached_property
     def grouped_nodes(self) -> list[list[KedroNode]]:
@@ -73,4 +95,4 @@ class FusedPipeline(Pipeline):
         For FusedPipeline, since we only have a single FusedNode, we return
         it as a single group.
         """
-        return [[FusedNode(self._nodes, name=self._name, machine_type=self._machine_type)]]
\ No newline at end of file
+        return [[self._fused_node()]]
\ No newline at end of file
@@ -4,6 +4,10 @@ from typing import Callable, Iterable
 class Node(KedroNode):
     """ArgoNode is an extension of the Kedro node class, aimed at allowing
     the node to be allocated to a specific machine type.
+
+    Inputs listed in `streams` are passed to the node as iterators of chunks. When the input
+    is produced by a generator node fused with this node, chunks stream from the producer
+    without materializing the dataset, otherwise the loaded dataset is passed as a single chunk.
     """
     def __init__(
         self,
@@ -13,14 +17,43 @@ class Node(KedroNode):
         *,
         name: str | None = None,
         machine_type: str | None = None,
+        preemptible: bool = False,
+        idempotent: bool = False,
         tags: str | Iterable[str] | None = None,
         confirms: str | list[str] | None = None,
         namespace: str | None = None,
+        streams: str | list[str] | None = None,
     ):
 
         super().__init__(func, inputs, outputs, name=name, tags=tags, confirms=confirms, namespace=namespace)
         self._machine_type = machine_type
+        self._preemptible = preemptible
+        self._idempotent = idempotent
+        self._streams = [streams] if isinstance(streams, str) else list(streams or [])
+
+        for dataset in self._streams:
+            if dataset not in self.inputs:
+                raise ValueError(f"Streamed dataset `{dataset}` is not an input of node `{self.name}`")
 
     @property
     def machine_type(self) -> str:
-        return self._machine_type
\ No newline at end of file
+        return self._machine_type
+
+    @property
+    def preemptible(self) -> bool:
+        """Flag indicating that the node is safe to retry, and may run on spot/preemptible machines."""
+        return self._preemptible
+
+    @property
+    def idempotent(self) -> bool:
+        """Flag indicating that the node may run concurrently with a copy of itself.
+
+        Unlike retries of preemptible nodes, the copy that loses is stopped while it may still be
+        writing, the outputs of the node should therefore be saved atomically, e.g., to object storage.
+        """
+        return self._idempotent
+
+    @property
+    def streams(self) -> list[str]:
+        """Inputs passed to the node as iterators of chunks."""
+        return self._streams
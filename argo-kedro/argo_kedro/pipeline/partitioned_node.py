@@ -0,0 +1,156 @@
+import os
+from functools import wraps
+from typing import Any, Callable, Iterable
+
+from argo_kedro.pipeline.node import Node
+
+PARTITION_ENV_VAR = "ARGO_KEDRO_PARTITION"
+
+
+def partition_keys(value: Any) -> list[str]:
+    """Function to turn a loaded dataset into a list of partition keys.
+
+    Args:
+        value: Loaded dataset, e.g., the dictionary returned by a `PartitionedDataset`
+            or a plain list of keys.
+    Returns:
+        List of partition keys.
+    """
+    if isinstance(value, dict):
+        return [str(key) for key in value.keys()]
+
+    return [str(key) for key in value]
+
+
+class PartitionedNode(Node):
+    """PartitionedNode is an extension of the ArgoNode, aimed at data-parallel
+    processing of independent partitions.
+
+    The node function is invoked once per partition, with the partition key as the
+    first argument, and every output is saved as a dictionary keyed by partition,
+    i.e., the node is expected to write to a `PartitionedDataset` so that each shard
+    contributes its own partition and downstream nodes load the gathered result.
+
+    On Argo, the node is expanded into a fan-out over the partitions, where each shard
+    runs `kedro run` for a single partition, selected through the `ARGO_KEDRO_PARTITION`
+    environment variable. When the variable is not set, e.g., when running locally, all
+    partitions are processed sequentially.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        inputs: str | list[str] | None,
+        outputs: str | list[str] | dict[str, str] | None,
+        *,
+        partitions: list[str] | Callable[[], list[str]] | None = None,
+        partitions_from: str | None = None,
+        name: str | None = None,
+        machine_type: str | None = None,
+        preemptible: bool = False,
+        idempotent: bool = False,
+        tags: str | Iterable[str] | None = None,
+        confirms: str | list[str] | None = None,
+        namespace: str | None = None,
+    ):
+        """Instantiates the partitioned node.
+
+        Args:
+            func: Function to invoke per partition, receives the partition key followed by the inputs.
+            inputs: The name or the list of the names of the node inputs.
+            outputs: The name, list or dict of the names of the node outputs.
+            partitions: Static list of partitions, or callable producing the list, resolved at submit time.
+            partitions_from: Name of a dataset, produced upstream, that holds the partitions. The partitions
+                are resolved when the workflow executes.
+            name: Name of the node.
+            machine_type: Machine type to run each shard on.
+            preemptible: Flag indicating that the shards are safe to retry, and may run on spot machines.
+            idempotent: Flag indicating that shards may run concurrently with a copy of themselves.
+            tags: Optional set of tags to be applied to the node.
+            confirms: Optional name or the list of the names of the datasets that should be confirmed.
+            namespace: Optional node namespace.
+        """
+        if (partitions is None) == (partitions_from is None):
+            raise ValueError(
+                f"Exactly one of `partitions` or `partitions_from` should be set for partitioned node `{name}`"
+            )
+
+        if isinstance(inputs, dict):
+            raise ValueError(f"Partitioned node `{name}` does not support dictionary inputs")
+
+        self._partitioned_func = func
+        self._partitioned_inputs = [inputs] if isinstance(inputs, str) else list(inputs or [])
+        self._partitions = partitions
+        self._partitions_from = partitions_from
+
+        super().__init__(
+            self._wrap(func, outputs),
+            [partitions_from, *self._partitioned_inputs] if partitions_from else self._partitioned_inputs,
+            outputs,
+            name=name,
+            machine_type=machine_type,
+            preemptible=preemptible,
+            idempotent=idempotent,
+            tags=tags,
+            confirms=confirms,
+            namespace=namespace,
+        )
+
+    @property
+    def partitions(self) -> list[str] | None:
+        """Partitions of the node, `None` if resolved at runtime from `partitions_from`."""
+        if self._partitions_from is not None:
+            return None
+
+        partitions = self._partitions() if callable(self._partitions) else self._partitions
+        return [str(partition) for partition in partitions]
+
+    @property
+    def partitions_from(self) -> str | None:
+        return self._partitions_from
+
+    def _wrap(self, func: Callable, outputs: str | list[str] | dict[str, str] | None) -> Callable:
+        @wraps(func)
+        def _run_partitions(*args):
+            if self._partitions_from is not None:
+                available, *args = args
+                available = partition_keys(available)
+            else:
+                available = self.partitions
+
+            selected = os.environ.get(PARTITION_ENV_VAR)
+            if selected and selected not in available:
+                raise ValueError(f"Partition `{selected}` not found for partitioned node `{self.name}`")
+
+            results = {key: func(key, *args) for key in ([selected] if selected else available)}
+
+            # NOTE: Transpose the per partition results into per output dictionaries
+            if outputs is None:
+                return None
+            if isinstance(outputs, str):
+                return results
+            if isinstance(outputs, dict):
+                return {name: {key: result[name] for key, result in results.items()} for name in outputs}
+
+            return [{key: result[idx] for key, result in results.items()} for idx in range(len(outputs))]
+
+        return _run_partitions
+
+    def _copy(self, **overwrite_params: Any) -> "PartitionedNode":
+        inputs = overwrite_params.get("inputs", self._inputs)
+        inputs = [inputs] if isinstance(inputs, str) else list(inputs or [])
+        params = {
+            "func": self._partitioned_func,
+            "inputs": inputs[1:] if self._partitions_from else inputs,
+            "outputs": overwrite_params.get("outputs", self._outputs),
+            "partitions": self._partitions,
+            "partitions_from": inputs[0] if self._partitions_from else None,
+            "name": overwrite_params.get("name", self._name),
+            "machine_type": self._machine_type,
+            "preemptible": self._preemptible,
+            "idempotent": self._idempotent,
+            "tags": overwrite_params.get("tags", self._tags),
+            "confirms": overwrite_params.get("confirms", self._confirms),
+            "namespace": overwrite_params.get("namespace", self._namespace),
+        }
+        return PartitionedNode(**params)
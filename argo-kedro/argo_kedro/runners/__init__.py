@@ -1,3 +1,6 @@
+from .boundary import BoundaryDataset
 from .fuse_runner import FusedRunner
+from .read_cache import ReadCache
+from .streaming import StreamDataset
 
-__all__ = ["FusedRunner"]
\ No newline at end of file
+__all__ = ["BoundaryDataset", "FusedRunner", "ReadCache", "StreamDataset"]
@@ -0,0 +1,278 @@
+import importlib.util
+import inspect
+import pickle
+import posixpath
+from logging import getLogger
+from typing import Any
+from urllib.parse import quote, unquote
+
+import fsspec
+from fsspec.implementations.local import LocalFileSystem
+from kedro.io import AbstractDataset
+from kedro.pipeline import Node, Pipeline
+
+from argo_kedro.pipeline.partitioned_node import PartitionedNode
+
+LOGGER = getLogger(__name__)
+
+# Workflow-scoped path under which unregistered boundary datasets are stored, set by the workflow
+BOUNDARY_PATH_ENV_VAR = "ARGO_KEDRO_BOUNDARY_PATH"
+
+# Formats in order of preference, i.e., pickle is only used for data without a binary format
+FORMATS = {"feather": ".feather", "npy": ".npy", "pickle": ".pkl"}
+
+
+def get_format(data: Any) -> str:
+    """Function to select the storage format of the data.
+
+    - `feather`: Arrow IPC, for pandas DataFrames and Arrow tables, requires `pyarrow`
+    - `npy`: NumPy arrays of a fixed size dtype, which can be memory-mapped
+    - `pickle`: any other object
+    """
+    format = _get_type_format(type(data))
+    if format == "npy" and data.dtype.hasobject:
+        return "pickle"
+
+    return format
+
+
+def _get_type_format(type_: Any) -> str:
+    module = getattr(type_, "__module__", "").split(".")[0]
+    name = getattr(type_, "__name__", "")
+    if module in ("pandas", "pyarrow") and name in ("DataFrame", "Table"):
+        if importlib.util.find_spec("pyarrow") is not None:
+            return "feather"
+
+    if module == "numpy" and name == "ndarray":
+        return "npy"
+
+    return "pickle"
+
+
+class BoundaryDataset(AbstractDataset):
+    """Dataset for a dataset crossing a task boundary, without an entry in the catalog.
+
+    The storage format is selected when the data is saved, based on its type. Arrays
+    stored on the local filesystem are loaded memory-mapped.
+    """
+
+    def __init__(self, path: str):
+        """Instantiates the dataset.
+
+        Args:
+            path: Path to store the dataset at, without extension
+        """
+        self._path = path
+        self._fs, self._base_path = fsspec.core.url_to_fs(path)
+        self.format: str | None = None
+        self.size: int | None = None
+
+    def _get_path(self, format: str) -> str:
+        return f"{self._base_path}{FORMATS[format]}"
+
+    def load(self) -> Any:
+        for format in FORMATS:
+            if self._fs.exists(self._get_path(format)):
+                return self._load_format(format)
+
+        raise FileNotFoundError(f"Boundary dataset not found at `{self._path}`")
+
+    def _load_format(self, format: str) -> Any:
+        path = self._get_path(format)
+        if format == "npy":
+            import numpy as np
+
+            if isinstance(self._fs, LocalFileSystem):
+                return np.load(path, mmap_mode="r")
+
+            with self._fs.open(path, "rb") as f:
+                return np.load(f)
+
+        with self._fs.open(path, "rb") as f:
+            if format == "feather":
+                from pyarrow import feather
+
+                table = feather.read_table(f)
+                return table.to_pandas() if b"pandas" in (table.schema.metadata or {}) else table
+
+            return pickle.load(f)
+
+    def save(self, data: Any) -> None:
+        format = get_format(data)
+        path = self._get_path(format)
+        self._fs.makedirs(posixpath.dirname(path), exist_ok=True)
+
+        with self._fs.open(path, "wb") as f:
+            if format == "feather":
+                import pyarrow as pa
+                from pyarrow import feather
+
+                feather.write_feather(data if isinstance(data, pa.Table) else pa.Table.from_pandas(data), f)
+            elif format == "npy":
+                import numpy as np
+
+                np.save(f, data)
+            else:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.format, self.size = format, self._fs.size(path)
+        LOGGER.info(f"Saved boundary dataset to `{self._path}` as {format} ({self.size} bytes)")
+
+    def _exists(self) -> bool:
+        return any(self._fs.exists(self._get_path(format)) for format in FORMATS)
+
+    def _describe(self) -> dict[str, Any]:
+        return {"path": self._path, "format": self.format}
+
+
+class PartitionedBoundaryDataset(AbstractDataset):
+    """Dataset for an output of a partitioned node crossing a task boundary, without an entry in the catalog.
+
+    The output is a dictionary keyed by partition, where each partition is stored as a boundary
+    dataset of its own. Shards of a fan-out therefore each contribute their own partitions, and
+    loading gathers the partitions of all shards into a single dictionary.
+    """
+
+    def __init__(self, path: str):
+        """Instantiates the dataset.
+
+        Args:
+            path: Directory to store the partitions at
+        """
+        self._path = path.rstrip("/")
+        self._fs, self._base_path = fsspec.core.url_to_fs(self._path)
+        self.format: str | None = None
+        self.size: int | None = None
+
+    def _get_partition(self, key: str) -> BoundaryDataset:
+        return BoundaryDataset(f"{self._path}/{quote(key, safe='')}")
+
+    def load(self) -> dict[str, Any]:
+        if not self._fs.isdir(self._base_path):
+            raise FileNotFoundError(f"Boundary dataset not found at `{self._path}`")
+
+        paths = self._fs.ls(self._base_path, detail=False)
+        keys = sorted({posixpath.splitext(posixpath.basename(path))[0] for path in paths})
+        return {unquote(key): self._get_partition(unquote(key)).load() for key in keys}
+
+    def save(self, data: dict[str, Any]) -> None:
+        if not isinstance(data, dict):
+            raise TypeError(f"Partitioned boundary dataset `{self._path}` expects a dictionary keyed by partition")
+
+        partitions = {key: self._get_partition(str(key)) for key in data}
+        for key, partition in partitions.items():
+            partition.save(data[key])
+
+        formats = sorted({partition.format for partition in partitions.values()})
+        self.format = ",".join(formats) if formats else None
+        self.size = sum(partition.size for partition in partitions.values())
+
+    def _exists(self) -> bool:
+        return self._fs.isdir(self._base_path)
+
+    def _describe(self) -> dict[str, Any]:
+        return {"path": self._path, "format": self.format}
+
+
+def get_partitioned_datasets(pipeline: Pipeline) -> set[str]:
+    """Function to determine the datasets produced by partitioned nodes, i.e., dictionaries keyed by partition.
+
+    Args:
+        pipeline: Pipeline to inspect, may contain fused nodes
+    Returns:
+        Names of the partitioned datasets.
+    """
+    return {
+        dataset
+        for node in pipeline.nodes
+        for inner in getattr(node, "_nodes", [node])
+        if isinstance(inner, PartitionedNode)
+        for dataset in inner.outputs
+    }
+
+
+def get_boundary_datasets(pipeline: Pipeline, full_pipeline: Pipeline) -> set[str]:
+    """Function to determine the datasets that cross the boundary of a partial run.
+
+    Boundary datasets are the inputs of the run produced by nodes outside of the run, and
+    the outputs of the run consumed by nodes outside of the run.
+
+    Args:
+        pipeline: Pipeline of the run, i.e., the nodes of a task
+        full_pipeline: Pipeline the task is part of
+    Returns:
+        Names of the boundary datasets.
+    """
+    produced, consumed = set(), set()
+    for node in full_pipeline.nodes:
+        produced.update(node.outputs)
+        consumed.update(node.inputs)
+
+    return {dataset for dataset in (pipeline.inputs() & produced) | (pipeline.outputs() & consumed) if _is_registrable(dataset)}
+
+
+def _is_registrable(dataset: str) -> bool:
+    # NOTE: Transcoded datasets require a catalog entry, and are therefore excluded
+    return "@" not in dataset and not dataset.startswith("params:") and dataset != "parameters"
+
+
+def get_expected_format(node: Node, dataset: str) -> str | None:
+    """Function to derive the expected format of a dataset from the return annotation of its producer.
+
+    Args:
+        node: Node producing the dataset, may be a fused node
+        dataset: Name of the dataset
+    Returns:
+        Expected format, or None if the producer is not annotated.
+    """
+    for inner in getattr(node, "_nodes", [node]):
+        if dataset not in inner.outputs:
+            continue
+
+        try:
+            annotation = inspect.signature(inner.func, eval_str=True).return_annotation
+        except (NameError, TypeError, ValueError):
+            return None
+
+        if annotation is inspect.Signature.empty:
+            return None
+
+        # NOTE: Nodes with multiple outputs are annotated with a tuple, or a dictionary
+        if len(inner.outputs) > 1:
+            args = getattr(annotation, "__args__", ())
+            if getattr(annotation, "__origin__", None) is not tuple or len(args) != len(inner.outputs):
+                return None
+            annotation = args[inner.outputs.index(dataset)]
+
+        return _get_type_format(getattr(annotation, "__origin__", annotation))
+
+    return None
+
+
+def get_unregistered_boundary_datasets(pipeline: Pipeline, catalog: Any) -> dict[str, dict[str, Any]]:
+    """Function to find the datasets crossing a task boundary, without an entry in the catalog.
+
+    Without registration, Kedro treats such datasets as `MemoryDataset`, i.e., the data is
+    lost once the producing task finishes.
+
+    Args:
+        pipeline: Pipeline of the workflow, where each node is executed as a task
+        catalog: Catalog to check for entries, including dataset factory patterns
+    Returns:
+        Dictionary mapping each dataset to its `producer`, `consumers` and expected `format`.
+    """
+    producers = {dataset: node for node in pipeline.nodes for dataset in node.outputs}
+    datasets = {}
+    for node in pipeline.nodes:
+        for dataset in node.inputs:
+            producer = producers.get(dataset)
+            if producer is None or producer.name == node.name or dataset in catalog or not _is_registrable(dataset):
+                continue
+
+            entry = datasets.setdefault(
+                dataset,
+                {"producer": producer.name, "consumers": [], "format": get_expected_format(producer, dataset)},
+            )
+            entry["consumers"].append(node.name)
+
+    return datasets
@@ -6,9 +6,24 @@ from kedro.runner.sequential_runner import SequentialRunner
 from pluggy import PluginManager
 
 from argo_kedro.pipeline.fused_pipeline import FusedNode
+from argo_kedro.framework.metadata import MetadataHooks, MetadataStore, RunRecord
+from argo_kedro.framework.tracing import Tracer, TracingHooks
+from argo_kedro.runners.boundary import (
+    BoundaryDataset,
+    PartitionedBoundaryDataset,
+    get_boundary_datasets,
+    get_partitioned_datasets,
+)
+from argo_kedro.runners.read_cache import CachedDataset, ReadCache, is_remote
+from argo_kedro.runners.resources import apply_runtime_env, get_available_cpus
+from argo_kedro.runners.streaming import StreamDataset, as_stream_consumer, as_stream_producer
 
+import inspect
+import json
 import os
 import re
+import time
+import uuid
 from pathlib import Path
 from typing import Any, Dict, List
 from logging import getLogger
@@ -26,6 +41,25 @@ from kedro.pipeline.node import Node
 LOGGER = getLogger(__name__)
 ARGO_TEMPLATES_DIR_PATH = Path(__file__).parent.parent.parent / "templates"
 
+# Path the runner reports the start and end of node execution to, picked up by
+# Argo as an output of the task, and used to break down the duration of tasks.
+TIMINGS_ENV_VAR = "ARGO_KEDRO_TIMINGS"
+
+
+def get_pipeline(pipeline_name: str) -> Pipeline:
+    """Function to resolve a registered pipeline, or the union of comma-separated pipelines, as
+    run by the tasks of a workflow merging several pipelines."""
+    if "," not in pipeline_name:
+        return pipelines[pipeline_name]
+
+    # NOTE: Nodes shared by pipelines are included once, fused nodes are kept as is
+    nodes = {}
+    for name in pipeline_name.split(","):
+        for node in pipelines[name].nodes:
+            nodes.setdefault(node.name, node)
+
+    return Pipeline(list(nodes.values()))
+
 
 class FusedRunner(SequentialRunner):
     """Fused runner is an extension of the SequentialRunner that
@@ -37,6 +71,11 @@ class FusedRunner(SequentialRunner):
         is_async: bool = False,
         pipeline_name: str | None = None,
         use_memory_datasets: bool = False,
+        read_cache: ReadCache | None = None,
+        tracer: Tracer | None = None,
+        boundary_path: str | None = None,
+        stream_buffer_size: int = 2,
+        metadata_store: MetadataStore | None = None,
     ):
         """Instantiates the runner class.
 
@@ -48,10 +87,50 @@ class FusedRunner(SequentialRunner):
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
             pipeline_name: Name of the pipeline to run.
+            use_memory_datasets: If True, datasets within the fusing boundary are kept in memory.
+            read_cache: Optional cache to serve loads of remote input datasets from local disk.
+            tracer: Optional tracer, to emit spans for the run, each node and each dataset load and save.
+            boundary_path: Optional path to store datasets crossing the task boundary without a catalog entry.
+            stream_buffer_size: Number of chunks a generator node produces ahead of its streaming consumer.
+            metadata_store: Optional store, to record the resource usage of the run, each node and each dataset load and save.
         """
         self._is_async = is_async
         self._pipeline_name = pipeline_name
         self._use_memory_datasets = use_memory_datasets
+        self._read_cache = read_cache
+        self._tracer = tracer
+        self._boundary_path = boundary_path
+        self._stream_buffer_size = stream_buffer_size
+        self._metadata_store = metadata_store
+        self._boundary_datasets: dict[str, BoundaryDataset | PartitionedBoundaryDataset] = {}
+
+    def run(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager | None = None,
+        run_id: str | None = None,
+        only_missing_outputs: bool = False,
+    ) -> dict[str, Any]:
+        # NOTE: Thread pools are sized to the CPUs of the container, rather than the host,
+        # unless sized by the workflow already.
+        apply_runtime_env(get_available_cpus())
+
+        # NOTE: Boundary datasets are registered before Kedro validates the inputs of the run,
+        # as unregistered inputs are otherwise considered missing.
+        self._boundary_datasets = {}
+        if self._boundary_path is not None and self._pipeline_name is not None:
+            full_pipeline = get_pipeline(self._pipeline_name)
+            # NOTE: Outputs of partitioned nodes are stored per partition, as each shard of the
+            # fan-out only produces its own partitions.
+            partitioned = get_partitioned_datasets(full_pipeline)
+            for dataset in sorted(get_boundary_datasets(pipeline, full_pipeline)):
+                if dataset not in catalog:
+                    dataset_type = PartitionedBoundaryDataset if dataset in partitioned else BoundaryDataset
+                    self._boundary_datasets[dataset] = dataset_type(f"{self._boundary_path.rstrip('/')}/{dataset}")
+                    catalog[dataset] = self._boundary_datasets[dataset]
+
+        return super().run(pipeline, catalog, hook_manager, run_id, only_missing_outputs)
 
     def _run(
         self,
@@ -67,29 +146,166 @@ class FusedRunner(SequentialRunner):
         if self._use_memory_datasets:
             for node in nodes:
                 if isinstance(node, FusedNode):
-                    pipeline = Pipeline(node._nodes)
-
-                    outputs = pipeline.outputs()
-                    for dataset in pipeline.datasets():
+                    for dataset in self._get_memory_datasets(node, get_pipeline(self._pipeline_name)):
+                        catalog._datasets[dataset] = MemoryDataset()
 
-                        found = False
-                        for pipeline_node in pipelines[self._pipeline_name].nodes:
-                            if node.name != pipeline_node.name:
-                                if dataset in pipeline_node.inputs:
-                                    found = True
-                                    break
+        # NOTE: Inputs of the pipeline are only loaded, and hence safe to cache
+        if self._read_cache is not None:
+            for dataset in pipeline.inputs():
+                if is_remote(catalog.get(dataset)):
+                    catalog[dataset] = CachedDataset(catalog.get(dataset), self._read_cache)
 
-                        if found:
-                            print(f"{dataset} found as input to other pipeline node")
-                            outputs.append(dataset)
+        # NOTE: Chunks of generator nodes stream to their consumers within the fused node,
+        # such that only datasets crossing the fusing boundary are materialized.
+        streams = set()
+        for node in nodes:
+            if isinstance(node, FusedNode):
+                streams.update(self._get_streamed_datasets(node, get_pipeline(self._pipeline_name) if self._pipeline_name else pipeline))
 
-                    for dataset in pipeline.datasets().difference(pipeline.inputs().union(outputs)):
-                        catalog._datasets[dataset] = MemoryDataset()
+        for dataset in streams:
+            catalog[dataset] = StreamDataset(buffer_size=self._stream_buffer_size)
 
-        # Invoke super runner
-        super()._run(
-            Pipeline([Pipeline(node._nodes) if isinstance(node, FusedNode) else node for node in nodes]),
-            catalog,
-            hook_manager,
-            session_id,
+        unfused_pipeline = Pipeline(
+            [
+                self._get_streaming_node(inner, streams)
+                for node in nodes
+                for inner in (node._nodes if isinstance(node, FusedNode) else [node])
+            ]
         )
+        metadata_hooks = MetadataHooks(catalog) if self._metadata_store is not None else None
+        if metadata_hooks is not None:
+            hook_manager.register(metadata_hooks)
+
+        started_at, started_cpu, status = time.time(), time.process_time(), "ERROR"
+        try:
+            if self._tracer is None:
+                super()._run(unfused_pipeline, catalog, hook_manager, session_id)
+            else:
+                self._run_traced(unfused_pipeline, catalog, hook_manager, session_id)
+            status = "OK"
+        finally:
+            run = None
+            if metadata_hooks is not None:
+                hook_manager.unregister(metadata_hooks)
+                run = RunRecord(
+                    run_id=uuid.uuid4().hex,
+                    workflow=os.environ.get("WORKFLOW_ID"),
+                    task=",".join(node.name for node in nodes),
+                    pipeline=self._pipeline_name,
+                    started_at=started_at,
+                    wall_time=time.time() - started_at,
+                    cpu_time=time.process_time() - started_cpu,
+                    peak_rss=max((node.peak_rss for node in metadata_hooks.nodes if node.peak_rss is not None), default=None),
+                    status=status,
+                    nodes=metadata_hooks.nodes,
+                    datasets=metadata_hooks.datasets,
+                )
+                self._metadata_store.save(run)
+
+            if timings_path := os.environ.get(TIMINGS_ENV_VAR):
+                with open(timings_path, "w") as f:
+                    json.dump(
+                        {
+                            "started_at": started_at,
+                            "finished_at": time.time(),
+                            "nodes": len(unfused_pipeline.nodes),
+                            "datasets": {
+                                name: {"format": dataset.format, "size": dataset.size}
+                                for name, dataset in self._boundary_datasets.items()
+                                if dataset.format is not None
+                            },
+                            # NOTE: Runs on the cluster are recorded by `submit --wait` and `stats --ingest`
+                            **({"metadata": run.model_dump()} if run is not None else {}),
+                        },
+                        f,
+                    )
+
+    def _run_traced(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager,
+        session_id: str | None = None,
+    ) -> None:
+        hooks = TracingHooks(self._tracer)
+        hook_manager.register(hooks)
+        try:
+            with self._tracer.span("kedro.run", {"pipeline": self._pipeline_name or "", "nodes": len(pipeline.nodes)}):
+                super()._run(pipeline, catalog, hook_manager, session_id)
+        finally:
+            hook_manager.unregister(hooks)
+
+    def _get_streaming_node(self, node: Node, streams: set[str]) -> Node:
+        # NOTE: Copies are plain Kedro nodes, the streamed inputs are therefore read upfront
+        consumed = getattr(node, "streams", None)
+        if set(node.outputs) & streams:
+            node = as_stream_producer(node)
+
+        if consumed:
+            node = as_stream_consumer(node, consumed)
+
+        return node
+
+    def _get_streamed_datasets(self, node: FusedNode, pipeline: Pipeline) -> set[str]:
+        """Function to determine the datasets that stream between the nodes of a fused node.
+
+        A dataset is streamed when its consumer accepts it as a stream, it is produced by a
+        generator node with a single output, and does not cross the fusing boundary. As
+        chunks can be iterated only once, the dataset should have no other consumers.
+
+        Args:
+            node: Fused node to analyse
+            pipeline: Pipeline under execution
+        Returns:
+            Set of datasets to stream.
+        """
+        internal = self._get_memory_datasets(node, pipeline)
+
+        streams = set()
+        for consumer in node._nodes:
+            for dataset in getattr(consumer, "streams", []):
+                producer = next((inner for inner in node._nodes if dataset in inner.outputs), None)
+                if producer is None:
+                    continue
+
+                if (
+                    dataset in internal
+                    and inspect.isgeneratorfunction(producer.func)
+                    and len(producer.outputs) == 1
+                    and sum(dataset in inner.inputs for inner in node._nodes) == 1
+                ):
+                    streams.add(dataset)
+                else:
+                    LOGGER.info(f"{dataset} can not be streamed to {consumer.name}, and is materialized instead")
+
+        return streams
+
+    def _get_memory_datasets(self, node: FusedNode, pipeline: Pipeline) -> set[str]:
+        """Function to determine the datasets that can be kept in memory for a fused node.
+
+        Datasets produced and consumed within the fused node are kept in memory, unless
+        they are consumed by any other node of the pipeline, i.e., cross the fusing boundary.
+
+        Args:
+            node: Fused node to analyse
+            pipeline: Pipeline under execution
+        Returns:
+            Set of datasets that can be kept in memory.
+        """
+        fused_pipeline = Pipeline(node._nodes)
+
+        outputs = fused_pipeline.outputs()
+        for dataset in fused_pipeline.datasets():
+
+            found = False
+            for pipeline_node in pipeline.nodes:
+                if node.name != pipeline_node.name:
+                    if dataset in pipeline_node.inputs:
+                        found = True
+                        break
+
+            if found:
+                LOGGER.info(f"{dataset} found as input to other pipeline node")
+                outputs.add(dataset)
+
+        return fused_pipeline.datasets().difference(fused_pipeline.inputs().union(outputs))
@@ -0,0 +1,156 @@
+import copy
+import hashlib
+import os
+import shutil
+import uuid
+from logging import getLogger
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+import fsspec
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str
+
+LOGGER = getLogger(__name__)
+
+
+class ReadCache:
+    """Read-through cache for remote files, kept on a node-local volume.
+
+    Files are keyed by their path and checksum, i.e., the ETag or generation of the object
+    as reported by the filesystem, such that a new version of the object results in a
+    cache miss. The cache is shared by all pods on the node, files are therefore downloaded
+    to a temporary location and moved in place atomically. Entries are evicted in least
+    recently used order once the size of the cache exceeds `max_size`.
+    """
+
+    def __init__(self, path: str | Path, max_size: int):
+        """Instantiates the cache.
+
+        Args:
+            path: Directory to keep the cached files in
+            max_size: Maximum size of the cache, in bytes
+        """
+        self._path = Path(path)
+        self._max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def fetch(self, fs: fsspec.AbstractFileSystem, path: str) -> Path:
+        """Function to retrieve the local copy of a remote file or directory.
+
+        Args:
+            fs: Filesystem holding the file
+            path: Path of the file on the filesystem
+        Returns:
+            Path to the local copy of the file.
+        """
+        key = hashlib.sha256(f"{fs.unstrip_protocol(path)}:{fs.checksum(path)}".encode()).hexdigest()
+        entry = self._path / key
+        local_path = entry / PurePosixPath(path).name
+
+        if entry.exists():
+            self.hits += 1
+            os.utime(entry)
+            LOGGER.info(f"Loading `{path}` from read cache")
+            return local_path
+
+        self.misses += 1
+        tmp = self._path / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir(parents=True)
+        try:
+            fs.get(path, str(tmp / local_path.name), recursive=fs.isdir(path))
+            os.rename(tmp, entry)
+        except OSError:
+            # NOTE: Another pod on the node cached the file concurrently
+            if not entry.exists():
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        self.evict(keep=key)
+        return local_path
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """Function to evict the least recently used entries, until the cache fits its size.
+
+        Args:
+            keep: Optional key of an entry that should not be evicted
+        Returns:
+            Keys of the evicted entries.
+        """
+        entries = []
+        for entry in self._path.iterdir():
+            if entry.name.startswith(".tmp-"):
+                continue
+
+            try:
+                size = sum(file.stat().st_size for file in entry.rglob("*") if file.is_file())
+                entries.append((entry.stat().st_mtime, size, entry))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for _, size, entry in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self._max_size:
+                break
+
+            if entry.name == keep:
+                continue
+
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            evicted.append(entry.name)
+
+        return evicted
+
+
+def is_remote(dataset: AbstractDataset) -> bool:
+    """Function to check whether the dataset loads from a remote fsspec filesystem."""
+    return (
+        getattr(dataset, "_protocol", "file") != "file"
+        and hasattr(dataset, "_fs")
+        and hasattr(dataset, "_get_load_path")
+    )
+
+
+class CachedDataset(AbstractDataset):
+    """Dataset wrapping a remote dataset, serving its loads from the read cache.
+
+    The wrapped dataset is loaded from a copy that points to the cached local file,
+    saves are passed through to the remote dataset.
+    """
+
+    def __init__(self, dataset: AbstractDataset, cache: ReadCache):
+        self._dataset = dataset
+        self._cache = cache
+
+    def load(self) -> Any:
+        local_path = self._cache.fetch(
+            self._dataset._fs, get_filepath_str(self._dataset._get_load_path(), self._dataset._protocol)
+        )
+
+        # NOTE: The version is resolved into the load path, and hence part of the cache key
+        local_dataset = copy.copy(self._dataset)
+        local_dataset._protocol = "file"
+        local_dataset._fs = fsspec.filesystem("file")
+        local_dataset._filepath = PurePosixPath(local_path)
+        local_dataset._version = None
+        return local_dataset.load()
+
+    def save(self, data: Any) -> None:
+        self._dataset.save(data)
+
+    def _exists(self) -> bool:
+        return self._dataset.exists()
+
+    def _release(self) -> None:
+        self._dataset.release()
+
+    def _describe(self) -> dict[str, Any]:
+        return {"dataset": self._dataset._describe(), "cache": str(self._cache.path)}
@@ -0,0 +1,92 @@
+import math
+import os
+from logging import getLogger
+from pathlib import Path
+
+LOGGER = getLogger(__name__)
+
+# Environment variables sizing the thread pools of numerical libraries, which otherwise
+# default to the number of cores of the host rather than the CPU limit of the container.
+THREAD_ENV_VARS = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "NUMEXPR_MAX_THREADS",
+    "NUMBA_NUM_THREADS",
+    "POLARS_MAX_THREADS",
+    "RAYON_NUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS",
+    "LOKY_MAX_CPU_COUNT",
+    # NOTE: glibc creates up to 8 malloc arenas per core, inflating the memory of threaded processes
+    "MALLOC_ARENA_MAX",
+]
+
+CGROUP_PATH = Path("/sys/fs/cgroup")
+
+
+def get_runtime_env(threads: int, overrides: dict[str, str] | None = None) -> dict[str, str]:
+    """Function to derive the runtime environment of a task from its CPU allocation.
+
+    Args:
+        threads: Number of threads to size thread pools to, typically the CPU limit
+        overrides: Environment variables taking precedence over the derived variables
+    Returns:
+        Dictionary of environment variables.
+    """
+    return {**{name: str(threads) for name in THREAD_ENV_VARS}, **(overrides or {})}
+
+
+def get_cgroup_cpu_limit(cgroup_path: Path = CGROUP_PATH) -> float | None:
+    """Function to read the CPU limit of the container from its cgroup, for cgroup v2 and v1.
+
+    Returns:
+        Number of CPUs the container is limited to, or None if unlimited.
+    """
+    try:
+        if (cgroup_path / "cpu.max").exists():
+            quota, period = (cgroup_path / "cpu.max").read_text().split()
+        else:
+            quota = (cgroup_path / "cpu" / "cpu.cfs_quota_us").read_text().strip()
+            period = (cgroup_path / "cpu" / "cpu.cfs_period_us").read_text().strip()
+    except (OSError, ValueError):
+        return None
+
+    if quota in ("max", "-1"):
+        return None
+
+    return int(quota) / int(period)
+
+
+def get_available_cpus(cgroup_path: Path = CGROUP_PATH) -> int:
+    """Function to determine the number of CPUs available to the process.
+
+    Unlike `os.cpu_count`, the CPU affinity of the process and the CPU limit of its
+    container are taken into account.
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    limit = get_cgroup_cpu_limit(cgroup_path)
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+
+    return max(cpus, 1)
+
+
+def apply_runtime_env(threads: int) -> None:
+    """Function to apply the runtime environment to the current process.
+
+    Variables set by the workflow take precedence. As libraries read these variables when
+    loaded, the thread pools of loaded libraries are limited through `threadpoolctl`, if
+    installed.
+    """
+    for name, value in get_runtime_env(threads).items():
+        os.environ.setdefault(name, value)
+
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+
+    threadpool_limits(limits=int(os.environ["OMP_NUM_THREADS"]))
@@ -0,0 +1,168 @@
+import functools
+import inspect
+import threading
+from logging import getLogger
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterable, Iterator
+
+from kedro.io import AbstractDataset, DatasetError
+from kedro.pipeline.node import Node as KedroNode
+
+LOGGER = getLogger(__name__)
+
+# Interval at which blocked producer and consumer threads check whether the stream was abandoned
+_POLL_INTERVAL = 0.1
+
+
+class _StreamEnd:
+    pass
+
+
+class _StreamError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(chunks: Iterable[Any], buffer_size: int) -> Iterator[Any]:
+    """Function to produce chunks ahead of the consumer, in a background thread.
+
+    At most `buffer_size` chunks are buffered, the producer blocks once the buffer is
+    full, i.e., memory is bounded by the size of the buffer rather than the data.
+    Errors raised by the producer are raised in the consumer.
+
+    Args:
+        chunks: Chunks to produce, typically a generator
+        buffer_size: Maximum number of chunks produced ahead of the consumer
+    Returns:
+        Iterator over the chunks.
+    """
+    buffer: Queue = Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(_StreamEnd())
+        except BaseException as e:
+            put(_StreamError(e))
+
+    thread = threading.Thread(target=produce, name="argo-kedro-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            try:
+                item = buffer.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                continue
+
+            if isinstance(item, _StreamEnd):
+                return
+            if isinstance(item, _StreamError):
+                raise item.error
+            yield item
+    finally:
+        # NOTE: Unblocks the producer when the consumer stops early
+        stopped.set()
+
+
+class StreamDataset(AbstractDataset):
+    """Dataset passing the chunks of a generator node to its consumer, without materializing them.
+
+    The producer saves its generator, which is handed to the consumer on load. Chunks are
+    therefore only produced as the consumer iterates, and can be loaded only once.
+    """
+
+    def __init__(self, buffer_size: int = 2):
+        """Instantiates the dataset.
+
+        Args:
+            buffer_size: Number of chunks produced ahead of the consumer, in a background
+                thread, or 0 to produce chunks as the consumer requests them.
+        """
+        self._buffer_size = buffer_size
+        self._stream: Iterator[Any] | None = None
+
+    def load(self) -> Iterator[Any]:
+        if self._stream is None:
+            raise DatasetError("Stream was not produced, or already consumed, streams can only be loaded once")
+
+        stream, self._stream = self._stream, None
+        return prefetch(stream, self._buffer_size) if self._buffer_size > 0 else stream
+
+    def save(self, data: Iterator[Any]) -> None:
+        self._stream = data
+
+    def _exists(self) -> bool:
+        return self._stream is not None
+
+    def _release(self) -> None:
+        self._stream = None
+
+    def _describe(self) -> dict[str, Any]:
+        return {"buffer_size": self._buffer_size}
+
+
+def as_chunks(data: Any) -> Iterator[Any]:
+    """Function to present data as an iterator of chunks, i.e., materialized data as a single chunk."""
+    return data if isinstance(data, Iterator) else iter([data])
+
+
+def as_stream_producer(node: KedroNode) -> KedroNode:
+    """Function to copy a generator node, such that Kedro passes its generator on rather than saving each chunk."""
+
+    # NOTE: Kedro iterates the outputs of generator functions only, the wrapper returns the generator instead
+    @functools.wraps(node.func)
+    def produce(*args, **kwargs):
+        return node.func(*args, **kwargs)
+
+    return node._copy(func=produce)
+
+
+def as_stream_consumer(node: KedroNode, streams: Iterable[str]) -> KedroNode:
+    """Function to copy a node, such that the given inputs are passed as iterators of chunks.
+
+    Inputs that are not streamed, e.g., as they are loaded from the catalog, are passed as a single chunk.
+    """
+    streams = set(streams)
+    if isinstance(node._inputs, dict):
+        keys = {arg for arg, dataset in node._inputs.items() if dataset in streams}
+        positions = set()
+    else:
+        keys = set()
+        positions = {position for position, dataset in enumerate(node.inputs) if dataset in streams}
+
+    func: Callable = node.func
+
+    def wrap(args, kwargs) -> tuple[list[Any], dict[str, Any]]:
+        args = [as_chunks(arg) if position in positions else arg for position, arg in enumerate(args)]
+        kwargs = {key: as_chunks(value) if key in keys else value for key, value in kwargs.items()}
+        return args, kwargs
+
+    # NOTE: Generator functions remain generator functions, such that Kedro saves their chunks
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def consume(*args, **kwargs):
+            args, kwargs = wrap(args, kwargs)
+            yield from func(*args, **kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def consume(*args, **kwargs):
+            args, kwargs = wrap(args, kwargs)
+            return func(*args, **kwargs)
+
+    return node._copy(func=consume)
@@ -0,0 +1,76 @@
+"""Synthetic pipeline generators for the benchmark suite."""
+
+from kedro.pipeline import Pipeline
+
+from argo_kedro.pipeline import FusedPipeline, Node
+
+
+def _identity(*args):
+    return args[0] if args else None
+
+
+def _node(inputs: str | list[str] | None, outputs: str | list[str], name: str, namespace: str | None = None) -> Node:
+    return Node(func=_identity, inputs=inputs, outputs=outputs, name=name, namespace=namespace)
+
+
+def chain(num_nodes: int) -> Pipeline:
+    """Pipeline where each node consumes the output of the previous node."""
+    return Pipeline([_node(f"dataset_{idx}", f"dataset_{idx + 1}", f"node_{idx}") for idx in range(num_nodes)])
+
+
+def fan(num_nodes: int) -> Pipeline:
+    """Pipeline with a single source, fanning out to parallel nodes, gathered by a single sink."""
+    width = max(num_nodes - 2, 1)
+    return Pipeline(
+        [
+            _node("raw", "source", "source"),
+            *[_node("source", f"branch_{idx}", f"branch_{idx}") for idx in range(width)],
+            _node([f"branch_{idx}" for idx in range(width)], "sink", "sink"),
+        ]
+    )
+
+
+def diamonds(num_nodes: int) -> Pipeline:
+    """Pipeline of chained diamonds, i.e., `a -> (b, c) -> d`, where `d` is the `a` of the next diamond."""
+    nodes = []
+    for idx in range(max(num_nodes // 3, 1)):
+        nodes.extend(
+            [
+                _node(f"top_{idx}", f"left_{idx}", f"left_{idx}"),
+                _node(f"top_{idx}", f"right_{idx}", f"right_{idx}"),
+                _node([f"left_{idx}", f"right_{idx}"], f"top_{idx + 1}", f"bottom_{idx}"),
+            ]
+        )
+
+    return Pipeline(nodes)
+
+
+def namespaces(num_nodes: int, depth: int = 8) -> Pipeline:
+    """Chained pipeline, where nodes and datasets live in deeply nested namespaces."""
+    namespace = ".".join(f"namespace_{level}" for level in range(depth))
+    return Pipeline(
+        [
+            _node(f"{namespace}.dataset_{idx}", f"{namespace}.dataset_{idx + 1}", f"node_{idx}", namespace=namespace)
+            for idx in range(num_nodes)
+        ]
+    )
+
+
+def fused(num_nodes: int, group_size: int = 10) -> Pipeline:
+    """Chained pipeline, where consecutive nodes are fused in groups of `group_size`."""
+    nodes = chain(num_nodes).nodes
+    return Pipeline(
+        [
+            FusedPipeline(nodes[start : start + group_size], name=f"fused_{start}")
+            for start in range(0, len(nodes), group_size)
+        ]
+    )
+
+
+SHAPES = {
+    "chain": chain,
+    "fan": fan,
+    "diamonds": diamonds,
+    "namespaces": namespaces,
+    "fused": fused,
+}
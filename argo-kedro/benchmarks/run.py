@@ -0,0 +1,243 @@
+"""Micro-benchmarks for the compile and runtime hot paths of argo-kedro.
+
+Usage:
+    python -m benchmarks.run                  # run the suite and print the results
+    python -m benchmarks.run --save-baseline  # store the results as the new baseline
+    python -m benchmarks.run --check          # fail when a hot path regressed against the baseline
+"""
+
+import argparse
+import json
+import logging
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline
+
+from argo_kedro.framework.cli.cli import ARGO_TEMPLATES_DIR_PATH, get_argo_dag, render_jinja_template
+from argo_kedro.framework.hooks.argo_hook import MachineType, TemplateConfig
+from argo_kedro.pipeline import FusedPipeline
+from argo_kedro.pipeline.fused_pipeline import FusedNode
+from argo_kedro.runners import FusedRunner, fuse_runner
+from benchmarks.generators import SHAPES, chain
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+SIZES = [10, 100, 1_000, 10_000, 50_000]
+MACHINE_TYPES = {"default": MachineType(mem=16, cpu=4, num_gpu=0)}
+
+
+def _get_argo_dag(shape: str) -> Callable[[int], Callable[[], object]]:
+    def setup(num_nodes: int) -> Callable[[], object]:
+        pipeline = SHAPES[shape](num_nodes)
+        return lambda: get_argo_dag(pipeline, MACHINE_TYPES, "default")
+
+    return setup
+
+
+def _fused_node(num_nodes: int) -> Callable[[], object]:
+    nodes = chain(num_nodes).nodes
+    return lambda: FusedNode(nodes, name="fused")
+
+
+def _grouped_nodes(num_nodes: int) -> Callable[[], object]:
+    nodes = chain(num_nodes).nodes
+    return lambda: FusedPipeline(nodes, name="fused").grouped_nodes
+
+
+def _memory_datasets(num_nodes: int) -> Callable[[], object]:
+    # NOTE: Half of the nodes are fused, the other half consumes the fused outputs
+    nodes = chain(num_nodes).nodes
+    pipeline = Pipeline([FusedPipeline(nodes[: num_nodes // 2], name="fused"), *nodes[num_nodes // 2 :]])
+    fused_node = next(node for node in pipeline.nodes if isinstance(node, FusedNode))
+    runner = FusedRunner(pipeline_name="__default__", use_memory_datasets=True)
+    return lambda: runner._get_memory_datasets(fused_node, pipeline)
+
+
+def _fused_runner_run(num_nodes: int) -> Callable[[], object]:
+    # NOTE: The fused half runs as a task would, i.e., with the boundary, memory and streamed datasets
+    # analysed against the registered pipeline, and its output crossing the boundary to the other half.
+    nodes = chain(num_nodes).nodes
+    pipeline = Pipeline([FusedPipeline(nodes[: num_nodes // 2], name="fused"), *nodes[num_nodes // 2 :]])
+    fuse_runner.pipelines = {"__default__": pipeline}
+    logging.getLogger("kedro").setLevel(logging.WARNING)
+    logging.getLogger(fuse_runner.__name__).setLevel(logging.ERROR)
+
+    task = pipeline.only_nodes("fused")
+    runner = FusedRunner(pipeline_name="__default__", use_memory_datasets=True, boundary_path=tempfile.mkdtemp())
+    run = lambda: runner.run(task, DataCatalog({"dataset_0": MemoryDataset(0)}))
+
+    # NOTE: The first run imports datasets and discovers thread pools, which is not part of the hot path
+    run()
+    return run
+
+
+def _render_template(num_nodes: int) -> Callable[[], object]:
+    # NOTE: Tasks are generated directly, as compiling large pipelines is benchmarked separately
+    pipeline_tasks = [
+        {"name": f"node-{idx}", "nodes": f"node_{idx}", "deps": [f"node-{idx - 1}"] if idx else [], "mem": 16, "cpu": 4, "num_gpu": 0}
+        for idx in range(num_nodes)
+    ]
+    return lambda: render_jinja_template(
+        src=ARGO_TEMPLATES_DIR_PATH / "argo_wf_spec.tmpl",
+        trim_blocks=True,
+        lstrip_blocks=True,
+        pipeline_tasks=pipeline_tasks,
+        template=TemplateConfig(),
+        pipeline_name="__default__",
+        image="image:latest",
+        namespace="argo-workflows",
+        environment="cloud",
+        workflow_name="workflow",
+    )
+
+
+BENCHMARKS: dict[str, Callable[[int], Callable[[], object]]] = {
+    **{f"get_argo_dag/{shape}": _get_argo_dag(shape) for shape in SHAPES},
+    "fused_node/chain": _fused_node,
+    "grouped_nodes/chain": _grouped_nodes,
+    "memory_datasets/chain": _memory_datasets,
+    "fused_runner_run/chain": _fused_runner_run,
+    "render_template/chain": _render_template,
+}
+
+
+def calibrate() -> float:
+    """Time a fixed workload, used to normalize timings across machines."""
+    return min(_timeit(lambda: sum(idx * idx for idx in range(1_000_000))) for _ in range(5))
+
+
+def _timeit(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure(func: Callable[[], object], min_time: float = 0.2, max_repeats: int = 5) -> float:
+    """Measure the best-of-n execution time, repeating fast functions to reduce noise."""
+    timings = [_timeit(func)]
+    while len(timings) < max_repeats and sum(timings) < min_time:
+        timings.append(_timeit(func))
+
+    return min(timings)
+
+
+def run(sizes: list[int], budget: float, select: str | None = None) -> dict:
+    """Run the benchmark suite.
+
+    Sizes are increased per benchmark until the projected time of the next size, based
+    on the scaling observed so far, exceeds the budget, such that super-linear hot paths
+    do not stall the suite on the largest sizes.
+    """
+    calibration = calibrate()
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if select is not None and select not in name:
+            continue
+
+        measured = []
+        for num_nodes in sorted(sizes):
+            if measured and _project(measured, num_nodes) > budget:
+                print(f"{name + '/' + str(num_nodes):<40} {'skipped':>14}", flush=True)
+                break
+
+            seconds = measure(setup(num_nodes))
+            measured.append((num_nodes, seconds))
+            results[f"{name}/{num_nodes}"] = {"seconds": seconds, "normalized": seconds / calibration}
+            print(f"{name + '/' + str(num_nodes):<40} {seconds * 1000:>12.3f}ms", flush=True)
+
+    return {"calibration": calibration, "results": results}
+
+
+def _project(measured: list[tuple[int, float]], num_nodes: int) -> float:
+    """Project the time for the given size, assuming at least linear scaling."""
+    exponent = 1.0
+    if len(measured) >= 2:
+        (small_size, small_time), (large_size, large_time) = measured[-2:]
+        exponent = max(exponent, math.log(large_time / small_time) / math.log(large_size / small_size))
+
+    size, seconds = measured[-1]
+    return seconds * (num_nodes / size) ** exponent
+
+
+def scaling(results: dict) -> dict[str, float]:
+    """Compute the empirical scaling exponent of each benchmark between its two largest sizes,
+    i.e., ~1 for linear and ~2 for quadratic hot paths."""
+    exponents = {}
+    for name in BENCHMARKS:
+        measured = sorted(
+            (int(key.rsplit("/", 1)[1]), value["seconds"])
+            for key, value in results.items()
+            if key.rsplit("/", 1)[0] == name
+        )
+        if len(measured) >= 2:
+            (small_size, small_time), (large_size, large_time) = measured[-2:]
+            exponents[name] = math.log(large_time / small_time) / math.log(large_size / small_size)
+
+    return exponents
+
+
+def check(results: dict, baseline: dict, threshold: float, min_seconds: float) -> list[str]:
+    """Compare the results against the baseline.
+
+    Returns:
+        List of regressions, i.e., benchmarks whose normalized time exceeds the
+        baseline by more than the threshold.
+    """
+    regressions = []
+    for key, value in results["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None or reference["seconds"] < min_seconds:
+            continue
+
+        ratio = value["normalized"] / reference["normalized"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{key}: {ratio:.2f}x slower than baseline")
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Pipeline sizes, in number of nodes")
+    parser.add_argument("--budget", type=float, default=5.0, help="Skip sizes projected to exceed this many seconds")
+    parser.add_argument("--select", type=str, default=None, help="Only run benchmarks containing this string")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--check", action="store_true", help="Fail when a benchmark regressed against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Allowed relative slowdown against the baseline")
+    parser.add_argument("--min-seconds", type=float, default=0.001, help="Ignore baseline timings below this many seconds")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.budget, args.select)
+
+    print("\nScaling exponents between the two largest sizes:")
+    for name, exponent in scaling(results["results"]).items():
+        print(f"{name:<40} {exponent:>6.2f}")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+    if args.check:
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+        regressions = check(results, baseline, args.threshold, args.min_seconds)
+        if regressions:
+            print("\nRegressions found:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+
+        print("\nNo regressions found")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
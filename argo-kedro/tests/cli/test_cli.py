@@ -1,8 +1,25 @@
+import json
+import re
+from types import SimpleNamespace
+
 import pytest
+import yaml
 
 from kedro.pipeline import Pipeline, Node as KedroNode
-from argo_kedro.pipeline import FusedPipeline, Node
-from argo_kedro.framework.cli.cli import get_argo_dag, MachineType
+from argo_kedro.pipeline import FusedPipeline, Node, PartitionedNode
+from argo_kedro.framework.cli.cli import (
+    get_argo_dag,
+    get_pipeline_label,
+    get_semaphores,
+    get_sweep_dag,
+    merge_pipelines,
+    reduce_dependencies,
+    render_workflow_spec,
+    report_pooled_tasks,
+    set_task_priorities,
+    MachineType,
+)
+from argo_kedro.framework.hooks.argo_hook import ArgoConfig, BuildTarget, ConcurrencyConfig, DeploymentConfig, PoolConfig, PreemptibleConfig, RunnerConfig
 
 @pytest.fixture
 def machine_types() -> dict[str, MachineType]:
@@ -129,6 +146,7 @@ def test_get_argo_dag(pipeline: Pipeline, machine_types: dict[str, MachineType],
             "mem": 16,
             "cpu": 4,
             "num_gpu": 0,
+            "machine_type": "n1-standard-4",
         },
         "train_fun": {
             "name": "train-fun",
@@ -137,6 +155,7 @@ def test_get_argo_dag(pipeline: Pipeline, machine_types: dict[str, MachineType],
             "mem": 16,
             "cpu": 8,
             "num_gpu": 0,
+            "machine_type": "n1-standard-8",
         }
     }
 
@@ -156,6 +175,7 @@ def test_get_argo_dag_fused(fused_pipeline: Pipeline, machine_types: dict[str, M
             "mem": 16,
             "cpu": 2,
             "num_gpu": 0,
+            "machine_type": "default",
         },
         "fused_modelling": {
             "name": "fused-modelling",
@@ -164,6 +184,7 @@ def test_get_argo_dag_fused(fused_pipeline: Pipeline, machine_types: dict[str, M
             "mem": 16,
             "cpu": 8,
             "num_gpu": 0,
+            "machine_type": "n1-standard-8",
         }
     }
 
@@ -183,6 +204,7 @@ def test_get_argo_dag_fused_complex(fused_pipeline_complex: Pipeline, machine_ty
             "mem": 16,
             "cpu": 2,
             "num_gpu": 0,
+            "machine_type": "default",
         },
         "preprocess_customers": { 
             "name": "preprocess-customers",
@@ -191,6 +213,7 @@ def test_get_argo_dag_fused_complex(fused_pipeline_complex: Pipeline, machine_ty
             "mem": 16,
             "cpu": 2,
             "num_gpu": 0,
+            "machine_type": "default",
         },
         "fused_modelling": {
             "name": "fused-modelling",
@@ -199,6 +222,7 @@ def test_get_argo_dag_fused_complex(fused_pipeline_complex: Pipeline, machine_ty
             "mem": 16,
             "cpu": 8,
             "num_gpu": 0,
+            "machine_type": "n1-standard-8",
         }
     }
 
@@ -237,6 +261,7 @@ def test_get_argo_dag_gpu(machine_types: dict[str, MachineType], default_machine
             "mem": 16,
             "cpu": 2,
             "num_gpu": 0,
+            "machine_type": "default",
         },
         "train_fun": {
             "name": "train-fun",
@@ -245,8 +270,445 @@ def test_get_argo_dag_gpu(machine_types: dict[str, MachineType], default_machine
             "mem": 32,
             "cpu": 8,
             "num_gpu": 1,
+            "machine_type": "gpu-node",
         }
     }
 
     assert {key: task.to_dict() for key, task in argo_dag.items()} == expected
-    
\ No newline at end of file
+    
+
+def test_get_argo_dag_partitioned(machine_types: dict[str, MachineType], default_machine_type: str):
+    """Test that partitioned nodes are expanded into fan-out tasks."""
+    pipeline = Pipeline(
+        [
+            Node(
+                func=lambda x: x,
+                inputs="raw_data",
+                outputs="partition_list",
+                name="list_partitions",
+            ),
+            PartitionedNode(
+                func=lambda partition, x: x,
+                inputs="raw_data",
+                outputs="static_data",
+                partitions=["a", "b"],
+                name="process_static",
+            ),
+            PartitionedNode(
+                func=lambda partition, x: x,
+                inputs="raw_data",
+                outputs="dynamic_data",
+                partitions_from="partition_list",
+                name="process_dynamic",
+            ),
+        ]
+    )
+
+    argo_dag = get_argo_dag(pipeline, machine_types, default_machine_type)
+
+    assert argo_dag["process_static"].to_dict()["partitions"] == ["a", "b"]
+    assert argo_dag["process_dynamic"].to_dict() == {
+        "name": "process-dynamic",
+        "nodes": "process_dynamic",
+        "deps": ["list-partitions", "process-dynamic-partitions"],
+        "mem": 16,
+        "cpu": 2,
+        "num_gpu": 0,
+        "machine_type": "default",
+        "partitions_from": "partition_list",
+        "partitions_deps": ["list-partitions"],
+    }
+
+
+@pytest.mark.parametrize("partitions_from,expected", [("partition_list", True), (None, False)])
+def test_render_workflow_spec_partitions(machine_types: dict[str, MachineType], default_machine_type: str, partitions_from, expected):
+    """Test that the partition discovery template is only rendered for workflows discovering partitions."""
+    pipeline = Pipeline(
+        [
+            PartitionedNode(
+                func=lambda partition, x: x,
+                inputs="raw_data",
+                outputs="data",
+                partitions=None if partitions_from else ["a", "b"],
+                partitions_from=partitions_from,
+                name="process",
+            ),
+        ]
+    )
+    argo = ArgoConfig(
+        namespace="argo-workflows",
+        deployment=DeploymentConfig(image="your-registry/your-image"),
+        machine_types=machine_types,
+        default_machine_type=default_machine_type,
+        runner=RunnerConfig(),
+    )
+
+    tasks = [task.to_dict() for task in get_argo_dag(pipeline, machine_types, default_machine_type).values()]
+    spec = yaml.safe_load(
+        render_workflow_spec(argo, pipeline_tasks=tasks, semaphores={}, pipeline_name="__default__", environment="base", workflow_name="workflow")
+    )
+
+    assert ("kedro-partitions" in {template["name"] for template in spec["spec"]["templates"]}) == expected
+
+
+def test_get_sweep_dag(machine_types: dict[str, MachineType], default_machine_type: str):
+    """Test that the parameter dependent subgraph is duplicated per sweep point."""
+    pipeline = Pipeline(
+        [
+            Node(
+                func=lambda x: x,
+                inputs="raw_data",
+                outputs="data",
+                name="preprocess_fun",
+            ),
+            Node(
+                func=lambda x, y: x,
+                inputs=["data", "params:model_options"],
+                outputs="model",
+                name="train_fun",
+            ),
+            Node(
+                func=lambda x: x,
+                inputs="model",
+                outputs="metrics",
+                name="evaluate_fun",
+            ),
+        ]
+    )
+
+    argo_dag = get_argo_dag(pipeline, machine_types, default_machine_type)
+    sweep_dag = get_sweep_dag(
+        argo_dag,
+        {
+            "small": {"model_options": {"test_size": 0.1}},
+            "large": {"model_options.test_size": 0.3},
+        },
+    )
+
+    # Assert upstream tasks are shared, and downstream tasks are duplicated per sweep point
+    assert [(task.name, task.to_dict()["deps"], task.to_dict().get("params")) for task in sweep_dag.values()] == [
+        ("preprocess-fun", [], None),
+        ("train-fun-small", ["preprocess-fun"], "model_options.test_size=0.1,sweep_point=small"),
+        ("evaluate-fun-small", ["train-fun-small"], "model_options.test_size=0.1,sweep_point=small"),
+        ("train-fun-large", ["preprocess-fun"], "model_options.test_size=0.3,sweep_point=large"),
+        ("evaluate-fun-large", ["train-fun-large"], "model_options.test_size=0.3,sweep_point=large"),
+    ]
+
+
+def test_merge_pipelines(machine_types: dict[str, MachineType], default_machine_type: str):
+    """Test that nodes shared by pipelines are merged into a single task."""
+    def preprocess():
+        return Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fun")
+
+    pipelines = {
+        "data_science": Pipeline([preprocess(), Node(func=lambda x: x, inputs="data", outputs="model", name="train_fun")]),
+        "reporting": Pipeline([preprocess(), Node(func=lambda x: x, inputs="data", outputs="report", name="report_fun")]),
+    }
+
+    merged, members = merge_pipelines(pipelines)
+    argo_dag = get_argo_dag(merged, machine_types, default_machine_type)
+
+    # Assert the shared node runs once, upstream of the tasks of both pipelines
+    assert sorted((task.name, task.to_dict()["deps"]) for task in argo_dag.values()) == [
+        ("preprocess-fun", []),
+        ("report-fun", ["preprocess-fun"]),
+        ("train-fun", ["preprocess-fun"]),
+    ]
+    assert members == {
+        "preprocess_fun": ["data_science", "reporting"],
+        "train_fun": ["data_science"],
+        "report_fun": ["reporting"],
+    }
+
+
+def test_merge_pipelines_conflicting():
+    """Test that nodes producing the same dataset under different names are rejected."""
+    pipelines = {
+        "data_processing": Pipeline([Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fun")]),
+        "__default__": Pipeline([Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fused")]),
+    }
+
+    with pytest.raises(ValueError, match="Dataset `data` is produced by node `preprocess_fused`"):
+        merge_pipelines(pipelines)
+
+
+def test_get_pipeline_label():
+    assert get_pipeline_label("data_science") == "pipeline-data_science"
+    assert get_pipeline_label("__default__") == "pipeline-default"
+    assert get_pipeline_label("reporting.v2") == "pipeline-reporting-v2"
+
+
+@pytest.mark.parametrize("value", [[0.1, 0.3], {"a": []}, "a,b"])
+def test_get_sweep_dag_rejects_ambiguous_params(machine_types: dict[str, MachineType], default_machine_type: str, value):
+    """Test that overrides that cannot be passed as `--params` are rejected."""
+    pipeline = Pipeline([Node(func=lambda x: x, inputs="params:model_options", outputs="model", name="train_fun")])
+    argo_dag = get_argo_dag(pipeline, machine_types, default_machine_type)
+
+    with pytest.raises(ValueError, match="cannot be passed as `--params`"):
+        get_sweep_dag(argo_dag, {"small": {"model_options": {"test_size": value}}})
+
+
+def test_set_task_priorities(fused_pipeline_complex: Pipeline, machine_types: dict[str, MachineType], default_machine_type: str):
+    """Test that tasks are prioritised by the length of their downstream critical path."""
+    argo_dag = get_argo_dag(fused_pipeline_complex, machine_types, default_machine_type)
+
+    # When using estimated durations, i.e., the number of nodes per task
+    set_task_priorities(argo_dag)
+    assert {task.name: task.priority for task in argo_dag.values()} == {
+        "preprocess-fun": 3,
+        "preprocess-customers": 3,
+        "fused-modelling": 2,
+    }
+
+    # When using historical durations
+    set_task_priorities(argo_dag, durations={"preprocess-fun": 10, "preprocess-customers": 60, "fused-modelling": 120})
+    assert {task.name: task.priority for task in argo_dag.values()} == {
+        "preprocess-fun": 130,
+        "preprocess-customers": 180,
+        "fused-modelling": 120,
+    }
+
+
+def test_get_semaphores(pipeline: Pipeline, machine_types: dict[str, MachineType], default_machine_type: str):
+    """Test that semaphores are only emitted when machine types are limited."""
+    argo_dag = get_argo_dag(pipeline, machine_types, default_machine_type)
+
+    assert get_semaphores(argo_dag, ConcurrencyConfig(parallelism=10)) == {}
+    assert get_semaphores(argo_dag, ConcurrencyConfig(machine_types={"n1-standard-8": 1})) == {
+        "n1-standard-4": 2,
+        "n1-standard-8": 1,
+    }
+
+
+def test_get_argo_dag_scheduling():
+    """Test that scheduling constraints of the machine type and preemptible nodes are added to the tasks."""
+    machine_types = {
+        "default": MachineType(mem=16, cpu=2, num_gpu=0),
+        "highmem": MachineType(
+            mem=64,
+            cpu=8,
+            num_gpu=0,
+            node_selector={"pool": "highmem"},
+            tolerations=[{"key": "highmem", "operator": "Exists", "effect": "NoSchedule"}],
+        ),
+    }
+    pipeline = Pipeline(
+        [
+            Node(
+                func=lambda x: x,
+                inputs="raw_data",
+                outputs="data",
+                name="preprocess_fun",
+                preemptible=True,
+            ),
+            Node(
+                func=lambda x: x,
+                inputs="data",
+                outputs="model",
+                name="train_fun",
+                machine_type="highmem",
+                preemptible=True,
+            ),
+            Node(
+                func=lambda x: x,
+                inputs="model",
+                outputs="metrics",
+                name="evaluate_fun",
+                machine_type="highmem",
+            ),
+        ]
+    )
+
+    argo_dag = get_argo_dag(pipeline, machine_types, "default", preemptible=PreemptibleConfig(retries=2))
+    spot_toleration = {"key": "cloud.google.com/gke-spot", "operator": "Equal", "value": "true", "effect": "NoSchedule"}
+
+    assert argo_dag["preprocess_fun"].to_dict()["node_selector"] == {"cloud.google.com/gke-spot": "true"}
+    assert argo_dag["preprocess_fun"].to_dict()["tolerations"] == [spot_toleration]
+    assert argo_dag["preprocess_fun"].to_dict()["retries"] == 2
+    assert "idempotent" not in argo_dag["preprocess_fun"].to_dict()
+    assert argo_dag["train_fun"].to_dict()["node_selector"] == {"pool": "highmem", "cloud.google.com/gke-spot": "true"}
+    assert argo_dag["train_fun"].to_dict()["tolerations"] == [machine_types["highmem"].tolerations[0], spot_toleration]
+    assert argo_dag["evaluate_fun"].to_dict()["node_selector"] == {"pool": "highmem"}
+    assert "retries" not in argo_dag["evaluate_fun"].to_dict()
+    assert "idempotent" not in argo_dag["evaluate_fun"].to_dict()
+
+
+def test_render_workflow_spec_scheduling():
+    """Test that scheduling constraints are only patched into the pods of tasks that set them."""
+    machine_types = {
+        "default": MachineType(mem=16, cpu=2, num_gpu=0),
+        "highmem": MachineType(mem=64, cpu=8, num_gpu=0, tolerations=[{"key": "highmem", "operator": "Exists", "effect": "NoSchedule"}]),
+    }
+    pipeline = Pipeline(
+        [
+            Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fun"),
+            Node(func=lambda x: x, inputs="data", outputs="model", name="train_fun", machine_type="highmem"),
+        ]
+    )
+    argo = ArgoConfig(
+        namespace="argo-workflows",
+        deployment=DeploymentConfig(image="your-registry/your-image"),
+        machine_types=machine_types,
+        default_machine_type="default",
+        runner=RunnerConfig(),
+    )
+
+    tasks = [task.to_dict() for task in get_argo_dag(pipeline, machine_types, "default").values()]
+    spec = yaml.safe_load(
+        render_workflow_spec(argo, pipeline_tasks=tasks, semaphores={}, pipeline_name="__default__", environment="base", workflow_name="workflow")
+    )
+    templates = {template["name"]: template for template in spec["spec"]["templates"]}
+    defaults = {param["name"]: param.get("value") for param in templates["kedro"]["inputs"]["parameters"]}
+
+    # When substituting the arguments of each task into the pod spec patch, as Argo does
+    patches = {}
+    for task in templates["pipeline"]["dag"]["tasks"]:
+        parameters = {**defaults, **{param["name"]: param["value"] for param in task["arguments"]["parameters"]}}
+        patches[task["name"]] = yaml.safe_load(
+            re.sub(r"{{inputs\.parameters\.(\w+)}}", lambda match: str(parameters[match.group(1)]), templates["kedro"]["podSpecPatch"])
+        )
+
+    # Assert only the task with tolerations patches them, leaving the workflow defaults of other tasks intact
+    assert "tolerations" not in patches["preprocess-fun"]
+    assert patches["train-fun"]["tolerations"] == machine_types["highmem"].tolerations
+    assert "nodeSelector" not in patches["train-fun"]
+
+
+def test_get_argo_dag_runtime_env():
+    """Test that machine types overriding the thread count or environment patch the environment of their tasks."""
+    machine_types = {
+        "default": MachineType(mem=16, cpu=4, num_gpu=0),
+        "large": MachineType(mem=64, cpu=16, num_gpu=0, threads=8, env={"MALLOC_ARENA_MAX": "2"}),
+    }
+    pipeline = Pipeline(
+        [
+            Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fun"),
+            Node(func=lambda x: x, inputs="data", outputs="model", name="train_fun", machine_type="large"),
+        ]
+    )
+
+    argo_dag = get_argo_dag(pipeline, machine_types, "default")
+
+    # Assert tasks of the default machine type rely on the environment derived by the template
+    assert "env" not in argo_dag["preprocess_fun"].to_dict()
+    env = {item["name"]: item["value"] for item in argo_dag["train_fun"].to_dict()["env"]}
+    assert env["OMP_NUM_THREADS"] == "8"
+    assert env["MALLOC_ARENA_MAX"] == "2"
+
+
+def test_reduce_dependencies(machine_types: dict[str, MachineType], default_machine_type: str):
+    """Test that redundant dependencies are removed, without altering the execution order."""
+    pipeline = Pipeline(
+        [
+            Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fun"),
+            Node(func=lambda x: x, inputs="data", outputs="features", name="featurize_fun"),
+            Node(func=lambda x, y: x, inputs=["data", "features"], outputs="model", name="train_fun"),
+            Node(func=lambda x, y, z: x, inputs=["data", "features", "model"], outputs="metrics", name="evaluate_fun"),
+            PartitionedNode(
+                func=lambda partition, x: x,
+                inputs="model",
+                outputs="predictions",
+                partitions_from="data",
+                name="predict_fun",
+            ),
+        ]
+    )
+
+    def execution_order(tasks):
+        # NOTE: Earliest step at which each task can start, i.e., the length of the longest path to it
+        steps = {}
+        for task in tasks.values():
+            steps[task.name] = max((steps[parent.name] + 1 for parent in task.parents), default=0)
+        return steps
+
+    argo_dag = get_argo_dag(pipeline, machine_types, default_machine_type)
+    expected_order = execution_order(argo_dag)
+    expected_ancestors = {task.name: {ancestor.name for ancestor in task.ancestors()} for task in argo_dag.values()}
+
+    # Assert redundant dependencies are removed
+    assert reduce_dependencies(argo_dag) == 4
+    assert {task.name: task.to_dict()["deps"] for task in argo_dag.values()} == {
+        "preprocess-fun": [],
+        "featurize-fun": ["preprocess-fun"],
+        "train-fun": ["featurize-fun"],
+        "evaluate-fun": ["train-fun"],
+        "predict-fun": ["predict-fun-partitions", "train-fun"],
+    }
+
+    # Assert the execution order, and the producer of the partitions are unaffected
+    assert execution_order(argo_dag) == expected_order
+    assert {task.name: {ancestor.name for ancestor in task.ancestors()} for task in argo_dag.values()} == expected_ancestors
+    assert argo_dag["predict_fun"].to_dict()["partitions_deps"] == ["preprocess-fun"]
+
+
+def test_deployment_task_image():
+    """Test that tasks run the image of the build target matching their GPU requirement."""
+    deployment = DeploymentConfig(
+        image="registry/project",
+        targets={
+            "cpu": BuildTarget(build_args={"IMAGE": "ubuntu:24.04"}),
+            "gpu": BuildTarget(gpu=True),
+        },
+    )
+
+    assert deployment.get_task_image(num_gpu=0) == "registry/project:latest-cpu"
+    assert deployment.get_task_image(num_gpu=2) == "registry/project:latest-gpu"
+
+    # Assert a single image is used without build targets
+    assert DeploymentConfig(image="registry/project").get_task_image(num_gpu=1) == "registry/project:latest"
+
+
+@pytest.mark.parametrize("targets", [{"gpu": BuildTarget(gpu=True)}, {"cpu": BuildTarget()}])
+def test_argo_config_rejects_unbuilt_images(machine_types: dict[str, MachineType], targets):
+    """Test that build targets should cover the CPU templates and the GPU requirement of every machine type."""
+    with pytest.raises(ValueError, match="No build target with `gpu: (true|false)`"):
+        ArgoConfig(
+            namespace="argo-workflows",
+            deployment=DeploymentConfig(image="registry/project", targets=targets),
+            machine_types=machine_types,
+            default_machine_type="default",
+            runner=RunnerConfig(),
+        )
+
+
+def test_render_workflow_spec_pool(capsys):
+    """Test that pooled tasks submit valid JSON, and workers are scheduled on the node pool of their machine type."""
+    machine_types = {
+        "default": MachineType(mem=16, cpu=2, num_gpu=0),
+        "highmem": MachineType(mem=64, cpu=8, num_gpu=0, node_selector={"pool": "highmem"}),
+    }
+    pipeline = Pipeline([Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fun", machine_type="highmem", preemptible=True)])
+    argo = ArgoConfig(
+        namespace="argo-workflows",
+        deployment=DeploymentConfig(image="your-registry/your-image"),
+        machine_types=machine_types,
+        default_machine_type="default",
+        runner=RunnerConfig(),
+        preemptible=PreemptibleConfig(retries=2),
+        pool=PoolConfig(workers={"highmem": 2}),
+    )
+
+    tasks = [task.to_dict() for task in get_argo_dag(pipeline, machine_types, "default", preemptible=argo.preemptible).values()]
+    spec = yaml.safe_load(
+        render_workflow_spec(argo, pipeline_tasks=tasks, semaphores={}, pipeline_name="__default__", environment="base", workflow_name="workflow")
+    )
+    templates = {template["name"]: template for template in spec["spec"]["templates"]}
+    dag_tasks = {task["name"]: task for task in templates["pipeline"]["dag"]["tasks"]}
+
+    # When evaluating the body of a submission with parameters holding quotes, as Argo does
+    parameters = {"pipeline": "__default__", "kedro_nodes": "preprocess_fun", "machine_type": "highmem", "params": 'name="a,b"', "partition": "p\\1"}
+    expression = re.fullmatch(r"{{=(.*)}}", templates["kedro-pool"]["http"]["body"]).group(1)
+    body = eval(expression, {"toJson": json.dumps, "inputs": SimpleNamespace(parameters=SimpleNamespace(**parameters))})
+
+    # Assert the body is valid JSON, and submissions are retried
+    assert json.loads(body) == {**{key: parameters[key] for key in ["pipeline", "machine_type", "params", "partition"]}, "nodes": "preprocess_fun"}
+    assert templates["kedro-pool"]["retryStrategy"] == {"limit": "2", "retryPolicy": "OnError"}
+
+    # Assert workers are scheduled on the node pool of their machine type
+    worker_parameters = {param["name"]: param["value"] for param in dag_tasks["argo-kedro-workers-highmem"]["arguments"]["parameters"]}
+    assert yaml.safe_load(worker_parameters["scheduling"]) == {"nodeSelector": {"pool": "highmem"}}
+    assert "{{inputs.parameters.scheduling}}" in templates["kedro-worker"]["podSpecPatch"]
+
+    # Assert the settings the pool does not apply are reported
+    report_pooled_tasks(tasks, argo)
+    assert "Pooled task `preprocess-fun` ignores its preemptible retries" in capsys.readouterr().out
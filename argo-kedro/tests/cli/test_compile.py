@@ -0,0 +1,183 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# NOTE: Importing the nodes is slow, as is the case for projects depending on large libraries
+NODES = """
+import time
+
+time.sleep(2)
+
+
+def identity(x):
+    return x
+"""
+
+PIPELINE_REGISTRY = """
+from kedro.pipeline import Pipeline
+
+from argo_kedro.pipeline import Node
+
+from compile_project.nodes import identity
+
+
+def register_pipelines():
+    return {
+        "__default__": Pipeline(
+            [
+                Node(identity, "raw", "intermediate", name="first"),
+                Node(identity, "intermediate", "primary", name="second", machine_type="large"),
+            ]
+        ),
+    }
+"""
+
+ARGO_YML = """
+namespace: argo-workflows
+deployment:
+  image: your-registry/your-image
+runner:
+  use_memory_datasets: false
+machine_types:
+  default:
+    mem: 16
+    cpu: 4
+    num_gpu: 0
+  large:
+    mem: 64
+    cpu: 16
+    num_gpu: 0
+default_machine_type: default
+"""
+
+PYPROJECT = """
+[tool.kedro]
+package_name = "compile_project"
+project_name = "compile-project"
+kedro_init_version = "1.0.0"
+"""
+
+
+@pytest.fixture
+def project_path(tmp_path) -> Path:
+    files = {
+        "pyproject.toml": PYPROJECT,
+        "src/compile_project/__init__.py": "",
+        "src/compile_project/settings.py": "",
+        "src/compile_project/nodes.py": NODES,
+        "src/compile_project/pipeline_registry.py": PIPELINE_REGISTRY,
+        "conf/base/argo.yml": ARGO_YML,
+        "conf/base/catalog.yml": "",
+        "conf/local/.gitkeep": "",
+    }
+    for path, content in files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content)
+
+    return tmp_path
+
+
+def run_kedro(project_path: Path, *args: str) -> tuple[str, float]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "kedro", "argo", *args],
+        cwd=project_path,
+        env={**os.environ, "PYTHONPATH": str(project_path / "src")},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout, time.perf_counter() - start
+
+
+def test_compile(project_path: Path):
+    spec_path = project_path / "templates" / "argo-workflow-template.yml"
+
+    # When compiling the workflow, and compiling it again with the structure cached
+    output, _ = run_kedro(project_path, "compile", "-e", "base")
+    assert "Using cached structure" not in output
+
+    output, compile_duration = run_kedro(project_path, "compile", "-e", "base")
+    assert "Using cached structure" in output
+    compiled = spec_path.read_text()
+
+    # Assert the spec matches the spec of a dry run submit
+    _, dry_run_duration = run_kedro(project_path, "submit", "--dry_run", "-e", "base")
+    assert spec_path.read_text() == compiled
+
+    # Assert compiling from cache avoids importing the project, i.e., is faster than a dry run
+    assert compile_duration < dry_run_duration - 1.5
+
+
+def test_compile_invalidates_cache(project_path: Path):
+    run_kedro(project_path, "compile", "-e", "base")
+
+    # When modifying the sources of the project
+    nodes_path = project_path / "src" / "compile_project" / "nodes.py"
+    nodes_path.write_text(NODES.replace("time.sleep(2)", "time.sleep(0)"))
+
+    # Assert the pipeline is loaded again
+    output, _ = run_kedro(project_path, "compile", "-e", "base")
+    assert "Using cached structure" not in output
+
+    # When modifying the configuration
+    argo_yml_path = project_path / "conf" / "base" / "argo.yml"
+    argo_yml_path.write_text(ARGO_YML.replace("mem: 64", "mem: 128"))
+
+    # Assert the pipeline is loaded again, with the new configuration
+    output, _ = run_kedro(project_path, "compile", "-e", "base")
+    assert "Using cached structure" not in output
+    assert "value: 128" in (project_path / "templates" / "argo-workflow-template.yml").read_text()
+
+
+def test_compile_prioritises_by_history(project_path: Path):
+    registry_path = project_path / "src" / "compile_project" / "pipeline_registry.py"
+    registry_path.write_text(
+        PIPELINE_REGISTRY.replace(
+            '            ]\n',
+            '                Node(identity, "raw", "secondary", name="third"),\n            ]\n',
+        )
+    )
+    spec_path = project_path / "templates" / "argo-workflow-template.yml"
+    run_kedro(project_path, "compile", "-e", "base")
+
+    # When recording a long duration for the independent task
+    durations_path = project_path / ".argo-kedro" / "durations.json"
+    durations_path.write_text(json.dumps({"__default__": {"workflows": ["workflow-abc12"], "tasks": {"third": [600.0]}}}))
+
+    # Assert the cached structure is prioritised by the recorded durations
+    output, _ = run_kedro(project_path, "compile", "-e", "base")
+    assert "Using cached structure" in output
+    compiled = spec_path.read_text()
+    assert compiled.index("- name: third") < compiled.index("- name: first")
+
+    # Assert the spec matches the spec of a dry run submit
+    run_kedro(project_path, "submit", "--dry_run", "-e", "base")
+    assert spec_path.read_text() == compiled
+
+
+def test_compile_merges_pipelines(project_path: Path):
+    registry_path = project_path / "src" / "compile_project" / "pipeline_registry.py"
+    registry_path.write_text(
+        PIPELINE_REGISTRY.replace(
+            "        ),\n    }\n",
+            '        ),\n        "reporting": Pipeline([Node(identity, "primary", "report", name="report")]),\n    }\n',
+        )
+    )
+    spec_path = project_path / "templates" / "argo-workflow-template.yml"
+
+    # When compiling the merged pipelines, and compiling them again with the structure cached
+    run_kedro(project_path, "compile", "-e", "base", "-p", "__default__", "-p", "reporting")
+    output, _ = run_kedro(project_path, "compile", "-e", "base", "-p", "__default__", "-p", "reporting")
+    assert "Using cached structure" in output
+    compiled = spec_path.read_text()
+    assert "- name: report" in compiled and "pipeline-reporting" in compiled
+
+    # Assert the spec matches the spec of a dry run submit of the merged pipelines
+    run_kedro(project_path, "submit", "--dry_run", "-e", "base", "-p", "__default__", "-p", "reporting")
+    assert spec_path.read_text() == compiled
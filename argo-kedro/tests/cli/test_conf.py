@@ -0,0 +1,81 @@
+import io
+import tarfile
+from pathlib import Path
+
+from argo_kedro.framework.cli.conf import get_source_hash, is_image_current, package_conf, record_image
+
+
+def write(path: Path, content: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_package_conf(tmp_path):
+    write(tmp_path / "conf" / "base" / "parameters.yml", "alpha: 1")
+    write(tmp_path / "conf" / "cloud" / "catalog.yml", "{}")
+    write(tmp_path / "conf" / "cloud" / "credentials.yml", "secret: 1")
+    write(tmp_path / "conf" / "cloud" / "nested" / "credentials_gcp.yml", "secret: 1")
+    write(tmp_path / "conf" / "local" / "credentials.yml", "secret: 1")
+
+    # When packaging the configuration of the base and cloud environments
+    archive = package_conf(tmp_path / "conf", ["base", "cloud"])
+
+    # Assert only the selected environments are packaged, in a single top-level directory, without credentials
+    with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as f:
+        assert f.getnames() == ["conf/base/parameters.yml", "conf/cloud/catalog.yml"]
+
+    # Assert the archive is reproducible
+    assert package_conf(tmp_path / "conf", ["base", "cloud"]) == archive
+
+
+def test_get_source_hash(tmp_path):
+    write(tmp_path / "src" / "package" / "nodes.py", "def node(): pass")
+    write(tmp_path / "conf" / "base" / "parameters.yml", "alpha: 1")
+    write(tmp_path / "data" / "raw.csv", "a,b")
+    write(tmp_path / ".dockerignore", "data/\n")
+    source_hash = get_source_hash(tmp_path, exclude=[tmp_path / "conf"])
+
+    # Assert changes to configuration and ignored files do not affect the hash
+    write(tmp_path / "conf" / "base" / "parameters.yml", "alpha: 2")
+    write(tmp_path / "data" / "raw.csv", "a,b,c")
+    assert get_source_hash(tmp_path, exclude=[tmp_path / "conf"]) == source_hash
+
+    # Assert changes to code affect the hash
+    write(tmp_path / "src" / "package" / "nodes.py", "def node(): return 1")
+    assert get_source_hash(tmp_path, exclude=[tmp_path / "conf"]) != source_hash
+
+
+def test_get_source_hash_follows_dockerignore(tmp_path):
+    write(tmp_path / "src" / "package" / "nodes.py", "def node(): pass")
+    write(tmp_path / ".python-version", "3.11")
+    write(tmp_path / "data" / "raw.csv", "a,b")
+    write(tmp_path / "data" / "01_raw" / "keep.csv", "a,b")
+    write(tmp_path / "src" / "package" / "__pycache__" / "nodes.pyc", "")
+    write(tmp_path / ".dockerignore", "# Data\n/data\n!data/01_raw/keep.csv\n**/__pycache__\n")
+    source_hash = get_source_hash(tmp_path, exclude=[])
+
+    # Assert hidden files affect the hash
+    write(tmp_path / ".python-version", "3.12")
+    changed_hash = get_source_hash(tmp_path, exclude=[])
+    assert changed_hash != source_hash
+
+    # Assert ignored files do not affect the hash, in nested directories as well
+    write(tmp_path / "data" / "raw.csv", "a,b,c")
+    write(tmp_path / "src" / "package" / "__pycache__" / "nodes.pyc", "changed")
+    assert get_source_hash(tmp_path, exclude=[]) == changed_hash
+
+    # Assert files included again by an exception affect the hash
+    write(tmp_path / "data" / "01_raw" / "keep.csv", "a,b,c")
+    assert get_source_hash(tmp_path, exclude=[]) != changed_hash
+
+
+def test_record_image(tmp_path):
+    assert not is_image_current(tmp_path, "your-registry/your-image:latest", "abc")
+
+    # When recording the published image
+    record_image(tmp_path, "your-registry/your-image:latest", "abc")
+
+    # Assert the image is current for the same sources only
+    assert is_image_current(tmp_path, "your-registry/your-image:latest", "abc")
+    assert not is_image_current(tmp_path, "your-registry/your-image:latest", "def")
+    assert not is_image_current(tmp_path, "your-registry/your-image:gpu", "abc")
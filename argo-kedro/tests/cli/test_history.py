@@ -0,0 +1,167 @@
+from pathlib import Path
+
+import pytest
+
+from argo_kedro.framework.cli.cli import set_task_deadlines, set_task_escalations
+from argo_kedro.framework.cli.history import load_durations, load_escalations, percentile, record_durations, record_escalations
+from argo_kedro.framework.hooks.argo_hook import (
+    ArgoConfig,
+    ConcurrencyConfig,
+    DeadlinesConfig,
+    DeploymentConfig,
+    EscalationConfig,
+    MachineType,
+    RunnerConfig,
+)
+
+
+def get_workflow(name: str, durations: dict[str, int], phase: str = "Succeeded") -> dict:
+    return {
+        "metadata": {"name": name},
+        "status": {
+            "nodes": {
+                task: {
+                    "displayName": task,
+                    "type": "Pod",
+                    "phase": phase,
+                    "startedAt": "2024-01-01T00:00:00Z",
+                    "finishedAt": f"2024-01-01T00:{minutes:02d}:00Z",
+                }
+                for task, minutes in durations.items()
+            }
+        },
+    }
+
+
+def test_percentile():
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile([1, 2, 3, 4, 5], 100) == 5
+    assert percentile([10, 20], 90) == 19
+
+
+def test_record_durations(tmp_path: Path):
+
+    # When recording workflows, including the same workflow twice
+    assert record_durations(tmp_path, "__default__", get_workflow("wf-1", {"train": 10, "evaluate": 1})) == 2
+    assert record_durations(tmp_path, "__default__", get_workflow("wf-1", {"train": 10, "evaluate": 1})) == 0
+    record_durations(tmp_path, "__default__", get_workflow("wf-2", {"train": 20}), history=1)
+    record_durations(tmp_path, "__default__", get_workflow("wf-3", {"evaluate": 59}, phase="Failed"))
+
+    # Assert workflows are recorded once, failed tasks are excluded, and the history is capped
+    assert load_durations(tmp_path, "__default__") == {"train": [1200.0], "evaluate": [60.0]}
+    assert load_durations(tmp_path, "other") == {}
+
+
+def test_set_task_deadlines():
+    tasks = [
+        {"name": "train", "idempotent": True},
+        {"name": "evaluate", "retries": 3},
+        {"name": "report"},
+    ]
+    history = {"train": [100, 200, 300, 400, 500], "evaluate": [1000, 1000, 1000], "report": [10]}
+
+    # When setting deadlines
+    set_task_deadlines(tasks, history, DeadlinesConfig(percentile=50, factor=2, min_deadline=100, speculate=75))
+
+    # Assert deadlines are a multiple of the percentile, and retries are kept when higher,
+    # only idempotent tasks speculate, and tasks without sufficient history are not bounded
+    assert tasks == [
+        {"name": "train", "idempotent": True, "deadline": 600, "retries": 2, "speculate_after": 400},
+        {"name": "evaluate", "retries": 3, "deadline": 2000},
+        {"name": "report"},
+    ]
+
+
+def test_record_escalations(tmp_path: Path):
+    attempts = {
+        "train(0)": {"message": "OOMKilled (exit code 137)", "outputs": {"exitCode": "137"}},
+        "train(1)": {"phase": "Succeeded"},
+        "evaluate(0)": {"message": "Error (exit code 1)", "outputs": {"exitCode": "1"}},
+        "evaluate(1)": {"phase": "Succeeded"},
+    }
+    workflow = {
+        "metadata": {"name": "wf-1"},
+        "spec": {
+            "templates": [
+                {
+                    "name": "pipeline",
+                    "dag": {
+                        "tasks": [
+                            {"name": task, "arguments": {"parameters": [{"name": "ladder", "value": "default,highmem,highmem-large"}]}}
+                            for task in ("train", "evaluate")
+                        ]
+                    },
+                }
+            ]
+        },
+        "status": {
+            "nodes": {
+                **{name: {"displayName": name, "type": "Pod", **node} for name, node in attempts.items()},
+                **{
+                    task: {"displayName": task, "type": "Retry", "phase": "Succeeded", "children": [f"{task}(0)", f"{task}(1)"]}
+                    for task in ("train", "evaluate")
+                },
+            }
+        },
+    }
+
+    # Assert only tasks that ran out of memory record the machine type of their last attempt
+    assert record_escalations(tmp_path, "__default__", workflow) == {"train": "highmem"}
+    assert load_escalations(tmp_path, "__default__") == {"train": "highmem"}
+
+
+def test_set_task_escalations():
+    machine_types = {
+        "default": MachineType(mem=16, cpu=4, num_gpu=0),
+        "highmem": MachineType(mem=64, cpu=8, num_gpu=0),
+        "highmem-large": MachineType(mem=128, cpu=16, num_gpu=0),
+        "gpu": MachineType(mem=32, cpu=8, num_gpu=1),
+    }
+    tasks = [
+        {"name": "train", "nodes": "train", "mem": 16, "cpu": 4, "machine_type": "default", "retries": 3},
+        {"name": "embed", "nodes": "embed", "mem": 32, "cpu": 8, "machine_type": "gpu"},
+        {"name": "evaluate", "nodes": "evaluate", "mem": 16, "cpu": 4, "machine_type": "default"},
+        {"name": "report", "nodes": "report", "mem": 16, "cpu": 4, "machine_type": "default"},
+    ]
+    config = EscalationConfig(ladder=["default", "highmem", "highmem-large"], nodes={"report": []})
+
+    # When escalating, with evaluate having escalated before
+    set_task_escalations(tasks, machine_types, config, escalations={"evaluate": "highmem"})
+
+    # Assert tasks escalate through the remaining rungs, padded to their retries, tasks outside of
+    # the ladder only escalate to larger machine types scheduled alike, i.e., not the GPU task, and
+    # recorded escalations set the first rung
+    assert tasks == [
+        {
+            "name": "train", "nodes": "train", "mem": 16, "cpu": 4, "machine_type": "default", "retries": 3,
+            "ladder": "default,highmem,highmem-large", "mem_ladder": "16,64,128,128", "cpu_ladder": "4,8,16,16",
+        },
+        {"name": "embed", "nodes": "embed", "mem": 32, "cpu": 8, "machine_type": "gpu", "mem_ladder": "32", "cpu_ladder": "8"},
+        {
+            "name": "evaluate", "nodes": "evaluate", "mem": 64, "cpu": 8, "machine_type": "default", "retries": 1,
+            "ladder": "highmem,highmem-large", "mem_ladder": "64,128", "cpu_ladder": "8,16",
+        },
+        {"name": "report", "nodes": "report", "mem": 16, "cpu": 4, "machine_type": "default", "mem_ladder": "16", "cpu_ladder": "4"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "highmem,concurrency,match",
+    [
+        (MachineType(mem=64, cpu=8, num_gpu=0, node_selector={"pool": "highmem"}), ConcurrencyConfig(), "node selector"),
+        (MachineType(mem=64, cpu=8, num_gpu=1), ConcurrencyConfig(), "GPUs"),
+        (MachineType(mem=64, cpu=8, num_gpu=0), ConcurrencyConfig(machine_types={"highmem": 2}), "concurrency limit"),
+    ],
+)
+def test_argo_config_rejects_unlike_escalation_ladders(highmem, concurrency, match):
+    """Test that ladders are rejected when retries would keep the scheduling or semaphore of another machine type."""
+    with pytest.raises(ValueError, match=f"`highmem` of the escalation ladder differs from `default`.*{match}"):
+        ArgoConfig(
+            namespace="argo-workflows",
+            deployment=DeploymentConfig(image="registry/project"),
+            machine_types={"default": MachineType(mem=16, cpu=4, num_gpu=0), "highmem": highmem},
+            default_machine_type="default",
+            runner=RunnerConfig(),
+            concurrency=concurrency,
+            escalation=EscalationConfig(nodes={"train": ["default", "highmem"]}),
+        )
@@ -0,0 +1,139 @@
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from threading import Thread
+
+import pytest
+
+from argo_kedro.framework.cli.pool import Assignment, TaskQueue, Worker, create_queue_server, run_assignment
+from argo_kedro.pipeline.partitioned_node import PARTITION_ENV_VAR
+
+
+@pytest.fixture
+def queue_url():
+    # NOTE: The queue is served locally, as a stand-in for the queue daemon of the workflow
+    server = create_queue_server(0, host="127.0.0.1")
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def submit(queue_url: str, **assignment) -> tuple[int, dict]:
+    request = urllib.request.Request(
+        f"{queue_url}/tasks",
+        method="POST",
+        data=json.dumps(assignment).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_task_queue_per_machine_type():
+    queue = TaskQueue()
+    queue.submit(Assignment(id="a", pipeline="__default__", nodes="a", machine_type="default"))
+    queue.submit(Assignment(id="b", pipeline="__default__", nodes="b", machine_type="gpu"))
+
+    # Assert assignments are only pulled by workers of the machine type
+    assert queue.next("gpu", timeout=0).id == "b"
+    assert queue.next("gpu", timeout=0) is None
+
+    # Assert submitters receive the return code once the assignment completes
+    queue.complete("b", 0)
+    assert queue.wait("b", timeout=0) == 0
+    assert queue.wait("a", timeout=0) is None
+
+
+def test_task_queue_requeues_expired_leases():
+    queue = TaskQueue(lease=0.1, max_requeues=1)
+    queue.submit(Assignment(id="a", pipeline="__default__", nodes="a", machine_type="default"))
+
+    # When the worker holding the assignment renews its lease, the assignment stays leased
+    assert queue.next("default", timeout=0).id == "a"
+    time.sleep(0.06)
+    assert queue.heartbeat("a")
+    time.sleep(0.06)
+    assert queue.next("default", timeout=0) is None
+
+    # When the worker is lost, the assignment is requeued once its lease expires
+    time.sleep(0.15)
+    assert not queue.heartbeat("a")
+    assert queue.next("default", timeout=0).id == "a"
+
+    # Assert the assignment fails once it exceeded the number of requeues
+    time.sleep(0.15)
+    assert queue.wait("a", timeout=0) == 1
+    assert queue.next("default", timeout=0) is None
+
+
+def test_worker_renews_lease():
+    queue = TaskQueue(lease=0.2)
+    server = create_queue_server(0, queue=queue, host="127.0.0.1")
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    executed = []
+
+    def run(assignment: Assignment) -> int:
+        executed.append(assignment.nodes)
+        time.sleep(0.6)
+        return 0
+
+    workers = [
+        Thread(target=Worker(url, machine_type="default", run=run, heartbeat_interval=0.05).serve, kwargs={"max_tasks": 1}, daemon=True)
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+
+    # Assert an assignment running longer than the lease is not handed to another worker
+    assert submit(url, pipeline="__default__", nodes="train", machine_type="default")[0] == 200
+    assert executed == ["train"]
+    server.shutdown()
+
+
+def test_worker_executes_assignments(queue_url: str):
+    executed = []
+
+    def run(assignment: Assignment) -> int:
+        executed.append(assignment.nodes)
+        return 0 if assignment.nodes != "fail" else 1
+
+    worker = Thread(target=Worker(queue_url, machine_type="default", run=run).serve, kwargs={"max_tasks": 2})
+    worker.start()
+
+    # Assert the submission blocks until the warm worker executed the assignment
+    assert submit(queue_url, pipeline="__default__", nodes="preprocess", machine_type="default")[0] == 200
+    status, body = submit(queue_url, pipeline="__default__", nodes="fail", machine_type="default")
+    assert (status, body["returncode"]) == (500, 1)
+
+    worker.join(timeout=5)
+    assert executed == ["preprocess", "fail"]
+
+
+def test_run_assignment(monkeypatch):
+    monkeypatch.delenv(PARTITION_ENV_VAR, raising=False)
+    calls = []
+
+    def run(**kwargs):
+        calls.append({**kwargs, "partition": os.environ.get(PARTITION_ENV_VAR)})
+        if kwargs["nodes"] == "fail":
+            raise ValueError("failed")
+
+    assignment = Assignment(pipeline="__default__", nodes="a,b", machine_type="default", partition="p1", params="x=1")
+
+    # Assert the assignment runs with its partition, and failures result in a non-zero return code
+    assert run_assignment(assignment, project_path=".", env="cloud", run=run) == 0
+    assert run_assignment(assignment.model_copy(update={"nodes": "fail"}), project_path=".", env=None, run=run) == 1
+    assert calls[0] == {
+        "project_path": ".",
+        "pipeline": "__default__",
+        "nodes": "a,b",
+        "env": "cloud",
+        "params": "x=1",
+        "partition": "p1",
+    }
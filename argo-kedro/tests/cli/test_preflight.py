@@ -0,0 +1,51 @@
+import pandas as pd
+from kedro.pipeline import Pipeline, node
+from kedro_datasets.pandas import CSVDataset
+
+from argo_kedro.framework.cli.preflight import get_external_inputs, run_preflight
+from argo_kedro.framework.hooks.argo_hook import DatasetCheck, PreflightConfig
+
+
+def test_get_external_inputs():
+    pipeline = Pipeline(
+        [
+            node(lambda x, y: x, inputs=["raw", "params:alpha"], outputs="data", name="preprocess"),
+            node(lambda x, y: x, inputs=["data", "reference"], outputs="model", name="train"),
+        ]
+    )
+
+    # Assert only inputs not produced by the pipeline, nor parameters, are collected
+    assert get_external_inputs(pipeline) == ["raw", "reference"]
+
+
+def test_run_preflight(tmp_path):
+    pd.DataFrame({"id": [1, 2, 3]}).to_csv(tmp_path / "raw.csv", index=False)
+    datasets = {
+        "raw": CSVDataset(filepath=str(tmp_path / "raw.csv")),
+        "reference": CSVDataset(filepath=str(tmp_path / "reference.csv")),
+        "unregistered": None,
+    }
+    config = PreflightConfig(datasets={"raw": DatasetCheck(columns=["id", "label"])})
+
+    # When checking the inputs
+    results = {result.dataset: result for result in run_preflight(tmp_path, datasets, config)}
+
+    # Assert every failing input is reported
+    assert results["raw"].error == "missing columns ['label']"
+    assert results["reference"].error == "does not exist"
+    assert results["unregistered"].error == "no catalog entry"
+
+
+def test_run_preflight_cached(tmp_path):
+    pd.DataFrame({"id": [1, 2, 3]}).to_csv(tmp_path / "raw.csv", index=False)
+    datasets = {"raw": CSVDataset(filepath=str(tmp_path / "raw.csv"))}
+    config = PreflightConfig(datasets={"raw": DatasetCheck(columns=["id"], min_rows=3)})
+
+    # Assert the checks of a version are cached, once passed
+    assert [(result.ok, result.cached) for result in run_preflight(tmp_path, datasets, config)] == [(True, False)]
+    assert [(result.ok, result.cached) for result in run_preflight(tmp_path, datasets, config)] == [(True, True)]
+
+    # Assert a new version of the data is checked again
+    pd.DataFrame({"id": [1, 2]}).to_csv(tmp_path / "raw.csv", index=False)
+    (result,) = run_preflight(tmp_path, datasets, config)
+    assert (result.ok, result.cached, result.error) == (False, False, "2 rows, expected at least 3")
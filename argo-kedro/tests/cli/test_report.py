@@ -0,0 +1,71 @@
+import csv
+import json
+from pathlib import Path
+
+from argo_kedro.framework.cli.report import aggregate_timings, get_workflow_timings, list_workflow_pods, write_report
+from argo_kedro.framework.cli.workflow import load_workflow
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+def test_get_workflow_timings():
+    workflow = load_workflow(None, None, from_file=FIXTURES_PATH / "report_workflow.json")
+    pods = list_workflow_pods(workflow, from_file=FIXTURES_PATH / "report_pods.json")
+
+    # When computing the timings of the workflow
+    preprocess, train = get_workflow_timings(workflow, pods)
+
+    # Assert the phases of the task are derived from its pod and reported run timings
+    assert preprocess.model_dump() == {
+        "name": "preprocess",
+        "machine_type": "default",
+        "fused": True,
+        "phase": "Succeeded",
+        "pending": 10.0,
+        "image_pull": 30.0,
+        "startup": 10.0,
+        "run": 60.0,
+        "teardown": 10.0,
+        "total": 120.0,
+        "datasets": {"features": {"format": "feather", "size": 1048576}},
+    }
+
+    # Assert only the total duration is reported for tasks of which the pod was garbage collected
+    assert train.model_dump() == {
+        "name": "train",
+        "machine_type": "8cpu-32Gi-1gpu",
+        "fused": None,
+        "phase": "Succeeded",
+        "pending": None,
+        "image_pull": None,
+        "startup": None,
+        "run": None,
+        "teardown": None,
+        "total": 480.0,
+        "datasets": {},
+    }
+
+
+def test_aggregate_timings(tmp_path):
+    workflow = load_workflow(None, None, from_file=FIXTURES_PATH / "report_workflow.json")
+    timings = get_workflow_timings(workflow, list_workflow_pods(workflow, from_file=FIXTURES_PATH / "report_pods.json"))
+
+    # When aggregating the timings
+    groups = aggregate_timings(timings)
+
+    # Assert tasks are grouped by machine type and fusing
+    assert [(group.machine_type, group.fused, group.tasks) for group in groups] == [
+        ("8cpu-32Gi-1gpu", None, 1),
+        ("default", True, 1),
+    ]
+    assert groups[1].mean["image_pull"] == 30.0
+
+    # Assert the report is exported as CSV or JSON
+    write_report(tmp_path / "report.csv", timings, groups)
+    with open(tmp_path / "report.csv") as f:
+        assert [row["name"] for row in csv.DictReader(f)] == ["preprocess", "train"]
+
+    write_report(tmp_path / "report.json", timings, groups)
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert len(report["tasks"]) == 2
+    assert report["groups"][1]["total"]["run"] == 60.0
@@ -0,0 +1,135 @@
+import sys
+
+import pytest
+from kedro.pipeline import Pipeline
+
+from argo_kedro.framework.cli.cli import get_argo_dag, render_workflow_spec
+from argo_kedro.framework.cli.simulate import LocalSimulator, SimulatedTask, get_simulated_tasks, load_pipeline_tasks
+from argo_kedro.framework.hooks.argo_hook import ArgoConfig, DeploymentConfig, MachineType, PoolConfig, RunnerConfig
+from argo_kedro.pipeline import Node
+
+
+def _sleep(
+    name: str, deps: list[str] | None = None, cpu: float = 1, mem: float = 1, code: int = 0, num_gpu: int = 0
+) -> SimulatedTask:
+    return SimulatedTask(
+        name=name,
+        command=[sys.executable, "-c", f"import sys, time; time.sleep(0.2); sys.exit({code})"],
+        deps=deps or [],
+        cpu=cpu,
+        mem=mem,
+        num_gpu=num_gpu,
+    )
+
+
+def test_simulator_respects_dependencies():
+
+    # When simulating a diamond
+    report = LocalSimulator(cpu=4, mem=16, poll_interval=0.01).run(
+        [_sleep("a"), _sleep("b", ["a"]), _sleep("c", ["a"]), _sleep("d", ["b", "c"])]
+    )
+    results = {task.name: task for task in report.tasks}
+
+    # Assert tasks only start once their dependencies finished, and independent tasks run in parallel
+    assert all(task.phase == "Succeeded" for task in report.tasks)
+    assert results["b"].started_at >= results["a"].finished_at
+    assert results["d"].started_at >= max(results["b"].finished_at, results["c"].finished_at)
+    assert report.max_concurrency == 2
+
+
+def test_simulator_respects_budget():
+
+    # When simulating tasks that do not fit the budget together
+    report = LocalSimulator(cpu=4, mem=16, poll_interval=0.01).run(
+        [_sleep("a", cpu=3), _sleep("b", cpu=3), _sleep("c", mem=32)]
+    )
+    results = {task.name: task for task in report.tasks}
+
+    # Assert tasks are queued, and oversized tasks are capped to the budget
+    assert report.max_concurrency == 1
+    assert results["b"].queued == pytest.approx(results["a"].duration, abs=0.05)
+    assert results["c"].mem == 16
+
+
+def test_simulator_respects_gpu_budget():
+
+    # When simulating GPU tasks that do not fit the GPU budget together
+    report = LocalSimulator(cpu=4, mem=16, poll_interval=0.01, gpu=1).run(
+        [_sleep("a", num_gpu=1), _sleep("b", num_gpu=1), _sleep("c")]
+    )
+    results = {task.name: task for task in report.tasks}
+
+    # Assert GPU tasks are queued, while CPU tasks run alongside
+    assert report.max_concurrency == 2
+    assert results["b"].queued == pytest.approx(results["a"].duration, abs=0.05)
+    assert results["c"].queued == 0
+
+
+def test_simulator_skips_downstream_of_failure():
+    report = LocalSimulator(cpu=4, mem=16, poll_interval=0.01).run([_sleep("a", code=1), _sleep("b", ["a"])])
+
+    assert [task.phase for task in report.tasks] == ["Failed", "Skipped"]
+
+
+def test_get_simulated_tasks():
+
+    # Given Argo tasks with a partitioned task
+    pipeline_tasks = [
+        {"name": "preprocess-fun", "nodes": "preprocess_fun", "deps": [], "mem": 16, "cpu": 2, "num_gpu": 0},
+        {
+            "name": "process",
+            "nodes": "process",
+            "deps": ["preprocess-fun"],
+            "mem": 16,
+            "cpu": 2,
+            "num_gpu": 0,
+            "partitions": ["a", "b"],
+        },
+        {"name": "train-fun", "nodes": "train_fun", "deps": ["process"], "mem": 16, "cpu": 8, "num_gpu": 0},
+    ]
+
+    tasks = get_simulated_tasks(pipeline_tasks, pipeline_name="__default__", environment="local")
+
+    # Assert partitions are expanded, and dependencies are rewired
+    assert [(task.name, task.deps, task.env) for task in tasks] == [
+        ("preprocess-fun", [], {}),
+        ("process(0:a)", ["preprocess-fun"], {"ARGO_KEDRO_PARTITION": "a"}),
+        ("process(1:b)", ["preprocess-fun"], {"ARGO_KEDRO_PARTITION": "b"}),
+        ("train-fun", ["process(0:a)", "process(1:b)"], {}),
+    ]
+    assert tasks[-1].command == ["kedro", "run", "--pipeline", "__default__", "--nodes", "train_fun", "--env", "local"]
+
+
+def test_simulate_pooled_workflow(tmp_path):
+
+    # Given a saved workflow, of which the tasks on the `small` machine type run on a pool
+    machine_types = {"small": MachineType(mem=4, cpu=1, num_gpu=0), "large": MachineType(mem=16, cpu=4, num_gpu=0)}
+    pipeline = Pipeline(
+        [
+            Node(func=lambda x: x, inputs="raw_data", outputs="data", name="preprocess_fun", machine_type="small"),
+            Node(func=lambda x: x, inputs="data", outputs="model", name="train_fun", machine_type="large"),
+        ]
+    )
+    argo = ArgoConfig(
+        namespace="argo-workflows",
+        deployment=DeploymentConfig(image="your-registry/your-image"),
+        machine_types=machine_types,
+        default_machine_type="small",
+        runner=RunnerConfig(),
+        pool=PoolConfig(workers={"small": 2}),
+    )
+    tasks = [task.to_dict() for task in get_argo_dag(pipeline, machine_types, "small").values()]
+    path = tmp_path / "argo-workflow-template.yml"
+    path.write_text(
+        render_workflow_spec(argo, pipeline_tasks=tasks, semaphores={}, pipeline_name="__default__", environment="base", workflow_name="workflow")
+    )
+
+    # When simulating the saved workflow
+    simulated = get_simulated_tasks(load_pipeline_tasks(path), pipeline_name="__default__")
+    for task in simulated:
+        task.command = [sys.executable, "-c", "pass"]
+    report = LocalSimulator(cpu=4, mem=16, poll_interval=0.01).run(simulated)
+
+    # Assert pooled tasks run as regular tasks, without the queue and workers
+    assert [(task.name, task.deps) for task in simulated] == [("preprocess-fun", []), ("train-fun", ["preprocess-fun"])]
+    assert [task.phase for task in report.tasks] == ["Succeeded", "Succeeded"]
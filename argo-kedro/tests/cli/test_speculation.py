@@ -0,0 +1,116 @@
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from argo_kedro.framework.cli.speculation import BACKUP_LABEL, SPECULATE_ENV_VAR, get_backup_pod, run_speculative
+
+
+@pytest.fixture
+def pod() -> dict:
+    return {
+        "metadata": {
+            "name": "workflow-abc12-kedro-123",
+            "namespace": "argo-workflows",
+            "uid": "uid-123",
+            "labels": {"workflows.argoproj.io/workflow": "workflow-abc12"},
+        },
+        "spec": {
+            "nodeName": "node-1",
+            "serviceAccountName": "argo-workflow",
+            "activeDeadlineSeconds": 900,
+            "nodeSelector": {"cloud.google.com/gke-spot": "true"},
+            "containers": [
+                {"name": "wait", "image": "argoexec"},
+                {
+                    "name": "main",
+                    "image": "your-registry/your-image:latest",
+                    "command": ["/var/run/argo/argoexec", "emissary", "--", "kedro"],
+                    "args": ["run", "--nodes", "train"],
+                    "env": [
+                        {"name": SPECULATE_ENV_VAR, "value": "300"},
+                        {"name": "WORKFLOW_ID", "valueFrom": {"fieldRef": {"fieldPath": "metadata.labels['workflows.argoproj.io/workflow']"}}},
+                    ],
+                    "resources": {"limits": {"memory": "16Gi", "cpu": "4"}},
+                    "volumeMounts": [
+                        {"name": "var-run-argo", "mountPath": "/var/run/argo"},
+                        {"name": "read-cache", "mountPath": "/cache"},
+                    ],
+                },
+            ],
+            "volumes": [
+                {"name": "var-run-argo", "emptyDir": {}},
+                {"name": "read-cache", "hostPath": {"path": "/mnt/cache"}},
+            ],
+        },
+        "status": {"startTime": "2024-01-01T00:00:00Z"},
+    }
+
+
+class FakeCoreApi:
+    def __init__(self, phase: str):
+        self.phase = phase
+        self.created = []
+        self.deleted = []
+        self.api_client = SimpleNamespace(sanitize_for_serialization=lambda pod: pod)
+
+    def read_namespaced_pod(self, name, namespace):
+        if name.endswith("-backup"):
+            return SimpleNamespace(status=SimpleNamespace(phase=self.phase))
+        return self.pod
+
+    def create_namespaced_pod(self, namespace, body):
+        self.created.append(body)
+        return SimpleNamespace(metadata=SimpleNamespace(name=body["metadata"]["name"]))
+
+    def delete_namespaced_pod(self, name, namespace):
+        self.deleted.append(name)
+
+
+def test_get_backup_pod(pod: dict):
+
+    # When deriving the backup, 5 minutes into the task
+    backup = get_backup_pod(pod, now=datetime(2024, 1, 1, 0, 5, tzinfo=timezone.utc))
+
+    # Assert the backup runs the command without the Argo executor, on another node, within the remaining deadline
+    main = backup["spec"]["containers"][0]
+    assert main["command"] == ["kedro", "run", "--nodes", "train"]
+    assert main["env"] == [{"name": "WORKFLOW_ID", "value": "workflow-abc12"}]
+    assert [mount["name"] for mount in main["volumeMounts"]] == ["read-cache"]
+    assert [volume["name"] for volume in backup["spec"]["volumes"]] == ["read-cache"]
+    assert backup["spec"]["affinity"]["nodeAffinity"]["requiredDuringSchedulingIgnoredDuringExecution"] == {
+        "nodeSelectorTerms": [{"matchExpressions": [{"key": "kubernetes.io/hostname", "operator": "NotIn", "values": ["node-1"]}]}]
+    }
+    assert backup["spec"]["activeDeadlineSeconds"] == 600
+    assert backup["spec"]["nodeSelector"] == {"cloud.google.com/gke-spot": "true"}
+    assert backup["metadata"]["labels"][BACKUP_LABEL] == "workflow-abc12-kedro-123"
+    assert backup["metadata"]["ownerReferences"][0]["uid"] == "uid-123"
+
+
+def test_run_speculative_without_backup():
+    api = FakeCoreApi("Running")
+
+    # Assert tasks finishing in time do not start a backup
+    assert run_speculative([sys.executable, "-c", "exit(3)"], speculate_after=10, api=api) == 3
+    assert api.created == []
+
+
+def test_run_speculative_backup_wins(pod: dict):
+    api = FakeCoreApi("Succeeded")
+    api.pod = pod
+
+    # When the backup finishes before the slow task
+    returncode = run_speculative(
+        [sys.executable, "-c", "import time; time.sleep(30)"],
+        speculate_after=0.1,
+        pod_name="workflow-abc12-kedro-123",
+        namespace="argo-workflows",
+        api=api,
+        poll_interval=0.1,
+    )
+
+    # Assert the task succeeds, and the backup is cleaned up
+    assert returncode == 0
+    assert len(api.created) == 1
+    assert api.deleted == ["workflow-abc12-kedro-123-backup"]
@@ -0,0 +1,269 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from kubernetes.client import ApiClient, Configuration
+
+from argo_kedro.framework.cli.cli import wait_for_workflow
+from argo_kedro.framework.cli.workflow import (
+    get_image_digests,
+    get_resume_workflow,
+    get_task_phases,
+    load_workflow,
+    pin_image,
+    submit_workflow,
+)
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def failed_workflow() -> dict:
+    return load_workflow(None, None, from_file=FIXTURES_PATH / "failed_workflow.json")
+
+
+def test_get_task_phases(failed_workflow: dict):
+
+    # Assert only the DAG tasks are returned
+    assert get_task_phases(failed_workflow) == {
+        "preprocess-fun": "Succeeded",
+        "list-partitions": "Succeeded",
+        "process-partitions-partitions": "Succeeded",
+        "process-partitions": "Succeeded",
+        "train-fun": "Failed",
+    }
+
+
+def test_get_resume_workflow(failed_workflow: dict):
+
+    # When resuming the workflow
+    resumed = get_resume_workflow(failed_workflow, image="your-registry/your-image@sha256:abc")
+
+    # Assert only failed and unfinished tasks are kept, without dependencies on succeeded tasks
+    tasks = resumed["spec"]["templates"][1]["dag"]["tasks"]
+    assert tasks == [
+        {"name": "train-fun", "template": "kedro"},
+        {"name": "evaluate-fun", "template": "kedro", "dependencies": ["train-fun"]},
+    ]
+
+    # Assert the image is pinned, and the workflow references the previous workflow
+    assert resumed["spec"]["templates"][0]["container"]["image"] == "your-registry/your-image@sha256:abc"
+    assert resumed["metadata"] == {
+        "generateName": "workflow-abc12-",
+        "namespace": "argo-workflows",
+        "labels": {"resumed-from": "workflow-abc12"},
+    }
+    assert "status" not in resumed
+
+
+def test_get_resume_workflow_inlines_partitions(failed_workflow: dict):
+
+    # Given a workflow where the fan-out did not run yet
+    failed_workflow["status"]["nodes"] = {
+        key: node
+        for key, node in failed_workflow["status"]["nodes"].items()
+        if not node["displayName"].startswith("process-partitions(")
+    }
+    failed_workflow["status"]["nodes"]["workflow-abc12-4"]["phase"] = "Failed"
+
+    # When resuming the workflow
+    resumed = get_resume_workflow(failed_workflow)
+
+    # Assert the partitions of the succeeded discovery task are inlined
+    task = next(task for task in resumed["spec"]["templates"][1]["dag"]["tasks"] if task["name"] == "process-partitions")
+    assert task == {"name": "process-partitions", "template": "kedro", "withItems": ["a", "b"]}
+
+
+def test_get_resume_workflow_pins_task_images(failed_workflow: dict):
+
+    # Given a workflow where a task runs its own image
+    template, dag = failed_workflow["spec"]["templates"]
+    template["container"]["image"] = "{{inputs.parameters.image}}"
+    template["inputs"] = {"parameters": [{"name": "image", "value": "your-registry/your-image:latest"}]}
+    dag["dag"]["tasks"][4]["arguments"] = {"parameters": [{"name": "image", "value": "your-registry/your-image:latest-gpu"}]}
+
+    # When resuming the workflow with the digest of each image
+    images = {
+        "your-registry/your-image:latest": pin_image("your-registry/your-image:latest", "sha256:abc"),
+        "your-registry/your-image:latest-gpu": pin_image("your-registry/your-image:latest-gpu", "sha256:def"),
+    }
+    resumed = get_resume_workflow(failed_workflow, images=images)
+
+    # Assert both the default image and the image of the task are pinned to their own digest
+    template, dag = resumed["spec"]["templates"]
+    assert template["inputs"]["parameters"] == [{"name": "image", "value": "your-registry/your-image@sha256:abc"}]
+    assert dag["dag"]["tasks"][0]["arguments"]["parameters"] == [{"name": "image", "value": "your-registry/your-image@sha256:def"}]
+
+
+def test_pin_image():
+    assert pin_image("your-registry:5000/your-image:latest", "sha256:abc") == "your-registry:5000/your-image@sha256:abc"
+    assert pin_image("your-registry:5000/your-image", "sha256:abc") == "your-registry:5000/your-image@sha256:abc"
+    assert pin_image("your-registry/your-image@sha256:old", "sha256:abc") == "your-registry/your-image@sha256:abc"
+
+
+class FakeArgoServer(BaseHTTPRequestHandler):
+    """Fake Kubernetes API server, serving the Argo workflow CRD."""
+
+    workflows: dict[str, dict] = {}
+    pods: list[dict] = []
+    # NOTE: Events are served in batches, one per watch, a batch holding `{"code": 410}` expires the watch
+    events: list[list[dict]] = []
+    watches: list[dict[str, list[str]]] = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, body: dict, status: int = 200):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self):
+        workflow = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        workflow["metadata"]["name"] = f"{workflow['metadata']['generateName']}abc12"
+        self.workflows[workflow["metadata"]["name"]] = workflow
+        self._send_json(workflow, status=201)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if "watch=true" in url.query:
+            self.watches.append(parse_qs(url.query))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            for event in self.events.pop(0) if self.events else []:
+                event_type = "ERROR" if "code" in event else "MODIFIED"
+                self.wfile.write((json.dumps({"type": event_type, "object": event}) + "\n").encode())
+            return
+
+        if url.path.endswith("/pods"):
+            self._send_json({"kind": "PodList", "apiVersion": "v1", "metadata": {}, "items": self.pods})
+            return
+
+        self._send_json(self.workflows[url.path.rsplit("/", 1)[-1]])
+
+
+@pytest.fixture
+def api_client():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeArgoServer)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    configuration = Configuration(host=f"http://127.0.0.1:{server.server_address[1]}")
+    yield ApiClient(configuration)
+
+    server.shutdown()
+
+
+def _workflow_status(phase: str, nodes: dict[str, tuple[str, str | None]], resource_version: str = "1") -> dict:
+    return {
+        "metadata": {"name": "workflow-abc12", "resourceVersion": resource_version},
+        "status": {
+            "phase": phase,
+            "nodes": {
+                name: {
+                    "displayName": name,
+                    "type": "Pod",
+                    "phase": node_phase,
+                    "startedAt": "2024-01-01T00:00:00Z",
+                    "finishedAt": finished_at,
+                }
+                for name, (node_phase, finished_at) in nodes.items()
+            },
+        },
+    }
+
+
+def test_submit_and_load_workflow(api_client: ApiClient):
+
+    # When submitting a workflow to the fake server
+    name = submit_workflow(
+        {"apiVersion": "argoproj.io/v1alpha1", "kind": "Workflow", "metadata": {"generateName": "workflow-"}, "spec": {}},
+        namespace="argo-workflows",
+        api_client=api_client,
+    )
+
+    # Assert the workflow is created, and can be loaded back
+    assert name == "workflow-abc12"
+    assert load_workflow(name, "argo-workflows", api_client=api_client)["metadata"]["name"] == name
+
+
+def test_wait_for_workflow(api_client: ApiClient, capsys):
+
+    # Given a workflow that runs a task and fails another
+    FakeArgoServer.events = [
+        [
+            _workflow_status("Running", {"preprocess-fun": ("Running", None)}),
+            _workflow_status("Running", {"preprocess-fun": ("Succeeded", "2024-01-01T00:01:00Z")}),
+            _workflow_status(
+                "Failed",
+                {"preprocess-fun": ("Succeeded", "2024-01-01T00:01:00Z"), "train-fun": ("Failed", "2024-01-01T00:00:30Z")},
+            ),
+        ]
+    ]
+
+    # When waiting for the workflow
+    phase = wait_for_workflow("workflow-abc12", "argo-workflows", api_client=api_client)
+
+    # Assert the transitions are streamed, and the final phase is returned
+    assert phase == "Failed"
+    assert capsys.readouterr().out.splitlines() == [
+        "preprocess-fun: Running",
+        "preprocess-fun: Succeeded (60s)",
+        "train-fun: Failed (30s)",
+    ]
+
+
+def test_wait_for_workflow_restarts_watch(api_client: ApiClient, capsys):
+
+    # Given watches that are closed before the workflow completes, of which the second expired
+    FakeArgoServer.watches = []
+    FakeArgoServer.workflows["workflow-abc12"] = _workflow_status(
+        "Running", {"preprocess-fun": ("Succeeded", "2024-01-01T00:01:00Z")}, resource_version="5"
+    )
+    FakeArgoServer.events = [
+        [_workflow_status("Running", {"preprocess-fun": ("Running", None)}, resource_version="2")],
+        [{"code": 410, "reason": "Gone", "message": "too old resource version"}],
+        [_workflow_status("Succeeded", {"preprocess-fun": ("Succeeded", "2024-01-01T00:01:00Z")}, resource_version="7")],
+    ]
+
+    # When waiting for the workflow
+    phase = wait_for_workflow("workflow-abc12", "argo-workflows", api_client=api_client)
+
+    # Assert the watch is restarted from the last seen resource version, or the refetched workflow once expired
+    assert phase == "Succeeded"
+    assert [query.get("resourceVersion") for query in FakeArgoServer.watches] == [None, ["2"], ["5"]]
+    assert capsys.readouterr().out.splitlines() == ["preprocess-fun: Running", "preprocess-fun: Succeeded (60s)"]
+
+
+def _pod(image: str, image_id: str) -> dict:
+    return {
+        "metadata": {"name": "workflow-abc12-1"},
+        "spec": {"containers": [{"name": "main", "image": image}, {"name": "wait", "image": "argoexec:latest"}]},
+        "status": {
+            "containerStatuses": [
+                {"name": "main", "image": f"docker.io/{image}", "imageID": image_id, "ready": False, "restartCount": 0},
+                {"name": "wait", "image": "argoexec:latest", "imageID": "argoexec@sha256:000", "ready": False, "restartCount": 0},
+            ]
+        },
+    }
+
+
+def test_get_image_digests(api_client: ApiClient, failed_workflow: dict):
+
+    # Given pods running different images
+    FakeArgoServer.pods = [
+        _pod("your-image:latest", "docker.io/your-image@sha256:abc"),
+        _pod("your-image:latest-gpu", "docker.io/your-image@sha256:def"),
+    ]
+
+    # Assert the digest of each image is resolved, keyed by the image referenced by the workflow
+    assert get_image_digests(failed_workflow, api_client=api_client) == {
+        "your-image:latest": "sha256:abc",
+        "your-image:latest-gpu": "sha256:def",
+    }
@@ -0,0 +1,120 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Node, Pipeline
+
+from argo_kedro.framework.cli.report import get_workflow_runs
+from argo_kedro.framework.metadata import (
+    DatasetRecord,
+    MetadataStore,
+    NodeRecord,
+    RunRecord,
+    SQLiteMetadataStore,
+    get_dataset_stats,
+    get_node_stats,
+    get_store,
+)
+from argo_kedro.runners import FusedRunner
+
+
+def get_run(run_id: str, started_at: float, wall_time: float, workflow: str = "wf-1") -> RunRecord:
+    return RunRecord(
+        run_id=run_id,
+        workflow=workflow,
+        task="train",
+        pipeline="__default__",
+        started_at=started_at,
+        wall_time=wall_time,
+        cpu_time=wall_time / 2,
+        peak_rss=2**20,
+        nodes=[NodeRecord(node="train", started_at=started_at, wall_time=wall_time, cpu_time=wall_time / 2, peak_rss=2**20)],
+        datasets=[DatasetRecord(dataset="model", node="train", operation="save", duration=1.0, size=100)],
+    )
+
+
+def test_sqlite_store(tmp_path):
+    store = SQLiteMetadataStore(tmp_path / "metadata.db")
+
+    # When saving runs, including the same run twice
+    store.save(get_run("run-1", started_at=1, wall_time=10))
+    store.save(get_run("run-1", started_at=1, wall_time=10))
+    store.save(get_run("run-2", started_at=2, wall_time=20, workflow="wf-2"))
+
+    # Assert runs are persisted once, queried most recent first, including their nodes and datasets
+    assert store.runs() == [get_run("run-2", started_at=2, wall_time=20, workflow="wf-2"), get_run("run-1", started_at=1, wall_time=10)]
+    assert [run.run_id for run in store.runs(workflow="wf-1")] == ["run-1"]
+    assert [run.run_id for run in store.runs(limit=1)] == ["run-2"]
+    assert store.runs(pipeline="other") == []
+
+
+def test_fused_runner_records_metadata(tmp_path):
+    store = SQLiteMetadataStore(tmp_path / "metadata.db")
+    catalog = DataCatalog({"raw_data": MemoryDataset(1), "data": MemoryDataset()})
+    pipeline = Pipeline([Node(lambda x: x + 1, inputs="raw_data", outputs="data", name="preprocess_fun")])
+
+    # NOTE: Hooks are only dispatched by a hook manager, as created by the Kedro session
+    FusedRunner(metadata_store=store).run(pipeline, catalog, hook_manager=_create_hook_manager())
+
+    # Assert the run, the node and its dataset load and save are recorded
+    (run,) = store.runs()
+    assert run.task == "preprocess_fun"
+    assert run.status == "OK"
+    assert [(node.node, node.status) for node in run.nodes] == [("preprocess_fun", "OK")]
+    assert run.peak_rss is not None and run.peak_rss == run.nodes[0].peak_rss
+    assert sorted((dataset.dataset, dataset.operation) for dataset in run.datasets) == [("data", "save"), ("raw_data", "load")]
+
+
+def test_get_stats():
+    runs = [get_run(f"run-{i}", started_at=i, wall_time=wall_time) for i, wall_time in enumerate([10, 20, 30])]
+
+    # Assert nodes and datasets are aggregated over runs
+    (node,) = get_node_stats(runs)
+    assert (node.runs, node.wall_time, node.cpu_time, node.peak_rss) == (3, 20, 10, 2**20)
+    assert node.wall_time_p95 == 29
+    (dataset,) = get_dataset_stats(runs)
+    assert (dataset.loads, dataset.saves, dataset.size, dataset.save_time, dataset.load_time) == (0, 3, 100, 1.0, None)
+
+
+def test_get_workflow_runs():
+    run = get_run("run-1", started_at=1, wall_time=10)
+    workflow = {
+        "status": {
+            "nodes": {
+                "train": {
+                    "type": "Pod",
+                    "outputs": {"parameters": [{"name": "timings", "value": json.dumps({"metadata": run.model_dump()})}]},
+                },
+                "evaluate": {"type": "Pod", "outputs": {"parameters": [{"name": "timings", "value": "{}"}]}},
+                "pipeline": {"type": "DAG"},
+            }
+        }
+    }
+
+    # Assert runs reported by task pods are collected
+    assert get_workflow_runs(workflow) == [run]
+
+
+def test_get_store(tmp_path):
+    assert isinstance(get_store("sqlite", {"path": tmp_path / "metadata.db"}), SQLiteMetadataStore)
+    assert isinstance(get_store("argo_kedro.framework.metadata.SQLiteMetadataStore", {"path": tmp_path / "metadata.db"}), SQLiteMetadataStore)
+
+
+def test_get_store_rejects_other_classes():
+    with pytest.raises(TypeError, match="not a subclass of `MetadataStore`"):
+        get_store("collections.OrderedDict")
+
+    # Assert stores must implement both `save` and `runs`
+    with pytest.raises(TypeError):
+        type("IncompleteStore", (MetadataStore,), {"save": lambda self, run: None})()
+
+
+@pytest.mark.parametrize("module", ["argo_kedro.framework.hooks.argo_hook", "argo_kedro.framework.metadata"])
+def test_import_without_cycles(module: str):
+    """Test that the modules import in a fresh interpreter, i.e., without importing the runners first."""
+    result = subprocess.run([sys.executable, "-c", f"import {module}"], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Node, Pipeline
+
+from argo_kedro.framework.tracing import FileSpanExporter, SpanExporter, Tracer, get_exporter
+from argo_kedro.runners import FusedRunner
+
+
+class InMemoryExporter(SpanExporter):
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+def test_tracer_propagates_trace_context():
+    exporter = InMemoryExporter()
+    tracer = Tracer(exporter, traceparent="00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01")
+
+    with tracer.span("parent") as parent:
+        with tracer.span("child"):
+            pass
+
+    # Assert spans are only exported on flush
+    assert exporter.spans == []
+    tracer.flush()
+
+    # Assert spans are part of the propagated trace, and nested within the active span
+    child, parent = exporter.spans
+    assert {span.trace_id for span in exporter.spans} == {"0af7651916cd43dd8448eb211c80319c"}
+    assert parent.parent_id == "b7ad6b7169203331"
+    assert child.parent_id == parent.span_id
+    assert parent.traceparent == f"00-0af7651916cd43dd8448eb211c80319c-{parent.span_id}-01"
+
+
+def test_fused_runner_emits_spans(tmp_path):
+    tracer = Tracer(FileSpanExporter(tmp_path / "traces.jsonl"), traceparent="")
+    catalog = DataCatalog({"raw_data": MemoryDataset(1), "data": MemoryDataset()})
+    pipeline = Pipeline([Node(lambda x: x + 1, inputs="raw_data", outputs="data", name="preprocess_fun")])
+
+    # NOTE: Hooks are only dispatched by a hook manager, as created by the Kedro session
+    FusedRunner(tracer=tracer).run(pipeline, catalog, hook_manager=_create_hook_manager())
+    tracer.flush()
+
+    # Assert the run, the node and its dataset load and save are traced
+    spans = [json.loads(line) for line in (tmp_path / "traces.jsonl").read_text().splitlines()]
+    run = next(span for span in spans if span["name"] == "kedro.run")
+    assert sorted(span["name"] for span in spans) == ["kedro.run", "load raw_data", "node preprocess_fun", "save data"]
+    assert all(span["parent_id"] == run["span_id"] for span in spans if span is not run)
+
+
+def test_get_exporter():
+    assert isinstance(get_exporter("file", {"path": "traces.jsonl"}), FileSpanExporter)
+    assert isinstance(get_exporter("tests.framework.test_tracing.InMemoryExporter"), InMemoryExporter)
+
+
+def test_get_exporter_rejects_other_classes():
+    with pytest.raises(TypeError, match="not a subclass of `SpanExporter`"):
+        get_exporter("collections.OrderedDict")
+
+    # Assert exporters must implement `export`
+    with pytest.raises(TypeError):
+        type("IncompleteExporter", (SpanExporter,), {})()
@@ -0,0 +1,66 @@
+import pytest
+
+from kedro.pipeline import Pipeline
+from argo_kedro.pipeline import PartitionedNode
+from argo_kedro.pipeline.partitioned_node import PARTITION_ENV_VAR
+
+
+@pytest.fixture
+def partitioned_node() -> PartitionedNode:
+    return PartitionedNode(
+        func=lambda partition, x: f"{partition}-{x}",
+        inputs="raw_data",
+        outputs="data",
+        partitions=["a", "b"],
+        name="process_partitions",
+    )
+
+
+def test_partitioned_node_runs_all_partitions(partitioned_node: PartitionedNode, monkeypatch):
+    monkeypatch.delenv(PARTITION_ENV_VAR, raising=False)
+
+    # Assert that all partitions are processed when no partition is selected
+    assert partitioned_node.run({"raw_data": "x"}) == {"data": {"a": "a-x", "b": "b-x"}}
+
+
+def test_partitioned_node_runs_selected_partition(partitioned_node: PartitionedNode, monkeypatch):
+    monkeypatch.setenv(PARTITION_ENV_VAR, "b")
+
+    # Assert that only the selected partition is processed
+    assert partitioned_node.run({"raw_data": "x"}) == {"data": {"b": "b-x"}}
+
+
+def test_partitioned_node_partitions_from(monkeypatch):
+    monkeypatch.delenv(PARTITION_ENV_VAR, raising=False)
+    partitioned_node = PartitionedNode(
+        func=lambda partition, x: (partition, x),
+        inputs="raw_data",
+        outputs=["keys", "values"],
+        partitions_from="partition_list",
+        name="process_partitions",
+    )
+
+    # Assert that partitions are read from the upstream dataset, and that
+    # the results are split per output
+    assert partitioned_node.inputs == ["partition_list", "raw_data"]
+    assert partitioned_node.partitions is None
+    assert partitioned_node.run({"partition_list": {"a": None}, "raw_data": "x"}) == {
+        "keys": {"a": "a"},
+        "values": {"a": "x"},
+    }
+
+
+def test_partitioned_node_copy(partitioned_node: PartitionedNode):
+
+    # Tagging the pipeline copies the node
+    tagged = Pipeline([partitioned_node], tags=["tagged"]).nodes[0]
+
+    # Assert that the copy is still a partitioned node
+    assert isinstance(tagged, PartitionedNode)
+    assert tagged.partitions == ["a", "b"]
+    assert tagged.inputs == ["raw_data"]
+
+
+def test_partitioned_node_requires_partitions():
+    with pytest.raises(ValueError):
+        PartitionedNode(func=lambda partition: partition, inputs=None, outputs="data", name="invalid")
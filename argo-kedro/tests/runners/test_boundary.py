@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, Node
+from argo_kedro.pipeline import PartitionedNode
+from argo_kedro.pipeline.partitioned_node import PARTITION_ENV_VAR
+from argo_kedro.runners import BoundaryDataset, FusedRunner
+from argo_kedro.runners import fuse_runner
+from argo_kedro.runners.boundary import get_format, get_unregistered_boundary_datasets
+
+
+def split(df: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray]:
+    return df, df.to_numpy()
+
+
+def count(df: pd.DataFrame, values) -> int:
+    return len(df) + len(values)
+
+
+@pytest.fixture
+def pipeline() -> Pipeline:
+    return Pipeline(
+        [
+            Node(split, inputs="raw", outputs=["frame", "values"], name="split"),
+            Node(count, inputs=["frame", "values"], outputs="count", name="count"),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "data,format",
+    [
+        (pd.DataFrame({"id": [1, 2]}), "feather"),
+        (np.arange(4), "npy"),
+        (np.array([{"id": 1}], dtype=object), "pickle"),
+        ({"id": 1}, "pickle"),
+    ],
+)
+def test_get_format(data, format):
+    assert get_format(data) == format
+
+
+def test_boundary_dataset_round_trip(tmp_path):
+    frame = BoundaryDataset(str(tmp_path / "frame"))
+    frame.save(pd.DataFrame({"id": [1, 2, 3]}))
+    assert frame.load()["id"].tolist() == [1, 2, 3]
+    assert (tmp_path / "frame.feather").exists()
+
+    # Assert arrays on the local filesystem are loaded memory-mapped
+    values = BoundaryDataset(str(tmp_path / "values"))
+    values.save(np.arange(3))
+    assert isinstance(values.load(), np.memmap)
+    assert values.format == "npy" and values.size > 0
+
+
+def test_get_unregistered_boundary_datasets(pipeline: Pipeline):
+    catalog = DataCatalog.from_config({"{name}_registered": {"type": "pickle.PickleDataset", "filepath": "{name}.pkl"}})
+
+    # Assert datasets crossing nodes without a catalog entry are reported, with the format of their annotation
+    datasets = get_unregistered_boundary_datasets(pipeline, catalog)
+    assert datasets == {
+        "frame": {"producer": "split", "consumers": ["count"], "format": "feather"},
+        "values": {"producer": "split", "consumers": ["count"], "format": "npy"},
+    }
+
+
+def test_fused_runner_registers_boundary_datasets(pipeline: Pipeline, tmp_path, monkeypatch):
+    monkeypatch.setattr(fuse_runner, "pipelines", {"__default__": pipeline})
+    runner = FusedRunner(pipeline_name="__default__", boundary_path=str(tmp_path))
+    runner.run(pipeline.only_nodes("split"), DataCatalog({"raw": MemoryDataset(pd.DataFrame({"id": [1, 2]}))}))
+
+    # When running the consumer in a separate process, i.e., with a fresh catalog
+    catalog = DataCatalog()
+    runner.run(pipeline.only_nodes("count"), catalog)
+
+    # Assert the boundary datasets are read from the workflow-scoped path
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["frame.feather", "values.npy"]
+    assert catalog.load("count") == 4
+
+
+def test_fused_runner_registers_boundary_datasets_across_pipelines(pipeline: Pipeline, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        fuse_runner,
+        "pipelines",
+        {"data_processing": pipeline.only_nodes("split"), "reporting": pipeline},
+    )
+
+    # When running the producer as part of a workflow merging both pipelines
+    runner = FusedRunner(pipeline_name="data_processing,reporting", boundary_path=str(tmp_path))
+    runner.run(pipeline.only_nodes("split"), DataCatalog({"raw": MemoryDataset(pd.DataFrame({"id": [1, 2]}))}))
+
+    # Assert datasets consumed by the nodes of the other pipeline cross the boundary
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["frame.feather", "values.npy"]
+
+
+def test_fused_runner_gathers_partitioned_boundary_datasets(tmp_path, monkeypatch):
+    pipeline = Pipeline(
+        [
+            PartitionedNode(lambda key: key.upper(), inputs=None, outputs="shards", partitions=["a", "b"], name="shard"),
+            Node(lambda shards: shards, inputs="shards", outputs="gathered", name="gather"),
+        ]
+    )
+    monkeypatch.setattr(fuse_runner, "pipelines", {"__default__": pipeline})
+    runner = FusedRunner(pipeline_name="__default__", boundary_path=str(tmp_path))
+
+    # When running each shard of the fan-out in a separate process
+    for partition in ["a", "b"]:
+        monkeypatch.setenv(PARTITION_ENV_VAR, partition)
+        runner.run(pipeline.only_nodes("shard"), DataCatalog())
+
+    # Assert the shards do not overwrite each other, and the consumer loads all partitions
+    monkeypatch.delenv(PARTITION_ENV_VAR)
+    catalog = DataCatalog()
+    runner.run(pipeline.only_nodes("gather"), catalog)
+    assert sorted(path.name for path in (tmp_path / "shards").iterdir()) == ["a.pkl", "b.pkl"]
+    assert catalog.load("gathered") == {"a": "A", "b": "B"}
@@ -0,0 +1,73 @@
+import fsspec
+import pandas as pd
+import pytest
+
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, Node
+from kedro_datasets.pandas import CSVDataset
+from argo_kedro.runners import FusedRunner, ReadCache
+from argo_kedro.runners.read_cache import CachedDataset
+
+
+@pytest.fixture
+def remote():
+    # NOTE: The in-memory fsspec filesystem poses as the remote object storage
+    fs = fsspec.filesystem("memory")
+    yield fs
+    fs.store.clear()
+
+
+@pytest.fixture
+def reference(remote) -> CSVDataset:
+    dataset = CSVDataset(filepath="memory://reference/data.csv")
+    dataset.save(pd.DataFrame({"id": [1, 2, 3]}))
+    return dataset
+
+
+def test_cached_dataset_loads_from_cache(reference: CSVDataset, tmp_path):
+    cache = ReadCache(tmp_path, max_size=2**20)
+    dataset = CachedDataset(reference, cache)
+
+    # Assert the first load populates the cache, and later loads are served from it
+    assert dataset.load()["id"].tolist() == [1, 2, 3]
+    assert dataset.load()["id"].tolist() == [1, 2, 3]
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_cached_dataset_invalidated_on_change(reference: CSVDataset, tmp_path):
+    cache = ReadCache(tmp_path, max_size=2**20)
+    dataset = CachedDataset(reference, cache)
+    dataset.load()
+
+    # Assert a new version of the remote object results in a cache miss
+    reference.save(pd.DataFrame({"id": [4, 5]}))
+    assert dataset.load()["id"].tolist() == [4, 5]
+    assert (cache.misses, cache.hits) == (2, 0)
+
+
+def test_read_cache_evicts_least_recently_used(remote, tmp_path):
+    for name in ["a", "b", "c"]:
+        remote.pipe(f"/reference/{name}.bin", b"x" * 100)
+
+    cache = ReadCache(tmp_path, max_size=250)
+    cache.fetch(remote, "/reference/a.bin")
+    cache.fetch(remote, "/reference/b.bin")
+    cache.fetch(remote, "/reference/a.bin")
+    cache.fetch(remote, "/reference/c.bin")
+
+    # Assert the least recently used file is evicted, once the cache exceeds its size
+    cached = sorted(file.name for file in tmp_path.rglob("*.bin"))
+    assert cached == ["a.bin", "c.bin"]
+
+
+def test_fused_runner_caches_remote_inputs(reference: CSVDataset, tmp_path):
+    cache = ReadCache(tmp_path, max_size=2**20)
+    catalog = DataCatalog({"reference": reference})
+    pipeline = Pipeline([Node(lambda df: len(df), inputs="reference", outputs="count", name="count")])
+
+    FusedRunner(read_cache=cache).run(pipeline, catalog)
+
+    # Assert the remote input is wrapped, and loaded through the cache
+    assert isinstance(catalog.get("reference"), CachedDataset)
+    assert catalog.load("count") == 3
+    assert cache.misses == 1
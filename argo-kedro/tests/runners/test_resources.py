@@ -0,0 +1,37 @@
+import pytest
+
+from argo_kedro.runners.resources import get_available_cpus, get_cgroup_cpu_limit, get_runtime_env
+
+
+def test_get_runtime_env():
+    env = get_runtime_env(4, overrides={"MALLOC_ARENA_MAX": "2"})
+
+    # Assert thread pools are sized to the given threads, unless overridden
+    assert env["OMP_NUM_THREADS"] == "4"
+    assert env["POLARS_MAX_THREADS"] == "4"
+    assert env["MALLOC_ARENA_MAX"] == "2"
+
+
+@pytest.mark.parametrize(
+    "files,limit",
+    [
+        ({"cpu.max": "400000 100000\n"}, 4.0),
+        ({"cpu.max": "max 100000\n"}, None),
+        ({"cpu/cpu.cfs_quota_us": "150000\n", "cpu/cpu.cfs_period_us": "100000\n"}, 1.5),
+        ({"cpu/cpu.cfs_quota_us": "-1\n", "cpu/cpu.cfs_period_us": "100000\n"}, None),
+        ({}, None),
+    ],
+)
+def test_get_cgroup_cpu_limit(tmp_path, files, limit):
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content)
+
+    assert get_cgroup_cpu_limit(tmp_path) == limit
+
+
+def test_get_available_cpus(tmp_path):
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+
+    # Assert fractional limits are rounded up, and never exceed the CPUs of the host
+    assert get_available_cpus(tmp_path) == min(2, get_available_cpus(tmp_path / "missing"))
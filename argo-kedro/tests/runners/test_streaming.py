@@ -0,0 +1,90 @@
+import pytest
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline
+from argo_kedro.pipeline import FusedPipeline, Node
+from argo_kedro.runners import FusedRunner, StreamDataset
+from argo_kedro.runners import fuse_runner
+from argo_kedro.runners.streaming import prefetch
+
+
+class Counter:
+    def __init__(self):
+        self.produced = 0
+        self.consumed = 0
+        self.max_buffered = 0
+
+
+@pytest.fixture
+def counter() -> Counter:
+    return Counter()
+
+
+@pytest.fixture
+def pipeline(counter: Counter) -> Pipeline:
+    def read(rows: int):
+        for row in range(rows):
+            counter.produced += 1
+            yield row
+
+    def double(rows):
+        for row in rows:
+            yield row * 2
+
+    def total(rows) -> int:
+        result = 0
+        for row in rows:
+            counter.consumed += 1
+            counter.max_buffered = max(counter.max_buffered, counter.produced - counter.consumed)
+            result += row
+        return result
+
+    return FusedPipeline(
+        [
+            Node(read, inputs="rows", outputs="raw", name="read"),
+            Node(double, inputs="raw", outputs="doubled", name="double", streams="raw"),
+            Node(total, inputs="doubled", outputs="total", name="total", streams="doubled"),
+        ],
+        name="fused",
+    )
+
+
+def test_fused_runner_streams_chunks(pipeline: Pipeline, counter: Counter, monkeypatch):
+    monkeypatch.setattr(fuse_runner, "pipelines", {"__default__": pipeline})
+    catalog = DataCatalog({"rows": MemoryDataset(1000)})
+
+    # When running the fused pipeline
+    FusedRunner(pipeline_name="__default__", stream_buffer_size=2).run(pipeline, catalog)
+
+    # Assert chunks stream through the chain, with bounded buffering, i.e., per stream
+    # the buffered chunks and a chunk held by the producer
+    assert catalog.load("total") == 999 * 1000
+    assert isinstance(catalog.get("raw"), StreamDataset)
+    assert counter.max_buffered <= 2 * (2 + 1)
+
+
+def test_fused_runner_materializes_boundary_streams(pipeline: Pipeline, counter: Counter, monkeypatch):
+    # Given a consumer of the intermediate dataset outside of the fused node
+    full_pipeline = Pipeline([*pipeline.nodes, Node(lambda rows: list(rows), inputs="doubled", outputs="copy", name="copy")])
+    monkeypatch.setattr(fuse_runner, "pipelines", {"__default__": full_pipeline})
+    catalog = DataCatalog({"rows": MemoryDataset(10), "doubled": MemoryDataset()})
+
+    FusedRunner(pipeline_name="__default__").run(pipeline, catalog)
+
+    # Assert the boundary dataset is materialized, i.e., its chunks are saved as by Kedro, of
+    # which the memory dataset holds the last, and passed to the streaming consumer as a single chunk
+    assert not isinstance(catalog.get("doubled"), StreamDataset)
+    assert isinstance(catalog.get("raw"), StreamDataset)
+    assert catalog.load("total") == 18
+    assert counter.consumed == 1
+
+
+def test_prefetch_propagates_errors():
+    def fail():
+        yield 1
+        raise ValueError("chunk")
+
+    chunks = prefetch(fail(), buffer_size=1)
+    assert next(chunks) == 1
+    with pytest.raises(ValueError, match="chunk"):
+        next(chunks)
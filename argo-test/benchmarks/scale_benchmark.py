@@ -0,0 +1,158 @@
+"""End-to-end scale benchmark of the `scale_benchmark` pipeline.
+
+Every layout, i.e., combination of width, depth, rows and fused versus unfused, is executed
+in a fresh subprocess with the `FusedRunner`, such that the peak RSS and the I/O counters
+are attributable to the run. Optionally, the workflow is compiled with `kedro argo submit
+--dry_run` to measure the compile time of the layout.
+
+Usage (from the root of the argo-test project):
+    python benchmarks/scale_benchmark.py
+    python benchmarks/scale_benchmark.py --width 2 8 --depth 4 16 --rows 10000 100000 --compile
+    python benchmarks/scale_benchmark.py --output benchmarks/results.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_PATH = Path(__file__).resolve().parents[1]
+PIPELINE_NAME = "scale_benchmark"
+
+
+def _read_io() -> dict[str, int]:
+    """Function to read the bytes read and written by the current process.
+
+    The `rchar` and `wchar` counters include I/O served from the page cache, which
+    is representative for the datasets written and loaded by the pipeline.
+    """
+    counters = {}
+    with open("/proc/self/io") as f:
+        for line in f:
+            key, value = line.split(":")
+            counters[key] = int(value)
+
+    return {"read": counters["rchar"], "written": counters["wchar"]}
+
+
+def run_layout(rows: int) -> dict[str, float]:
+    """Function to run the pipeline in the current process, invoked in the benchmark subprocess.
+
+    The structure of the pipeline is configured through the environment of the subprocess.
+    """
+    from kedro.framework.project import configure_project
+    from kedro.framework.session import KedroSession
+    from kedro.framework.startup import bootstrap_project
+
+    from argo_kedro.runners import FusedRunner
+
+    bootstrap_project(PROJECT_PATH)
+    configure_project("argo_test")
+
+    with KedroSession.create(project_path=PROJECT_PATH, runtime_params={"scale_benchmark.rows": rows}) as session:
+        io_start = _read_io()
+        start = time.perf_counter()
+        session.run(
+            pipeline_names=[PIPELINE_NAME],
+            runner=FusedRunner(pipeline_name=PIPELINE_NAME, use_memory_datasets=True),
+        )
+        wall_time = time.perf_counter() - start
+        io_end = _read_io()
+
+    return {
+        "wall_time": wall_time,
+        "bytes_read": io_end["read"] - io_start["read"],
+        "bytes_written": io_end["written"] - io_start["written"],
+    }
+
+
+def _layout_env(width: int, depth: int, fused: bool) -> dict[str, str]:
+    return {
+        **os.environ,
+        "SCALE_BENCHMARK_WIDTH": str(width),
+        "SCALE_BENCHMARK_DEPTH": str(depth),
+        "SCALE_BENCHMARK_FUSED": str(fused).lower(),
+    }
+
+
+def measure_run(width: int, depth: int, rows: int, fused: bool) -> dict[str, float]:
+    """Function to run a layout in a subprocess, and measure its execution.
+
+    Returns:
+        Wall time in seconds, peak RSS in MiB, and bytes read and written.
+    """
+    process = subprocess.Popen(
+        [sys.executable, __file__, "--child", "--rows", str(rows)],
+        cwd=PROJECT_PATH,
+        env=_layout_env(width, depth, fused),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    stdout = process.stdout.read()
+    _, status, rusage = os.wait4(process.pid, 0)
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"Benchmark run failed for width={width}, depth={depth}, rows={rows}, fused={fused}")
+
+    # NOTE: The child reports its measurements as the last line of stdout
+    return {**json.loads(stdout.strip().splitlines()[-1]), "peak_rss_mb": rusage.ru_maxrss / 1024}
+
+
+def measure_compile(width: int, depth: int, fused: bool) -> float:
+    """Function to measure the time to compile a layout with `kedro argo submit --dry_run`."""
+    start = time.perf_counter()
+    subprocess.run(
+        ["kedro", "argo", "submit", "--dry_run", "--pipeline", PIPELINE_NAME, "--environment", "base"],
+        cwd=PROJECT_PATH,
+        env=_layout_env(width, depth, fused),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, nargs="+", default=[4], help="Number of parallel branches")
+    parser.add_argument("--depth", type=int, nargs="+", default=[4], help="Number of nodes per branch")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000], help="Number of rows per dataset")
+    parser.add_argument(
+        "--layout", choices=["fused", "unfused"], nargs="+", default=["fused", "unfused"], help="Layouts to run"
+    )
+    parser.add_argument("--compile", action="store_true", help="Also measure `kedro argo submit --dry_run`")
+    parser.add_argument("--output", type=Path, help="Path to write the results to, as JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_layout(args.rows[0])))
+        return 0
+
+    results = []
+    print(f"{'width':>6} {'depth':>6} {'rows':>9} {'layout':>8} {'wall (s)':>9} {'rss (MiB)':>10} {'read (MiB)':>11} {'written (MiB)':>14} {'compile (s)':>12}")  # fmt: skip
+    for width, depth, rows, layout in itertools.product(args.width, args.depth, args.rows, args.layout):
+        fused = layout == "fused"
+        result = {"width": width, "depth": depth, "rows": rows, "layout": layout, **measure_run(width, depth, rows, fused)}
+        if args.compile:
+            result["compile_time"] = measure_compile(width, depth, fused)
+
+        results.append(result)
+        print(
+            f"{width:>6} {depth:>6} {rows:>9} {layout:>8} {result['wall_time']:>9.2f} {result['peak_rss_mb']:>10.1f} "
+            f"{result['bytes_read'] / 2**20:>11.1f} {result['bytes_written'] / 2**20:>14.1f} "
+            f"{result.get('compile_time', float('nan')):>12.2f}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
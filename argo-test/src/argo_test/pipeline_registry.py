@@ -11,5 +11,7 @@ def register_pipelines() -> dict[str, Pipeline]:
         A mapping from pipeline names to ``Pipeline`` objects.
     """
     pipelines = find_pipelines()
-    pipelines["__default__"] = sum(pipelines.values())
+
+    # NOTE: The scale benchmark is excluded from the default pipeline
+    pipelines["__default__"] = sum(pipeline for name, pipeline in pipelines.items() if name != "scale_benchmark")
     return pipelines
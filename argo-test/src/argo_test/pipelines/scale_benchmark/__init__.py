@@ -0,0 +1,3 @@
+"""Synthetic pipeline to benchmark fusing, memory datasets and runners at scale"""
+
+from .pipeline import create_pipeline  # NOQA
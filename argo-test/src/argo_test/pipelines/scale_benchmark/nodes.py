@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+
+def generate_data(options: dict) -> pd.DataFrame:
+    """Generates the synthetic source dataset.
+
+    Args:
+        options: Parameters with the number of `rows` and the random `seed`.
+    Returns:
+        Dataframe with an identifier and numeric feature columns.
+    """
+    rng = np.random.default_rng(options["seed"])
+    rows = options["rows"]
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "group": rng.integers(0, 100, size=rows),
+            "x": rng.normal(size=rows),
+            "y": rng.normal(size=rows),
+        }
+    )
+
+
+def transform(data: pd.DataFrame, layer: int) -> pd.DataFrame:
+    """Applies a row-wise transformation, representative of a feature engineering step.
+
+    Args:
+        data: Dataframe produced by the previous layer.
+        layer: Index of the layer, to vary the transformation per layer.
+    Returns:
+        Transformed dataframe.
+    """
+    return data.assign(
+        x=np.tanh(data["x"] + 0.1 * layer),
+        y=data["y"] * 0.9 + data["x"] * 0.1,
+    )
+
+
+def summarise(*branches: pd.DataFrame) -> pd.DataFrame:
+    """Aggregates the outputs of all branches.
+
+    Args:
+        branches: Dataframes produced by the last layer of each branch.
+    Returns:
+        Per group means of the features, averaged over the branches.
+    """
+    return pd.concat(branches).groupby("group")[["x", "y"]].mean().reset_index()
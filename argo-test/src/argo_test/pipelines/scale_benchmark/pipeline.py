@@ -0,0 +1,57 @@
+import os
+from functools import partial
+
+from kedro.pipeline import Node, Pipeline
+from argo_kedro.pipeline import FusedPipeline
+
+from .nodes import generate_data, summarise, transform
+
+# The structure of the pipeline is resolved when the pipeline registry is loaded,
+# hence it is configured through environment variables rather than parameters.
+WIDTH_ENV_VAR = "SCALE_BENCHMARK_WIDTH"
+DEPTH_ENV_VAR = "SCALE_BENCHMARK_DEPTH"
+FUSED_ENV_VAR = "SCALE_BENCHMARK_FUSED"
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    """Creates the scale benchmark pipeline.
+
+    The pipeline generates a source dataset, processed by `width` independent branches
+    of `depth` row-wise transformations, which are summarised by a single node. When
+    fused, each branch is wrapped in a `FusedPipeline`, such that intermediate datasets
+    of the branch are passed in memory.
+    """
+    width = int(kwargs.get("width", os.environ.get(WIDTH_ENV_VAR, 4)))
+    depth = int(kwargs.get("depth", os.environ.get(DEPTH_ENV_VAR, 4)))
+    fused = str(kwargs.get("fused", os.environ.get(FUSED_ENV_VAR, "false"))).lower() in ("1", "true")
+
+    branches = []
+    for branch in range(width):
+        nodes = [
+            Node(
+                func=partial(transform, layer=layer),
+                inputs="scale_benchmark_source" if layer == 0 else f"scale_benchmark_branch_{branch}_layer_{layer - 1}",
+                outputs=f"scale_benchmark_branch_{branch}_layer_{layer}",
+                name=f"scale_benchmark_branch_{branch}_layer_{layer}",
+            )
+            for layer in range(depth)
+        ]
+        branches.append(FusedPipeline(nodes, name=f"scale_benchmark_branch_{branch}") if fused else Pipeline(nodes))
+
+    return Pipeline(
+        [
+            Node(
+                func=generate_data,
+                inputs="params:scale_benchmark",
+                outputs="scale_benchmark_source",
+                name="scale_benchmark_generate",
+            ),
+            *branches,
+            Node(
+                func=summarise,
+                inputs=[f"scale_benchmark_branch_{branch}_layer_{depth - 1}" for branch in range(width)],
+                outputs="scale_benchmark_summary",
+                name="scale_benchmark_summarise",
+            ),
+        ]
+    )